@@ -0,0 +1,65 @@
+"""
+Benchmark the Monte Carlo backtest: 10k paths x the three single-strategy allocations over a
+synthetic year of daily strategy metrics, in process and on the process pool.
+
+Usage (from the backend directory):
+    python -m benchmarks.backtest_sweep --paths 10000 --horizon-days 365 --workers 1 4
+"""
+
+import argparse
+import time
+from typing import List
+
+import numpy as np
+
+from src import backtest
+from src.backtest import MetricsHistory, run_backtest, summarize_backtest
+
+# Mean APY and risk-adjusted returns of each strategy, in basis points, mirroring Strategy.sol
+STRATEGY_BASELINES = {1: (720, 180), 2: (1200, 120), 3: (500, 250)}
+
+def synthetic_history(days: int, seed: int = 0) -> MetricsHistory:
+    """Daily snapshots with APYs drifting around the Strategy.sol values and some missed snapshots"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for day in range(days):
+        for strategy_id, (apy, risk_adjusted_returns) in STRATEGY_BASELINES.items():
+            if day and rng.random() < 0.2:
+                continue
+            rows.append({
+                "timestamp": 1_700_000_000 + day * 86400,
+                "strategy": strategy_id,
+                "apy": apy * (1 + 0.1 * np.sin(day / 30) + rng.normal(0, 0.03)),
+                "risk_adjusted_returns": risk_adjusted_returns
+            })
+    return MetricsHistory.from_rows(rows, "synthetic")
+
+def main(paths: int, horizon_days: int, history_days: int, worker_counts: List[int], repeats: int) -> None:
+    history = synthetic_history(history_days)
+    allocations = [[10000, 0, 0], [0, 10000, 0], [0, 0, 10000]]
+    print(f"{paths} paths x {len(allocations)} allocations x {horizon_days} days over {history.periods} recorded periods")
+
+    for workers in worker_counts:
+        # Always use the pool when more than one worker is requested, to measure it
+        backtest.PARALLEL_MIN_WORK = 0 if workers > 1 else float("inf")
+        report = run_backtest(history, allocations, horizon_days, paths, seed=1, workers=workers)
+        if workers > 1:
+            print(f"  workers={workers}: pool start and first run {report.elapsed_ms / 1000:.2f} s")
+        timings = [run_backtest(history, allocations, horizon_days, paths, seed=1, workers=workers).elapsed_ms for _ in range(repeats)]
+        print(f"  workers={workers}: {min(timings) / 1000:.2f} s best of {repeats}, {paths * len(allocations) / min(timings) * 1000:,.0f} paths/s")
+    backtest.shutdown_pool()
+
+    print()
+    print(summarize_backtest(report))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--paths", type=int, default=10000, help="Monte Carlo paths per allocation")
+    parser.add_argument("--horizon-days", type=int, default=365, help="Simulated horizon in days")
+    parser.add_argument("--history-days", type=int, default=365, help="Days of synthetic metrics history")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4], help="Process counts to compare")
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per process count")
+    args = parser.parse_args()
+    started = time.perf_counter()
+    main(args.paths, args.horizon_days, args.history_days, args.workers, args.repeats)
+    print(f"\nTotal {time.perf_counter() - started:.1f} s")
@@ -0,0 +1,70 @@
+"""
+Micro-benchmark of proposal calldata encoding: the original per-call keccak/encode functions
+against the compiled encoder registry in src/utils.py.
+
+Usage (from the backend directory):
+    python -m benchmarks.calldata_encoding --iterations 20000 --actions 1000
+"""
+
+import argparse
+import time
+from typing import Callable, List, Tuple
+
+from eth_abi.abi import encode
+from web3 import Web3
+
+from src import utils
+
+TREASURY = "0x9fE46736679d2D9a65F0992F2272dE9f3c7fa6e0"
+STRATEGY = "0x5FbDB2315678afecb367f032d93F642f64180aa3"
+TOKEN = "0xe7f1725E7734CE288F8367e1Bb143E90bb3F0512"
+
+def legacy_encode_strategy_call(strategy_address: str, token_address: str, amount: int) -> bytes:
+    """Original implementation: hash the signature and look up encoders on every call"""
+    function_selector = Web3.keccak(text="executeStrategy1(address,uint256)")[:4]
+    return function_selector + encode(['address', 'uint256'], [token_address, amount])
+
+def legacy_encode_treasury_execute_call(strategy_address: str, token_address: str, amount: int) -> bytes:
+    """Original implementation of the Treasury.execute() wrapper"""
+    strategy_call_data = legacy_encode_strategy_call(strategy_address, token_address, amount)
+    function_selector = Web3.keccak(text="execute(address,uint256,bytes)")[:4]
+    return function_selector + encode(['address', 'uint256', 'bytes'], [strategy_address, 0, strategy_call_data])
+
+def timed(label: str, iterations: int, fn: Callable[[], object]) -> float:
+    """Run fn `iterations` times and print the cost per run in microseconds"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    per_call = elapsed / iterations * 1e6
+    print(f"{label:<46} {per_call:>12.2f} µs/run")
+    return per_call
+
+def main(iterations: int, actions: int) -> None:
+    # The compiled encoders must produce byte-identical calldata
+    assert utils.encode_treasury_execute_call(STRATEGY, TOKEN, 10**18) == legacy_encode_treasury_execute_call(STRATEGY, TOKEN, 10**18)
+
+    print("Single Treasury.execute(executeStrategy1) call")
+    legacy = timed("  legacy keccak + encode", iterations, lambda: legacy_encode_treasury_execute_call(STRATEGY, TOKEN, 10**18))
+    amounts = iter(range(10**18, 10**18 + iterations))
+    cold = timed("  compiled encoders, distinct amounts", iterations, lambda: utils.encode_treasury_execute_call.__wrapped__(STRATEGY, TOKEN, next(amounts)))
+    warm = timed("  compiled encoders, repeated tuple (memoized)", iterations, lambda: utils.encode_treasury_execute_call(STRATEGY, TOKEN, 10**18))
+    print(f"  speedup: {legacy / cold:.1f}x uncached, {legacy / warm:.1f}x memoized")
+
+    # A realistic batch: a handful of distinct allocations repeated across many proposals
+    batch: List[Tuple[int, str, int]] = [(i % 3 + 1, TOKEN, (i % 10 + 1) * 10**17) for i in range(actions)]
+    rounds = max(iterations // actions, 1)
+    print(f"\nBulk encoding of {actions} proposal actions")
+    legacy = timed("  legacy, one call per action", rounds, lambda: [legacy_encode_treasury_execute_call(STRATEGY, token, amount) for _, token, amount in batch])
+    bulk = timed("  encode_proposal_actions", rounds, lambda: utils.encode_proposal_actions(TREASURY, STRATEGY, batch))
+    print(f"  speedup: {legacy / bulk:.1f}x")
+
+    print("\ncreate_proposal_parameters")
+    timed("  compiled encoders", iterations, lambda: utils.create_proposal_parameters(TREASURY, STRATEGY, TOKEN))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iterations", type=int, default=20000, help="Calls per single-call measurement")
+    parser.add_argument("--actions", type=int, default=1000, help="Actions per bulk encoding")
+    args = parser.parse_args()
+    main(args.iterations, args.actions)
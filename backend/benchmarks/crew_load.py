@@ -0,0 +1,172 @@
+"""
+End-to-end latency benchmark of the crew pipeline with no OpenAI or testnet: drives /propose,
+/execute and /status at a configurable concurrency against an offline LLM stand-in and a local
+chain, and reports p50/p95/p99 latency and RPC calls per endpoint.
+
+/propose and /execute are timed from submission until their job completes or fails.
+
+Backends:
+    evm   eth-tester chain with the Foundry-compiled contracts deployed (see benchmarks.local_chain)
+    stub  benchmarks.stub_rpc canned answers; no contract logic, but no extra dependencies
+
+Every /propose gets its own description, so proposals with the same actions still get distinct IDs
+on the EVM backend, and each /execute executes the proposal of one of them.
+
+Usage (from the backend directory):
+    python -m benchmarks.crew_load --backend evm --concurrency 4 --requests 20 --llm-latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+from eth_account import Account
+
+ENDPOINTS = ["propose", "execute", "status"]
+
+# Seconds between job polls
+POLL_INTERVAL = 0.05
+
+def configure(env: Dict[str, str], llm_latency: float, llm_cache: bool) -> None:
+    """Point the API at the local backend and the offline LLM; must run before src.api is imported"""
+    workdir = tempfile.mkdtemp(prefix="crew_load_")
+    os.environ.update(env)
+    os.environ.update({
+        "LLM_FACTORY": "benchmarks.fake_llm:fake_llm",
+        "FAKE_LLM_LATENCY": str(llm_latency),
+        "LLM_CACHE_ENABLED": "true" if llm_cache else "false",
+        "LLM_CACHE_PATH": os.path.join(workdir, "llm_cache.sqlite"),
+        "JOB_DB_PATH": os.path.join(workdir, "jobs.sqlite"),
+        "INDEX_DB_PATH": os.path.join(workdir, "index.sqlite"),
+        # Background indexers would add RPC traffic unrelated to the requests being measured
+        "INDEXER_ENABLED": "false"
+    })
+
+def start_backend(backend: str, rpc_latency: float) -> Tuple[Any, Dict[str, str], Optional[Any]]:
+    """Start the chain backend, returning it, the API environment and the EVM chain if any"""
+    if backend == "evm":
+        from .local_chain import LocalChain
+        chain = LocalChain(latency=rpc_latency)
+        chain.deploy()
+        chain.start()
+        return chain, chain.env(), chain
+
+    from .stub_rpc import StubRPC
+    stub = StubRPC(latency=rpc_latency).start()
+    return stub, {"SEPOLIA_RPC_URL": stub.url, "PRIVATE_KEY": Account.create().key.hex()}, None
+
+def percentile(samples: List[float], pct: int) -> float:
+    """Inclusive percentile of the samples"""
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[pct - 1]
+
+async def wait_for_job(client: httpx.AsyncClient, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Poll a job until it completes or fails"""
+    while job["status"] not in ("completed", "failed"):
+        await asyncio.sleep(POLL_INTERVAL)
+        response = await client.get(f"/jobs/{job['job_id']}")
+        response.raise_for_status()
+        job = response.json()
+    return job
+
+async def timed_request(client: httpx.AsyncClient, endpoint: str, params: Dict[str, Any]) -> Tuple[float, bool, Dict[str, Any]]:
+    """Latency in seconds, success and result of one request"""
+    started = time.perf_counter()
+    if endpoint == "status":
+        response = await client.get("/status", params=params)
+        return time.perf_counter() - started, response.status_code == 200, {}
+
+    response = await client.post(f"/{endpoint}", params=params)
+    if response.status_code >= 400:
+        return time.perf_counter() - started, False, {}
+    job = await wait_for_job(client, response.json())
+    result = job.get("result") or {}
+    return time.perf_counter() - started, job["status"] == "completed" and bool(result.get("tx_hash")), result
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    params: List[Dict[str, Any]],
+    concurrency: int
+) -> Tuple[List[float], int, List[Dict[str, Any]]]:
+    """Send one request per params with at most `concurrency` in flight"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(request_params: Dict[str, Any]) -> Tuple[float, bool, Dict[str, Any]]:
+        async with semaphore:
+            return await timed_request(client, endpoint, request_params)
+
+    outcomes = await asyncio.gather(*[bounded(request_params) for request_params in params])
+    return [latency for latency, _, _ in outcomes], sum(ok for _, ok, _ in outcomes), [result for _, _, result in outcomes]
+
+def report(endpoint: str, latencies: List[float], ok: int, rpc_calls: Counter, wall: float) -> None:
+    total_rpc = sum(rpc_calls.values())
+    print(
+        f"{endpoint:>8} {len(latencies):>5} {ok:>4} "
+        f"{percentile(latencies, 50) * 1000:>9.0f} {percentile(latencies, 95) * 1000:>9.0f} {percentile(latencies, 99) * 1000:>9.0f} "
+        f"{len(latencies) / wall:>7.2f} {total_rpc:>6} {total_rpc / len(latencies):>7.1f}"
+    )
+    print(f"{'':>8} rpc: " + ", ".join(f"{method} {count}" for method, count in rpc_calls.most_common()))
+
+async def main(args: argparse.Namespace) -> None:
+    backend, env, evm_chain = start_backend(args.backend, args.rpc_latency)
+    configure(env, args.llm_latency, args.llm_cache)
+
+    from src.api import app
+    from .fake_llm import fake_llm
+
+    print(f"{args.backend} backend at {env.get('SEPOLIA_RPC_URL')}, {args.rpc_latency * 1000:.0f} ms RPC latency, "
+          f"{args.llm_latency * 1000:.0f} ms per LLM call, LLM cache {'on' if args.llm_cache else 'off'}")
+    print(f"{'endpoint':>8} {'reqs':>5} {'ok':>4} {'p50 (ms)':>9} {'p95 (ms)':>9} {'p99 (ms)':>9} {'req/s':>7} {'rpc':>6} {'rpc/req':>7}")
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        proposals: List[Dict[str, Any]] = []
+        for endpoint in args.endpoints:
+            params: List[Dict[str, Any]] = [{"chain": "ethereum"} for _ in range(args.requests)]
+            if endpoint == "propose":
+                # A Governor proposal ID hashes the actions and the description, so each one is unique
+                for index, request_params in enumerate(params):
+                    request_params["description"] = f"crew_load proposal {index + 1}"
+            if endpoint == "execute":
+                if evm_chain is not None:
+                    evm_chain.pass_proposals()
+                # Each request executes one submitted proposal, reusing them if fewer were submitted
+                for index, request_params in enumerate(params):
+                    if proposals:
+                        request_params.update(proposals[index % len(proposals)])
+
+            calls_before = Counter(backend.calls)
+            llm_calls_before = fake_llm().stats()["calls"]
+            started = time.perf_counter()
+            latencies, ok, results = await run_phase(client, endpoint, params, args.concurrency)
+            wall = time.perf_counter() - started
+
+            report(endpoint, latencies, ok, Counter(backend.calls) - calls_before, wall)
+            if endpoint != "status":
+                print(f"{'':>8} llm calls: {fake_llm().stats()['calls'] - llm_calls_before}")
+            if endpoint == "propose":
+                proposals = [
+                    {"allocation": result["allocation"], "description": result["description"]}
+                    for result in results if result.get("allocation") and result.get("tx_hash")
+                ]
+
+    backend.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=["evm", "stub"], default="evm", help="Local chain to run against")
+    parser.add_argument("--endpoints", nargs="+", choices=ENDPOINTS, default=ENDPOINTS, help="Endpoints to drive, in order")
+    parser.add_argument("--concurrency", type=int, default=4, help="Requests in flight at once")
+    parser.add_argument("--requests", type=int, default=20, help="Requests per endpoint")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Simulated seconds per LLM call")
+    parser.add_argument("--rpc-latency", type=float, default=0.0, help="Simulated seconds per RPC round trip")
+    parser.add_argument("--llm-cache", action="store_true", help="Keep the persistent LLM cache on")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,54 @@
+"""
+Benchmark per-request crew setup: constructing ProposalCrew and ExecutionCrew and their agents, with
+the LLM client rebuilt for every request (as before the crew factory) and shared across requests.
+
+No LLM or RPC calls are made; a placeholder API key is used if none is set.
+
+Usage (from the backend directory):
+    python -m benchmarks.crew_setup --requests 50
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Callable, List
+
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+os.environ.setdefault("LLM_CACHE_PATH", os.path.join(tempfile.gettempdir(), "crew_setup_llm_cache.sqlite"))
+
+from src.crew import ExecutionCrew, ProposalCrew
+from src.crew_factory import crew_factory
+from src.utils import single_strategy_allocation
+
+def build_crews() -> None:
+    """Everything one proposal request and one execution request build before calling the LLM"""
+    ProposalCrew(treasury_service=None, strategy_service=None)._create_agents()
+    ExecutionCrew(allocation=single_strategy_allocation(1))._create_execution_agent()
+
+def time_requests(requests: int, before_each: Callable[[], None]) -> List[float]:
+    """Setup time of each request in milliseconds"""
+    timings = []
+    for _ in range(requests):
+        before_each()
+        started = time.perf_counter()
+        build_crews()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def report(label: str, timings: List[float]) -> None:
+    print(f"  {label}: median {statistics.median(timings):.2f} ms, max {max(timings):.2f} ms")
+
+def main(requests: int) -> None:
+    # Warm up imports and the LLM cache database
+    build_crews()
+    print(f"Crew setup per proposal + execution request, {requests} requests")
+    report("client per request", time_requests(requests, crew_factory.reset))
+    report("shared client", time_requests(requests, lambda: None))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=50, help="Requests to time per mode")
+    args = parser.parse_args()
+    main(args.requests)
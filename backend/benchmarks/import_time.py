@@ -0,0 +1,82 @@
+"""
+Benchmark cold import of the API and the crew modules with `python -X importtime`: wall time, peak
+RSS and the slowest top-level packages of each, in fresh interpreters.
+
+With --check it exits non-zero if importing the API loads the AI stack, which should only load
+with the first crew job (or in the background with CREW_PRELOAD=true).
+
+Usage (from the backend directory):
+    python -m benchmarks.import_time --runs 5
+    python -m benchmarks.import_time --check
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import Counter
+from typing import Any, Dict, List
+
+# Modules timed, from the API a /status-only worker needs to the full crew
+TARGETS = ["src.api", "src.crew"]
+
+# Top-level packages of the AI stack that importing the API must not load
+AI_PACKAGES = {"crewai", "crewai_tools", "langchain", "langchain_core", "langchain_openai", "openai", "litellm", "chromadb"}
+
+BACKEND_DIR = os.path.join(os.path.dirname(__file__), "..")
+
+# Run in the child after the import: peak RSS in KiB and the top-level packages loaded
+PROBE = "import resource, sys, json; print(json.dumps({'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, 'packages': sorted({name.split('.')[0] for name in sys.modules})}))"
+
+def import_once(module: str) -> Dict[str, Any]:
+    """Import a module in a fresh interpreter, returning its import time, RSS, loaded packages and per-package self time"""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}; {PROBE}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    # Lines look like "import time:  self [us] | cumulative | imported package", indented by depth
+    self_us: Counter = Counter()
+    total_us = 0
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_part, cumulative, name = line[len("import time:"):].split("|")
+        self_us[name.strip().split(".")[0]] += int(self_part)
+        if name.strip() == module:
+            total_us = int(cumulative)
+    probe = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {"seconds": total_us / 1e6, "rss_mb": probe["rss_kb"] / 1024, "packages": set(probe["packages"]), "self_us": self_us}
+
+def report(module: str, runs: List[Dict[str, Any]], top: int) -> None:
+    seconds = statistics.median(run["seconds"] for run in runs)
+    rss_mb = statistics.median(run["rss_mb"] for run in runs)
+    ai_loaded = sorted(runs[0]["packages"] & AI_PACKAGES)
+    print(f"{module}: median {seconds * 1000:.0f} ms, peak RSS {rss_mb:.0f} MB over {len(runs)} runs")
+    print(f"  AI stack loaded: {', '.join(ai_loaded) or 'none'}")
+    slowest = sum((run["self_us"] for run in runs), Counter())
+    for package, total in slowest.most_common(top):
+        print(f"  {package:<24} {total / len(runs) / 1000:>8.1f} ms")
+
+def main(runs: int, top: int, check: bool) -> int:
+    results = {module: [import_once(module) for _ in range(runs)] for module in TARGETS}
+    for module in TARGETS:
+        report(module, results[module], top)
+
+    leaked = results["src.api"][0]["packages"] & AI_PACKAGES
+    if check and leaked:
+        print(f"❌ Importing src.api loads the AI stack: {', '.join(sorted(leaked))}")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=3, help="Fresh interpreters per module")
+    parser.add_argument("--top", type=int, default=8, help="Slowest top-level packages to list")
+    parser.add_argument("--check", action="store_true", help="Fail if importing the API loads the AI stack")
+    args = parser.parse_args()
+    sys.exit(main(args.runs, args.top, args.check))
@@ -0,0 +1,217 @@
+"""
+In-process EVM (eth-tester on py-evm) behind a local JSON-RPC endpoint, with the Foundry-compiled
+DAOToken, Governance, Treasury, Strategy and ETHToken contracts deployed and funded.
+
+Requires eth-tester with the py-evm backend and the contract artifacts:
+    pip install "eth-tester[py-evm]"
+    (cd ../contracts && forge build)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+from eth_account import Account
+from eth_tester import EthereumTester
+from web3 import Web3
+from web3.providers.eth_tester import EthereumTesterProvider
+
+# Foundry build output of the contracts package
+ARTIFACTS_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "contracts", "out")
+
+# Governance settings of DeployGovernanceSystem.s.sol
+VOTING_DELAY = 0
+VOTING_PERIOD = 180
+QUORUM_NUMERATOR = 20
+
+# Funding of the deployment
+AGENT_ETHER = 100 * 10**18
+AGENT_VOTES = 1000 * 10**18
+TREASURY_ETHER = 5 * 10**18
+TREASURY_TOKENS = 1000 * 10**18
+
+# Governor.state() values
+PROPOSAL_ACTIVE = 1
+PROPOSAL_SUCCEEDED = 4
+VOTE_FOR = 1
+
+def load_artifact(name: str, artifacts_dir: str = ARTIFACTS_DIR) -> Dict[str, Any]:
+    """ABI and creation bytecode of a contract from the Foundry output"""
+    path = os.path.join(artifacts_dir, f"{name}.sol", f"{name}.json")
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Missing artifact {path}; run `forge build` in the contracts directory")
+    with open(path) as artifact:
+        data = json.load(artifact)
+    return {"abi": data["abi"], "bytecode": data["bytecode"]["object"]}
+
+def _camel(key: str) -> str:
+    return re.sub(r"_([a-z])", lambda match: match.group(1).upper(), key)
+
+def to_wire(value: Any) -> Any:
+    """Web3-formatted result as JSON-RPC wire data: hex quantities and bytes, camelCase keys"""
+    if isinstance(value, bool) or value is None or isinstance(value, str):
+        return value
+    if isinstance(value, int):
+        return hex(value)
+    if isinstance(value, (bytes, bytearray)):
+        return "0x" + bytes(value).hex()
+    if hasattr(value, "items"):
+        return {_camel(key): to_wire(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_wire(item) for item in value]
+    return value
+
+class LocalChain:
+    """eth-tester chain served over HTTP JSON-RPC, counting calls per method like StubRPC"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0, agent_key: Optional[str] = None):
+        self.latency = latency
+        self.tester = EthereumTester()
+        # Requests arrive on server threads; web3's eth-tester middleware formats them as a client would
+        self.w3 = Web3(EthereumTesterProvider(self.tester))
+        self._request = self.w3.provider.request_func(self.w3, self.w3.middleware_onion)
+        self._lock = threading.Lock()
+        self.calls: Counter = Counter()
+        self.agent = Account.from_key(agent_key) if agent_key else Account.create()
+        self.deployer = self.w3.eth.accounts[0]
+        self.contracts: Dict[str, Any] = {}
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """HTTP URL of the running server"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a single JSON-RPC request from the chain"""
+        method = request["method"]
+        reply: Dict[str, Any] = {"jsonrpc": "2.0", "id": request.get("id")}
+        with self._lock:
+            self.calls[method] += 1
+            try:
+                response = self._request(method, request.get("params") or [])
+            except Exception as e:
+                # Reverts and unsupported methods surface as JSON-RPC errors, as a node would send them
+                reply["error"] = {"code": -32000, "message": str(e)}
+                return reply
+        if "error" in response:
+            reply["error"] = response["error"]
+        else:
+            reply["result"] = to_wire(response.get("result"))
+        return reply
+
+    def _handler_class(self):
+        chain = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                if chain.latency:
+                    time.sleep(chain.latency)
+                reply = [chain.handle(request) for request in body] if isinstance(body, list) else chain.handle(body)
+                data = json.dumps(reply).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def _transact(self, contract_function: Any, sender: Optional[str] = None) -> Any:
+        """Send a transaction from an unlocked test account and return its receipt"""
+        tx_hash = contract_function.transact({"from": sender or self.deployer})
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
+
+    def _transact_as_agent(self, contract_function: Any) -> Any:
+        """Sign and send a transaction from the agent account"""
+        tx = contract_function.build_transaction({
+            "from": self.agent.address,
+            "nonce": self.w3.eth.get_transaction_count(self.agent.address)
+        })
+        tx_hash = self.w3.eth.send_raw_transaction(self.agent.sign_transaction(tx).raw_transaction)
+        return self.w3.eth.wait_for_transaction_receipt(tx_hash)
+
+    def _deploy(self, name: str, *args: Any, artifacts_dir: str = ARTIFACTS_DIR) -> Any:
+        artifact = load_artifact(name, artifacts_dir)
+        factory = self.w3.eth.contract(abi=artifact["abi"], bytecode=artifact["bytecode"])
+        receipt = self._transact(factory.constructor(*args))
+        contract = self.w3.eth.contract(address=receipt.contractAddress, abi=artifact["abi"])
+        self.contracts[name] = contract
+        return contract
+
+    def deploy(self, artifacts_dir: str = ARTIFACTS_DIR) -> Dict[str, str]:
+        """Deploy and fund the DAO the way the deployment scripts do, returning contract addresses"""
+        # The agent pays gas for proposals and executions, and holds the votes that pass them
+        self.w3.eth.send_transaction({"from": self.deployer, "to": self.agent.address, "value": AGENT_ETHER})
+
+        token = self._deploy("DAOToken", "DAO Token", "DAO", [], artifacts_dir=artifacts_dir)
+        self._transact(token.functions.mint(self.agent.address, AGENT_VOTES))
+        self._transact_as_agent(token.functions.delegate(self.agent.address))
+
+        governance = self._deploy("Governance", "DAO Governance", token.address, VOTING_DELAY, VOTING_PERIOD, 0, QUORUM_NUMERATOR, artifacts_dir=artifacts_dir)
+        treasury = self._deploy("Treasury", governance.address, artifacts_dir=artifacts_dir)
+        strategy = self._deploy("Strategy", artifacts_dir=artifacts_dir)
+        eth_token = self._deploy("ETHToken", self.deployer, artifacts_dir=artifacts_dir)
+
+        self._transact(eth_token.functions.mint(treasury.address, TREASURY_TOKENS))
+        self.w3.eth.send_transaction({"from": self.deployer, "to": treasury.address, "value": TREASURY_ETHER})
+        # Voting power is checkpointed by timestamp, so later proposals must start after the delegation
+        self.tester.mine_blocks()
+
+        return {
+            "treasury": treasury.address,
+            "strategy": strategy.address,
+            "governance": governance.address,
+            "eth_token": eth_token.address
+        }
+
+    def env(self, chain: str = "ethereum") -> Dict[str, str]:
+        """Environment pointing the API's chain at this node and the deployed contracts"""
+        prefix = chain.upper()
+        rpc_var = "SEPOLIA_RPC_URL" if chain == "ethereum" else f"{prefix}_RPC_URL"
+        return {
+            rpc_var: self.url,
+            "PRIVATE_KEY": self.agent.key.hex(),
+            f"{prefix}_TREASURY_ADDRESS": self.contracts["Treasury"].address,
+            f"{prefix}_STRATEGY_ADDRESS": self.contracts["Strategy"].address,
+            f"{prefix}_GOVERNANCE_ADDRESS": self.contracts["Governance"].address,
+            f"{prefix}_ETH_TOKEN_ADDRESS": self.contracts["ETHToken"].address
+        }
+
+    def pass_proposals(self) -> List[int]:
+        """Vote for every active proposal with the agent's tokens and end the voting period; returns the passed IDs"""
+        governance = self.contracts["Governance"]
+        with self._lock:
+            proposal_ids = [
+                governance.functions.proposalDetailsAt(index).call()[0]
+                for index in range(governance.functions.proposalCount().call())
+            ]
+            active = [proposal_id for proposal_id in proposal_ids if governance.functions.state(proposal_id).call() == PROPOSAL_ACTIVE]
+            for proposal_id in active:
+                self._transact_as_agent(governance.functions.castVote(proposal_id, VOTE_FOR))
+            self.tester.time_travel(self.w3.eth.get_block("latest").timestamp + VOTING_PERIOD + 1)
+            self.tester.mine_blocks()
+            return [proposal_id for proposal_id in active if governance.functions.state(proposal_id).call() == PROPOSAL_SUCCEEDED]
+
+    def start(self) -> "LocalChain":
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down"""
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,91 @@
+"""
+Benchmark a dashboard polling every chain: one /status request per chain versus a single /status/all,
+against one local stub RPC per chain, one of which answers slower than the per-chain timeout.
+
+Reports poll latency and the RPC calls each mode makes while polling.
+
+Usage (from the backend directory):
+    python -m benchmarks.status_all --latency 0.05 --slow-latency 2 --chain-timeout 1 --polls 20
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections import Counter
+from typing import Dict, List
+
+import httpx
+
+from .stub_rpc import StubRPC
+
+# RPC URL variable of each chain in CHAIN_CONFIGS
+RPC_VARS = {"ethereum": "SEPOLIA_RPC_URL", "zircuit": "ZIRCUIT_RPC_URL", "flow": "FLOW_RPC_URL", "mantle": "MANTLE_RPC_URL"}
+
+def rpc_calls(stubs: Dict[str, StubRPC]) -> int:
+    return sum(sum(Counter(stub.calls).values()) for stub in stubs.values())
+
+async def poll_per_chain(client: httpx.AsyncClient) -> Dict[str, str]:
+    """One /status request per chain, all at once, as a dashboard without /status/all would"""
+    responses = await asyncio.gather(*[client.get("/status", params={"chain": chain}) for chain in RPC_VARS])
+    return {chain: "ok" if response.status_code == 200 else str(response.status_code) for chain, response in zip(RPC_VARS, responses)}
+
+async def poll_all(client: httpx.AsyncClient) -> Dict[str, str]:
+    """A single /status/all request"""
+    response = await client.get("/status/all")
+    response.raise_for_status()
+    return {chain: entry["status"] for chain, entry in response.json()["chains"].items()}
+
+async def run_mode(client: httpx.AsyncClient, stubs: Dict[str, StubRPC], poll, polls: int, interval: float) -> None:
+    latencies: List[float] = []
+    calls_before = rpc_calls(stubs)
+    outcome: Dict[str, str] = {}
+    for _ in range(polls):
+        started = time.perf_counter()
+        outcome = await poll(client)
+        latencies.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    calls = rpc_calls(stubs) - calls_before
+    print(
+        f"{poll.__name__:>14} {statistics.median(latencies):>9.1f} {max(latencies):>9.1f} {calls:>6} "
+        f"{calls / polls:>8.1f}  " + ", ".join(f"{chain} {status}" for chain, status in outcome.items())
+    )
+
+async def main(args: argparse.Namespace) -> None:
+    slow_chain = list(RPC_VARS)[-1]
+    stubs = {
+        chain: StubRPC(latency=args.slow_latency if chain == slow_chain else args.latency).start()
+        for chain in RPC_VARS
+    }
+    for chain, stub in stubs.items():
+        os.environ[RPC_VARS[chain]] = stub.url
+    os.environ.update({
+        "STATUS_CHAIN_TIMEOUT": str(args.chain_timeout),
+        "STATUS_REFRESH_INTERVAL": str(args.refresh_interval),
+        "INDEXER_ENABLED": "false"
+    })
+
+    from src.api import app
+
+    print(f"Stub RPCs with {args.latency * 1000:.0f} ms latency, {slow_chain} {args.slow_latency * 1000:.0f} ms; "
+          f"{args.chain_timeout:g}s chain timeout, snapshot refreshed every {args.refresh_interval:g}s")
+    print(f"{'mode':>14} {'p50 (ms)':>9} {'max (ms)':>9} {'rpc':>6} {'rpc/poll':>8}  last poll")
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=None) as client:
+        await run_mode(client, stubs, poll_per_chain, args.polls, args.poll_interval)
+        await run_mode(client, stubs, poll_all, args.polls, args.poll_interval)
+
+    for stub in stubs.values():
+        stub.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated RPC round-trip latency in seconds")
+    parser.add_argument("--slow-latency", type=float, default=2.0, help="Round-trip latency of the slow chain")
+    parser.add_argument("--chain-timeout", type=float, default=1.0, help="Per-chain timeout of the snapshot refresh")
+    parser.add_argument("--refresh-interval", type=float, default=2.0, help="Seconds between snapshot refreshes")
+    parser.add_argument("--polls", type=int, default=20, help="Dashboard polls per mode")
+    parser.add_argument("--poll-interval", type=float, default=0.25, help="Seconds between dashboard polls")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,56 @@
+"""
+Benchmark /status throughput with N concurrent in-flight requests against a local stub RPC.
+
+Usage (from the backend directory):
+    python -m benchmarks.status_concurrency --latency 0.05 --concurrency 1 5 10 25 50
+"""
+
+import argparse
+import asyncio
+import os
+import time
+from typing import List
+
+import httpx
+
+from .stub_rpc import StubRPC
+
+async def run_level(app, concurrency: int, rounds: int) -> float:
+    """Fire `rounds` waves of `concurrency` simultaneous /status requests, return total seconds"""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        start = time.perf_counter()
+        for _ in range(rounds):
+            responses = await asyncio.gather(*[
+                client.get("/status", params={"chain": "ethereum"}) for _ in range(concurrency)
+            ])
+            for response in responses:
+                response.raise_for_status()
+        return time.perf_counter() - start
+
+async def main(latency: float, levels: List[int], rounds: int) -> None:
+    stub = StubRPC(latency=latency).start()
+    os.environ["SEPOLIA_RPC_URL"] = stub.url
+
+    from src.api import app
+
+    print(f"Stub RPC at {stub.url} with {latency * 1000:.0f} ms latency per round trip")
+    print(f"{'in-flight':>10} {'requests':>10} {'total (s)':>10} {'req/s':>10} {'ms/req':>10}")
+
+    async with app.router.lifespan_context(app):
+        # Warm up provider sessions and the Multicall3 support probe
+        await run_level(app, 1, 1)
+        for concurrency in levels:
+            elapsed = await run_level(app, concurrency, rounds)
+            total = concurrency * rounds
+            print(f"{concurrency:>10} {total:>10} {elapsed:>10.3f} {total / elapsed:>10.1f} {elapsed / rounds * 1000:>10.1f}")
+
+    stub.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated RPC round-trip latency in seconds")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 5, 10, 25, 50], help="In-flight request levels")
+    parser.add_argument("--rounds", type=int, default=5, help="Waves of requests per level")
+    args = parser.parse_args()
+    asyncio.run(main(args.latency, args.concurrency, args.rounds))
@@ -0,0 +1,226 @@
+"""
+Local stub JSON-RPC server for benchmarking the API without a live testnet.
+"""
+
+import json
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional
+import rlp
+from eth_abi import encode
+from eth_account import Account
+from eth_utils import big_endian_to_int, function_signature_to_4byte_selector, keccak
+
+def _selector(signature: str) -> str:
+    """Hex 4-byte selector for a function signature"""
+    return function_signature_to_4byte_selector(signature).hex()
+
+METRICS_TYPES = ["uint256", "uint256", "uint256", "uint256", "uint256", "string"]
+
+# Canned eth_call results keyed by function selector, mirroring Strategy.sol
+CALL_RESULTS = {
+    _selector("getStrategy1Metrics()"): encode(METRICS_TYPES, [720, 450000 * 10**18, 8500, 180, 8500, "Aave-like lending protocol strategy"]),
+    _selector("getStrategy2Metrics()"): encode(METRICS_TYPES, [540, 320000 * 10**18, 7800, 150, 9000, "Compound-like lending protocol strategy"]),
+    _selector("getStrategy3Metrics()"): encode(METRICS_TYPES, [380, 900000 * 10**18, 6500, 210, 9500, "Lido-like staking strategy"]),
+    _selector("getEtherBalance()"): encode(["uint256"], [5 * 10**18]),
+    _selector("getTokenBalance(address)"): encode(["uint256"], [1000 * 10**18]),
+    _selector("symbol()"): encode(["string"], ["ETH"]),
+    _selector("quorum(uint256)"): encode(["uint256"], [200 * 10**18]),
+}
+
+def _decode_sender_and_nonce(raw: str) -> tuple[str, int]:
+    """Recover the sender and nonce of a signed legacy or typed transaction"""
+    data = bytes.fromhex(raw[2:])
+    # Typed transactions carry the chain ID before the nonce
+    nonce = rlp.decode(data[1:])[1] if data[0] < 0x7f else rlp.decode(data)[0]
+    return Account.recover_transaction(data).lower(), big_endian_to_int(nonce)
+
+class StubRPC:
+    """Threaded JSON-RPC server answering the calls the backend makes, with fixed latency"""
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.05,
+        chain_id: int = 11155111,
+        eip1559: bool = True,
+        block_time: float = 0,
+        max_log_range: int = 5000
+    ):
+        self.latency = latency
+        self.chain_id = chain_id
+        self.eip1559 = eip1559
+        # With a block time, the head advances on its own and transactions are mined in the next block
+        self.block_time = block_time
+        self.genesis_block = 1_000_000
+        # Raw logs served by eth_getLogs, and the widest block range a single request may span
+        self.logs: list[Dict[str, Any]] = []
+        self.max_log_range = max_log_range
+        # First block of each simulated reorg; blocks from there on get new hashes
+        self.reorgs: list[int] = []
+        self._started_at = time.monotonic()
+        self.calls: Counter = Counter()
+        self.nonces: Counter = Counter()
+        self.sent_transactions: list[str] = []
+        # Transaction hash -> block it was submitted in
+        self.submitted_at_block: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def block_number(self) -> int:
+        """Current head block"""
+        if not self.block_time:
+            return self.genesis_block
+        return self.genesis_block + int((time.monotonic() - self._started_at) / self.block_time)
+
+    def block_hash(self, number: int) -> str:
+        """Hash of a block on the current fork"""
+        fork = sum(1 for reorg_from in self.reorgs if reorg_from <= number)
+        return "0x" + keccak(text=f"{self.chain_id}:{fork}:{number}").hex()
+
+    def reorg(self, from_block: int) -> None:
+        """Replace every block from the given one with a new fork; callers swap self.logs to match"""
+        self.reorgs.append(from_block)
+
+    @property
+    def url(self) -> str:
+        """HTTP URL of the running server"""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _handler_class(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                # One simulated network round trip per HTTP request, batched or not
+                time.sleep(stub.latency)
+                if isinstance(body, list):
+                    reply = [stub.handle(request) for request in body]
+                else:
+                    reply = stub.handle(body)
+                data = json.dumps(reply).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a single JSON-RPC request"""
+        method = request["method"]
+        with self._lock:
+            self.calls[method] += 1
+
+        if method == "eth_chainId":
+            result: Any = hex(self.chain_id)
+        elif method == "net_version":
+            result = str(self.chain_id)
+        elif method == "web3_clientVersion":
+            result = "stub-rpc/1.0"
+        elif method == "eth_blockNumber":
+            result = hex(self.block_number)
+        elif method == "eth_getBlockByNumber":
+            tag = request["params"][0]
+            number = self.block_number if tag in ("latest", "pending", "safe", "finalized") else int(tag, 16)
+            result = None if number > self.block_number else {
+                "number": hex(number),
+                "hash": self.block_hash(number),
+                "parentHash": self.block_hash(number - 1),
+                "timestamp": hex(number * 12)
+            }
+        elif method == "eth_getCode":
+            # No Multicall3 deployed, so reads use the batch fallback
+            result = "0x"
+        elif method == "eth_getBalance":
+            result = hex(100 * 10**18)
+        elif method == "eth_gasPrice":
+            result = hex(2 * 10**9)
+        elif method == "eth_estimateGas":
+            result = hex(180000)
+        elif method == "eth_feeHistory":
+            if not self.eip1559:
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": f"Method {method} not found"}}
+            block_count = int(request["params"][0], 16) if isinstance(request["params"][0], str) else request["params"][0]
+            result = {
+                "oldestBlock": hex(self.block_number - block_count + 1),
+                "baseFeePerGas": [hex(10**9)] * (block_count + 1),
+                "gasUsedRatio": [0.5] * block_count,
+                "reward": [[hex(2 * 10**8)] for _ in range(block_count)]
+            }
+        elif method == "eth_getTransactionCount":
+            with self._lock:
+                result = hex(self.nonces[request["params"][0].lower()])
+        elif method == "eth_sendRawTransaction":
+            raw = request["params"][0]
+            sender, nonce = _decode_sender_and_nonce(raw)
+            with self._lock:
+                # Behave like a node mempool: reject reused nonces, accept the next one
+                if nonce < self.nonces[sender]:
+                    return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "nonce too low"}}
+                self.nonces[sender] = max(self.nonces[sender], nonce + 1)
+                self.sent_transactions.append(raw)
+                result = "0x" + keccak(hexstr=raw).hex()
+                self.submitted_at_block[result] = self.block_number
+        elif method == "eth_getTransactionReceipt":
+            tx_hash = request["params"][0].lower()
+            submitted = self.submitted_at_block.get(tx_hash)
+            mined_in = None if submitted is None else submitted + (1 if self.block_time else 0)
+            if mined_in is None or mined_in > self.block_number:
+                result = None
+            else:
+                result = {
+                    "transactionHash": tx_hash,
+                    "blockNumber": hex(mined_in),
+                    "status": "0x1",
+                    "gasUsed": hex(150000),
+                    "effectiveGasPrice": hex(10**9)
+                }
+        elif method == "eth_getLogs":
+            criteria = request["params"][0]
+            from_block, to_block = int(criteria["fromBlock"], 16), int(criteria["toBlock"], 16)
+            if to_block - from_block + 1 > self.max_log_range:
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32005, "message": f"block range too large, max {self.max_log_range}"}}
+            addresses = criteria["address"] if isinstance(criteria["address"], list) else [criteria["address"]]
+            addresses = {address.lower() for address in addresses}
+            topics = (criteria.get("topics") or [None])[0]
+            if isinstance(topics, str):
+                topics = [topics]
+            result = [
+                {**log, "blockHash": self.block_hash(int(log["blockNumber"], 16))} for log in self.logs
+                if from_block <= int(log["blockNumber"], 16) <= to_block
+                and log["address"].lower() in addresses
+                and (topics is None or log["topics"][0] in topics)
+            ]
+        elif method == "eth_call":
+            selector = request["params"][0]["data"][2:10]
+            if selector not in CALL_RESULTS:
+                return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "execution reverted"}}
+            result = "0x" + CALL_RESULTS[selector].hex()
+        else:
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32601, "message": f"Method {method} not found"}}
+
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def start(self) -> "StubRPC":
+        """Serve requests in a background thread"""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down"""
+        self._server.shutdown()
+        self._server.server_close()
@@ -14,6 +14,54 @@ TREASURY_ABI = [
         "name": "getEtherBalance",
         "outputs": [{"name": "", "type": "uint256"}],
         "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getGovernance",
+        "outputs": [{"name": "", "type": "address"}],
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "depositEther",
+        "outputs": [],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "token", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "name": "depositToken",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "recipient", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "name": "withdrawEther",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "token", "type": "address"}, {"name": "recipient", "type": "address"}, {"name": "amount", "type": "uint256"}],
+        "name": "withdrawToken",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "token", "type": "address"}, {"name": "recipient", "type": "address"}],
+        "name": "emergencyWithdraw",
+        "outputs": [],
+        "stateMutability": "nonpayable",
+        "type": "function"
+    },
+    {
+        "inputs": [{"name": "target", "type": "address"}, {"name": "value", "type": "uint256"}, {"name": "data", "type": "bytes"}],
+        "name": "execute",
+        "outputs": [{"name": "success", "type": "bool"}, {"name": "returnData", "type": "bytes"}],
+        "stateMutability": "nonpayable",
+        "type": "function"
     }
 ]
 
@@ -2049,4 +2097,40 @@ ETHToken_ABI = [
         "outputs": [{"name": "", "type": "string"}],
         "type": "function"
     }
-] 
\ No newline at end of file
+]
+
+MULTICALL3_ABI = [
+    {
+        "inputs": [
+            {
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"}
+                ],
+                "name": "calls",
+                "type": "tuple[]"
+            }
+        ],
+        "name": "aggregate3",
+        "outputs": [
+            {
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ],
+                "name": "returnData",
+                "type": "tuple[]"
+            }
+        ],
+        "stateMutability": "payable",
+        "type": "function"
+    },
+    {
+        "inputs": [],
+        "name": "getBlockNumber",
+        "outputs": [{"name": "blockNumber", "type": "uint256"}],
+        "stateMutability": "view",
+        "type": "function"
+    }
+]
@@ -2,26 +2,378 @@
 FastAPI application for the DAO Treasury Management system.
 """
 
-from typing import Dict, Any, Optional
-from fastapi import FastAPI, HTTPException, Query
+import asyncio
+import importlib
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, UTC
+from functools import partial
+from typing import AsyncIterator, Dict, Any, List, Optional, Union
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field, ConfigDict
-from web3 import Web3
 
-import os
 from .config import (
     PRIVATE_KEY,
+    CHAIN_CONFIGS,
+    JOB_DB_PATH,
+    INDEX_DB_PATH,
+    INDEXER_ENABLED,
+    CREW_PRELOAD,
+    get_rpc_url,
     get_contract_addresses_for_chain
 )
-from .services.treasury import TreasuryService
-from .services.strategy import StrategyService
-from .services.governance import GovernanceService
-from .crew import ProposalCrew, ExecutionCrew
+from .services.treasury import TreasuryService, AsyncTreasuryService
+from .services.strategy import StrategyService, AsyncStrategyService
+from .services.governance import GovernanceService, AsyncGovernanceService, fetch_proposal_actions
+from .services.providers import ProviderRegistry
+from .services.cache import read_cache
+from .services.llm_cache import llm_cache_stats
+from .services.jobs import JobStore, JobQueue, JobReporter, JOB_COMPLETED
+from .services.receipts import ReceiptTracker, TX_PENDING, TX_SUCCESS
+from .services.indexer import GovernanceIndexStore, GovernanceIndexer, StrategyIndexer, PROPOSAL_STATES
+from .services.proposals import ProposalQueryService, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .services.status import StatusSnapshot, CHAIN_ERROR
+from .services import calldata
+from .models import BacktestReport, GovernanceProposal, StrategyRecommendation, TreasuryAssessment
+from .scoring import RISK_PROFILES, best_score, get_scorer, summarize_ranking
+from .backtest import MetricsHistory, load_metrics_history, run_backtest, shutdown_pool
+from .optimizer import optimize_allocation, proposal_allocation, summarize_allocation
+from .utils import (
+    STRATEGY_IDS,
+    allocation_strategy_id,
+    create_allocation_proposal_parameters,
+    proposal_description,
+    resolve_allocation,
+    single_strategy_allocation
+)
+
+# Progress messages recorded on the job for each crew event
+CREW_EVENT_PROGRESS = {
+    "treasury_data": "Treasury data fetched",
+    "strategies": "Strategies fetched",
+    "agent_step": "Agent reasoning",
+    "tool_invocation": "Agent invoked a tool",
+    "task_output": "Agent task completed",
+    "tx_hash": "Proposal transaction submitted"
+}
+
+def run_proposal_job(
+    providers: ProviderRegistry,
+    chain: str,
+    report: JobReporter,
+    params: Dict[str, Any],
+    index_store: Optional[GovernanceIndexStore] = None
+) -> Dict[str, Any]:
+    """Run the proposal crew for a chain inside a job worker"""
+    rpc_url = get_rpc_url(chain)
+    
+    # Log which RPC URL is being used for debugging
+    print(f"🌐 Using RPC URL for {chain}: {rpc_url}")
+    
+    # Get chain-specific contract addresses
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    
+    # Initialize services on the shared chain provider
+    report("Connecting to chain")
+    w3 = providers.get_connected_web3(chain)
+    treasury_service = TreasuryService(rpc_url, w3=w3)
+    strategy_service = StrategyService(rpc_url, w3=w3)
+    governance_service = GovernanceService(rpc_url, PRIVATE_KEY, w3=w3)
+    
+    def on_event(event: str, data: Dict[str, Any]) -> None:
+        report(CREW_EVENT_PROGRESS.get(event, event), event, data)
+    
+    # The AI stack (crewai, langchain) loads on the first crew job rather than at API startup
+    from .crew import ProposalCrew
+    
+    # Create and run the crew
+    crew = ProposalCrew(
+        treasury_service=treasury_service,
+        strategy_service=strategy_service,
+        governance_service=governance_service,
+        treasury_address=chain_addresses["treasury"],
+        strategy_address=chain_addresses["strategy"],
+        governance_address=chain_addresses["governance"],
+        eth_token_address=chain_addresses["eth_token"],
+        explorer_url=CHAIN_CONFIGS[chain]["explorer_url"],
+        on_event=on_event,
+        metrics_history=load_metrics_history(chain, index_store),
+        description=params.get("description")
+    )
+    report("Running AI crew analysis")
+    return crew.run_analysis()
+
+def run_execution_job(providers: ProviderRegistry, chain: str, report: JobReporter, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the execution crew for a chain inside a job worker"""
+    rpc_url = get_rpc_url(chain)
+    
+    # Log which RPC URL is being used for debugging
+    print(f"🌐 Using RPC URL for {chain}: {rpc_url}")
+    
+    # Get chain-specific contract addresses
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    
+    report("Connecting to chain")
+    w3 = providers.get_connected_web3(chain)
+    governance_service = GovernanceService(rpc_url, PRIVATE_KEY, w3=w3)
+    
+    # Create and run the execution crew
+    from .crew import ExecutionCrew
+    crew = ExecutionCrew(
+        governance_service=governance_service,
+        treasury_address=chain_addresses["treasury"],
+        strategy_address=chain_addresses["strategy"],
+        governance_address=chain_addresses["governance"],
+        eth_token_address=chain_addresses["eth_token"],
+        explorer_url=CHAIN_CONFIGS[chain]["explorer_url"],
+        allocation=params.get("allocation"),
+        proposal_actions=params.get("actions"),
+        description=params.get("description")
+    )
+    report("Running AI proposal execution")
+    return crew.run_execution()
+
+async def resolve_execution_params(
+    providers: ProviderRegistry,
+    index_store: GovernanceIndexStore,
+    job_store: JobStore,
+    chain: str,
+    allocation: Optional[List[float]] = None,
+    proposal_id: Optional[str] = None,
+    description: Optional[str] = None
+) -> Dict[str, Any]:
+    """Execution job parameters carrying the actions of the proposal to execute; ValueError if they cannot be found"""
+    if allocation:
+        return {"allocation": resolve_allocation(allocation), "description": description}
+
+    if proposal_id:
+        proposal = index_store.get_proposal(chain, proposal_id)
+        if proposal is not None:
+            return {"actions": {
+                "proposal_id": proposal_id,
+                "targets": proposal["targets"],
+                "values": proposal["values"],
+                "calldatas": proposal["calldatas"],
+                "description": proposal["description"]
+            }}
+        # Not indexed (indexer disabled, lagging or fresh): read the Governor's proposal storage instead
+        actions = await fetch_proposal_actions(
+            providers.get_async_web3(chain),
+            get_contract_addresses_for_chain(chain)["governance"],
+            proposal_id
+        )
+        if actions is not None:
+            return {"actions": actions}
+
+    # The frontend executes right after voting on the proposal it just requested
+    latest = job_store.latest_result(chain, ("propose", "propose_fast"), "allocation")
+    if latest is None:
+        raise ValueError(f"No proposal to execute on {chain}: pass proposal_id or the allocation returned by /propose")
+    return {"allocation": latest["allocation"], "description": latest.get("description")}
+
+def run_explanation_job(
+    providers: ProviderRegistry,
+    job_store: JobStore,
+    chain: str,
+    report: JobReporter,
+    params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Add LLM reasoning to a fast-path proposal after it has been submitted"""
+    rpc_url = get_rpc_url(chain)
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    
+    report("Connecting to chain")
+    w3 = providers.get_connected_web3(chain)
+    
+    def on_event(event: str, data: Dict[str, Any]) -> None:
+        report(CREW_EVENT_PROGRESS.get(event, event), event, data)
+    
+    # No governance service: the proposal was already submitted by the fast path
+    from .crew import ProposalCrew
+    crew = ProposalCrew(
+        treasury_service=TreasuryService(rpc_url, w3=w3),
+        strategy_service=StrategyService(rpc_url, w3=w3),
+        treasury_address=chain_addresses["treasury"],
+        strategy_address=chain_addresses["strategy"],
+        governance_address=chain_addresses["governance"],
+        eth_token_address=chain_addresses["eth_token"],
+        explorer_url=CHAIN_CONFIGS[chain]["explorer_url"],
+        on_event=on_event
+    )
+    report("Running AI reasoning for the selected strategy")
+    explanation = crew.run_explanation(params["strategy_id"], params["ranking_summary"], params.get("allocation"))
+    
+    ai_analysis = {
+        "final_output": explanation["final_output"],
+        "strategy_recommendation": {
+            "strategy_id": params["strategy_id"],
+            "reasoning": explanation["reasoning"]
+        }
+    }
+    # Attach the reasoning to the original fast-path proposal so its job ID has the full result,
+    # merged atomically so a receipt recorded meanwhile is kept
+    proposal = job_store.merge_result(params["proposal_job_id"], {"ai_analysis": ai_analysis}, progress="AI reasoning added")
+    if proposal is None:
+        proposal = {**params["proposal"], "ai_analysis": ai_analysis}
+        job_store.update(params["proposal_job_id"], progress="AI reasoning added", result=proposal)
+    return proposal
+
+async def run_fast_proposal(
+    providers: ProviderRegistry,
+    chain: str,
+    risk_profile: str,
+    split: bool = False,
+    description: Optional[str] = None
+) -> tuple[Dict[str, Any], str]:
+    """Select a strategy (or a split across strategies) deterministically and submit the proposal without LLM calls"""
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    w3 = providers.get_async_web3(chain)
+    
+    strategies = await AsyncStrategyService(w3).get_all_strategies(chain_addresses["strategy"])
+    scorer = get_scorer(risk_profile)
+    ranking = scorer.rank(strategies)
+    best = best_score(ranking)
+    ranking_summary = summarize_ranking(ranking, strategies, scorer.profile)
+    
+    if split:
+        # Mean-variance split under the profile's liquidity and concentration limits
+        optimized = optimize_allocation(strategies, profiles=[risk_profile])[0]
+        allocation = proposal_allocation(optimized)
+        ranking_summary += "\n" + summarize_allocation(optimized)
+    else:
+        allocation = single_strategy_allocation(best.strategy_id)
+    # A split reports its largest share, as the crew path does, rather than the scorer's single pick
+    strategy_id = allocation_strategy_id(allocation)
+    print(f"⚡ FAST PATH: {ranking_summary}")
+    
+    targets, values, calldatas, _ = create_allocation_proposal_parameters(
+        chain_addresses["treasury"],
+        chain_addresses["strategy"],
+        chain_addresses["eth_token"],
+        allocation
+    )
+    description = proposal_description(description)
+    proposal = GovernanceProposal(
+        description=description,
+        targets=targets,
+        values=values,
+        calldatas=calldatas,
+        reasoning=ranking_summary
+    )
+    
+    governance_service = AsyncGovernanceService(w3, PRIVATE_KEY)
+    tx_hash = await governance_service.create_proposal(chain_addresses["governance"], proposal)
+    
+    explorer_url = CHAIN_CONFIGS[chain]["explorer_url"]
+    response = {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "tx_hash": tx_hash,
+        "tx_url": f"{explorer_url}{tx_hash}" if tx_hash else None,
+        "strategy_id": strategy_id,
+        "allocation": allocation,
+        "reasoning": ranking_summary,
+        "description": description,
+        "ai_analysis": {
+            "final_output": json.dumps([score.model_dump() for score in ranking]),
+            "strategy_recommendation": {
+                "strategy_id": strategy_id,
+                "reasoning": ranking_summary
+            }
+        }
+    }
+    return response, ranking_summary
+
+def record_receipt(job_store: JobStore, job_id: str, kind: str, tx_hash: str, receipt: Dict[str, Any]) -> None:
+    """Store a resolved transaction receipt on the job that submitted it"""
+    fields: Dict[str, Any] = {"receipt": receipt}
+    # An execution only succeeded once its transaction is mined without reverting
+    if kind == "execute":
+        fields["success"] = receipt["status"] == TX_SUCCESS
+    job_store.merge_result(job_id, fields, progress=f"Transaction {receipt['status']}")
+
+def track_job_transaction(
+    receipts: ReceiptTracker,
+    job_store: JobStore,
+    job_id: str,
+    kind: str,
+    chain: str,
+    result: Dict[str, Any]
+) -> None:
+    """Mark a completed job's transaction as pending and track it until it is mined"""
+    tx_hash = result.get("tx_hash")
+    if not tx_hash:
+        return
+    
+    job_store.merge_result(job_id, {"receipt": {"status": TX_PENDING}}, progress="Waiting for transaction receipt")
+    receipts.track(chain, tx_hash, partial(record_receipt, job_store, job_id, kind))
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create process-wide shared resources on startup and release them on shutdown"""
+    app.state.providers = ProviderRegistry()
+    app.state.job_store = JobStore(JOB_DB_PATH)
+    app.state.receipts = ReceiptTracker(app.state.providers)
+    app.state.receipts.start()
+    # Shared by the indexers, proposal queries and the proposal crew's backtests
+    app.state.index_store = GovernanceIndexStore(INDEX_DB_PATH)
+    app.state.jobs = JobQueue(
+        app.state.job_store,
+        {
+            "propose": partial(run_proposal_job, app.state.providers, index_store=app.state.index_store),
+            "execute": partial(run_execution_job, app.state.providers),
+            "explain": partial(run_explanation_job, app.state.providers, app.state.job_store)
+        },
+        on_complete=partial(track_job_transaction, app.state.receipts, app.state.job_store)
+    )
+    app.state.jobs.resume()
+    if CREW_PRELOAD:
+        # Warm the AI stack off the event loop so startup stays fast and the first crew job does not pay for it
+        asyncio.get_running_loop().run_in_executor(None, importlib.import_module, ".crew", __package__)
+    # Pick up transactions that were still in flight when the server last stopped
+    for job in app.state.job_store.list_pending_transactions():
+        app.state.receipts.track(job["chain"], job["tx_hash"], partial(record_receipt, app.state.job_store, job["id"], job["kind"]))
+    
+    # Index governance and strategy events for every chain with those contracts configured
+    app.state.proposal_queries = ProposalQueryService(app.state.index_store)
+    app.state.indexers = {}
+    app.state.strategy_indexers = {}
+    indexer_tasks = []
+    for chain in CHAIN_CONFIGS:
+        if not INDEXER_ENABLED:
+            break
+        chain_addresses = get_contract_addresses_for_chain(chain)
+        for indexer_class, indexers, address in (
+            (GovernanceIndexer, app.state.indexers, chain_addresses["governance"]),
+            (StrategyIndexer, app.state.strategy_indexers, chain_addresses["strategy"])
+        ):
+            if int(address, 16) == 0:
+                continue
+            indexer = indexer_class(chain, app.state.providers.get_async_web3(chain), app.state.index_store, address)
+            indexers[chain] = indexer
+            indexer_tasks.append(asyncio.create_task(indexer.run()))
+    
+    # Multi-chain status for /status/all, refreshed in the background only while it is polled
+    app.state.status_snapshot = StatusSnapshot(partial(check_chain_services, app), list(CHAIN_CONFIGS))
+    yield
+    await app.state.status_snapshot.aclose()
+    for task in indexer_tasks:
+        task.cancel()
+    await asyncio.gather(*indexer_tasks, return_exceptions=True)
+    await run_in_threadpool(app.state.jobs.shutdown)
+    app.state.index_store.close()
+    await run_in_threadpool(shutdown_pool)
+    await app.state.receipts.aclose()
+    app.state.job_store.close()
+    await app.state.providers.aclose()
 
 app = FastAPI(
     title="DAO Treasury Management API",
     description="API for managing DAO treasury and creating governance proposals",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -33,78 +385,6 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
-# Chain configuration mapping with default RPC URLs
-CHAIN_CONFIGS = {
-    "ethereum": {
-        "default_rpc_url": "https://ethereum-sepolia-rpc.publicnode.com",
-        "explorer_url": "https://sepolia.etherscan.io/tx/",
-        "env_var": "SEPOLIA_RPC_URL",
-        "private_key_vars": ["PRIVATE_KEY"],
-        "contract_env_vars": {
-            "treasury": "ETHEREUM_TREASURY_ADDRESS",
-            "strategy": "ETHEREUM_STRATEGY_ADDRESS", 
-            "governance": "ETHEREUM_GOVERNANCE_ADDRESS",
-            "eth_token": "ETHEREUM_ETH_TOKEN_ADDRESS"
-        }
-    },
-    "zircuit": {
-        "default_rpc_url": "https://zircuit-garfield-testnet.drpc.org",
-        "explorer_url": "https://explorer.garfield-testnet.zircuit.com/tx/",
-        "env_var": "ZIRCUIT_RPC_URL",
-        "private_key_vars": ["PRIVATE_KEY"],
-        "contract_env_vars": {
-            "treasury": "ZIRCUIT_TREASURY_ADDRESS",
-            "strategy": "ZIRCUIT_STRATEGY_ADDRESS",
-            "governance": "ZIRCUIT_GOVERNANCE_ADDRESS", 
-            "eth_token": "ZIRCUIT_ETH_TOKEN_ADDRESS"
-        }
-    },
-    "flow": {
-        "default_rpc_url": "https://testnet.evm.nodes.onflow.org",
-        "explorer_url": "https://evm-testnet.flowscan.io/tx/",
-        "env_var": "FLOW_RPC_URL",
-        "private_key_vars": ["PRIVATE_KEY"],
-        "contract_env_vars": {
-            "treasury": "FLOW_TREASURY_ADDRESS",
-            "strategy": "FLOW_STRATEGY_ADDRESS",
-            "governance": "FLOW_GOVERNANCE_ADDRESS",
-            "eth_token": "FLOW_ETH_TOKEN_ADDRESS"
-        }
-    },
-    "mantle": {
-        "default_rpc_url": "https://endpoints.omniatech.io/v1/mantle/sepolia/public",
-        "explorer_url": "https://sepolia.mantlescan.xyz/tx/",
-        "env_var": "MANTLE_RPC_URL",
-        "private_key_vars": ["PRIVATE_KEY"],
-        "contract_env_vars": {
-            "treasury": "MANTLE_TREASURY_ADDRESS",
-            "strategy": "MANTLE_STRATEGY_ADDRESS",
-            "governance": "MANTLE_GOVERNANCE_ADDRESS",
-            "eth_token": "MANTLE_ETH_TOKEN_ADDRESS"
-        }
-    }
-}
-
-def get_rpc_url(chain: str) -> str:
-    """Get RPC URL for the specified chain"""
-    if chain not in CHAIN_CONFIGS:
-        raise ValueError(f"Unsupported chain: {chain}. Supported chains: {list(CHAIN_CONFIGS.keys())}")
-    
-    chain_config = CHAIN_CONFIGS[chain]
-    
-    # Override RPC URL with environment variable if available
-    rpc_url = os.getenv(chain_config["env_var"])
-    
-    # Fallback to existing ETHEREUM_RPC_URL for ethereum (backward compatibility)
-    if not rpc_url and chain == "ethereum":
-        rpc_url = os.getenv("ETHEREUM_RPC_URL")
-    
-    # Use default RPC URL if no environment override
-    if not rpc_url:
-        rpc_url = chain_config["default_rpc_url"]
-    
-    return rpc_url
-
 # Removed TreasuryDataModel and StrategyMetricsModel as they're no longer used in the simplified response
 
 class StrategyRecommendationModel(BaseModel):
@@ -125,6 +405,8 @@ class AIAnalysisModel(BaseModel):
     """AI analysis model"""
     final_output: str = Field(description="Complete analysis output")
     strategy_recommendation: StrategyRecommendationModel = Field(description="Strategy recommendation")
+    treasury_assessment: Optional[TreasuryAssessment] = Field(None, description="Treasury agent's structured analysis, when it matched the schema")
+    strategy_evaluation: Optional[StrategyRecommendation] = Field(None, description="Strategy agent's structured evaluation, when it matched the schema")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -138,11 +420,32 @@ class AIAnalysisModel(BaseModel):
         }
     )
 
+class TransactionReceiptModel(BaseModel):
+    """Outcome of a submitted transaction"""
+    status: str = Field(description="Transaction status (pending/success/reverted/dropped)")
+    block_number: Optional[int] = Field(None, description="Block the transaction was mined in")
+    gas_used: Optional[int] = Field(None, description="Gas used by the transaction")
+    effective_gas_price: Optional[int] = Field(None, description="Price paid per unit of gas in wei")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "status": "success",
+                "block_number": 12345678,
+                "gas_used": 182341,
+                "effective_gas_price": 1200000000
+            }
+        }
+    )
+
 class ProposalResponse(BaseModel):
     """Response model for proposal creation"""
     timestamp: str = Field(description="Timestamp of the proposal creation")
+    tx_hash: Optional[str] = Field(None, description="Hash of the proposal transaction")
     tx_url: Optional[str] = Field(None, description="Chain-specific explorer URL for the transaction")
+    receipt: Optional[TransactionReceiptModel] = Field(None, description="Receipt of the proposal transaction, tracked after submission")
     strategy_id: int = Field(description="The ID of the selected strategy")
+    allocation: Optional[List[int]] = Field(None, description="Basis points of the proposal amount sent to strategies 1, 2 and 3; pass it to /execute")
     reasoning: str = Field(description="Detailed reasoning for the strategy selection")
     description: str = Field(description="Hardcoded description: 'Investing strategy'")
     ai_analysis: AIAnalysisModel = Field(description="AI analysis results")
@@ -153,6 +456,7 @@ class ProposalResponse(BaseModel):
                 "timestamp": "2024-03-15T12:00:00",
                 "tx_url": "https://sepolia.etherscan.io/tx/0x9e01cb1a09bb6687518611571bb67e24fb8f995586aeca28cc741383afb33390",
                 "strategy_id": 3,
+                "allocation": [0, 0, 10000],
                 "reasoning": "Treasury health: poor, risk tolerance: conservative, market conditions: bearish. Strategy 3 selected due to high withdrawal liquidity and balanced approach suitable for current conditions.",
                 "description": "Investing strategy",
                 "ai_analysis": {
@@ -169,15 +473,24 @@ class ProposalResponse(BaseModel):
 class ExecutionResponse(BaseModel):
     """Response model for proposal execution"""
     timestamp: str = Field(description="Timestamp of the proposal execution")
+    tx_hash: Optional[str] = Field(None, description="Hash of the execution transaction")
     tx_url: Optional[str] = Field(None, description="Chain-specific explorer URL for the transaction")
+    receipt: Optional[TransactionReceiptModel] = Field(None, description="Receipt of the execution transaction, tracked after submission")
     execution_result: str = Field(description="Result of the execution")
-    success: bool = Field(description="Whether the execution was successful")
+    success: Optional[bool] = Field(None, description="Whether the execution transaction was mined without reverting; null while it is pending")
 
     model_config = ConfigDict(
         json_schema_extra={
             "example": {
                 "timestamp": "2024-03-15T12:00:00",
+                "tx_hash": "0x9e01cb1a09bb6687518611571bb67e24fb8f995586aeca28cc741383afb33390",
                 "tx_url": "https://sepolia.etherscan.io/tx/0x9e01cb1a09bb6687518611571bb67e24fb8f995586aeca28cc741383afb33390",
+                "receipt": {
+                    "status": "success",
+                    "block_number": 12345678,
+                    "gas_used": 182341,
+                    "effective_gas_price": 1200000000
+                },
                 "execution_result": "SUCCESS: Proposal executed with transaction hash: 0x9e01cb1a09bb6687518611571bb67e24fb8f995586aeca28cc741383afb33390",
                 "success": True
             }
@@ -233,16 +546,219 @@ class StatusResponse(BaseModel):
         }
     )
 
-@app.post("/propose", response_model=ProposalResponse)
-async def create_proposal(chain: str = Query("ethereum", description="EVM chain to use", enum=["ethereum", "zircuit", "flow", "mantle"])):
+class ChainStatusModel(BaseModel):
+    """One chain's entry in the multi-chain status snapshot"""
+    status: str = Field(description="Outcome of the latest check (ok/timeout/error)")
+    error: Optional[str] = Field(None, description="Why the latest check failed")
+    updated_at: Optional[str] = Field(None, description="When the services were last read successfully; older than the latest check if it failed")
+    age_seconds: Optional[float] = Field(None, description="Seconds since the services were last read successfully")
+    latency_ms: float = Field(description="Duration of the latest check")
+    services: list[ServiceStatus] = Field(description="Statuses from the last successful check, followed by local governance and index statuses")
+    config: Dict[str, Any] = Field(description="Chain configuration")
+
+class MultiChainStatusResponse(BaseModel):
+    """Status of every configured chain from the background snapshot"""
+    api_version: str = Field(description="API version")
+    chains: Dict[str, ChainStatusModel] = Field(description="Status per chain")
+    services: list[ServiceStatus] = Field(description="Process-wide services shared across chains")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "api_version": "1.0.0",
+                "chains": {
+                    "ethereum": {
+                        "status": "ok",
+                        "updated_at": "2025-07-05T12:00:00+00:00",
+                        "age_seconds": 3.2,
+                        "latency_ms": 412.0,
+                        "services": [{"name": "web3", "status": "healthy", "details": {"block_number": 12345678}}],
+                        "config": {"chain": "ethereum", "treasury_address": "0x..."}
+                    },
+                    "flow": {
+                        "status": "timeout",
+                        "error": "No answer within 5s",
+                        "updated_at": None,
+                        "age_seconds": None,
+                        "latency_ms": 5001.3,
+                        "services": [],
+                        "config": {"chain": "flow", "treasury_address": "0x..."}
+                    }
+                },
+                "services": [{"name": "read_cache", "status": "healthy", "details": {"hits": 120, "misses": 8}}]
+            }
+        }
+    )
+
+class JobResponse(BaseModel):
+    """Background job status response"""
+    job_id: str = Field(validation_alias="id", serialization_alias="job_id", description="Job ID to poll")
+    kind: str = Field(description="Job kind (propose/execute)")
+    chain: str = Field(description="EVM chain the job runs on")
+    status: str = Field(description="Job status (queued/running/completed/failed)")
+    progress: Optional[str] = Field(None, description="Latest progress message")
+    result: Optional[Union[ProposalResponse, ExecutionResponse]] = Field(None, description="Final result once completed")
+    error: Optional[str] = Field(None, description="Error message if the job failed")
+    created_at: str = Field(description="Timestamp of job creation")
+    updated_at: str = Field(description="Timestamp of the last job update")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "job_id": "3f2b8c1e9d4a4b6f8e7c2a1d0b9e8f7a",
+                "kind": "propose",
+                "chain": "ethereum",
+                "status": "running",
+                "progress": "Running AI crew analysis",
+                "result": None,
+                "error": None,
+                "created_at": "2024-03-15T12:00:00",
+                "updated_at": "2024-03-15T12:00:05"
+            }
+        }
+    )
+
+class VoteTallyModel(BaseModel):
+    """Vote totals for a proposal; uint256 amounts are decimal strings"""
+    for_votes: str = Field(description="Total weight voting for")
+    against_votes: str = Field(description="Total weight voting against")
+    abstain_votes: str = Field(description="Total weight abstaining")
+    quorum: Optional[str] = Field(None, description="quorum(voteStart), once the snapshot has passed")
+    quorum_progress: Optional[float] = Field(None, description="(for + abstain) / quorum; 1.0 means quorum is reached")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "for_votes": "400000000000000000000",
+                "against_votes": "100000000000000000000",
+                "abstain_votes": "0",
+                "quorum": "320000000000000000000",
+                "quorum_progress": 1.25
+            }
+        }
+    )
+
+class ProposalSummaryModel(BaseModel):
+    """Indexed governance proposal"""
+    chain: str = Field(description="EVM chain the proposal lives on")
+    proposal_id: str = Field(description="Governor proposal ID as a decimal string")
+    proposer: str = Field(description="Address that created the proposal")
+    description: str = Field(description="Proposal description")
+    state: str = Field(description="Proposal state (pending/active/succeeded/defeated/queued/executed/canceled)")
+    vote_start: int = Field(description="Block the vote opens at (the snapshot)")
+    vote_end: int = Field(description="Block the vote closes at")
+    eta: Optional[int] = Field(None, description="Earliest execution time once queued")
+    block_number: int = Field(description="Block the proposal was created in")
+    tx_hash: str = Field(description="Transaction that created the proposal")
+    tally: VoteTallyModel = Field(description="Vote totals and quorum progress")
+
+class ProposalVoteModel(BaseModel):
+    """Single vote on a proposal"""
+    voter: str = Field(description="Voter address")
+    support: int = Field(description="0 = against, 1 = for, 2 = abstain")
+    weight: str = Field(description="Voting weight as a decimal string")
+    reason: str = Field(description="Reason given with the vote")
+    block_number: int = Field(description="Block the vote was cast in")
+    tx_hash: str = Field(description="Transaction that cast the vote")
+
+class ProposalDetailModel(ProposalSummaryModel):
+    """Indexed governance proposal with its actions and votes"""
+    targets: List[str] = Field(description="Target contract addresses")
+    values: List[str] = Field(description="ETH values sent with each call, in wei")
+    signatures: List[str] = Field(description="Function signatures, if given")
+    calldatas: List[str] = Field(description="Encoded calldata for each call")
+    votes: List[ProposalVoteModel] = Field(description="Votes in the order they were cast")
+
+class ProposalListResponse(BaseModel):
+    """Page of indexed proposals"""
+    items: List[ProposalSummaryModel] = Field(description="Proposals, newest first")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page, or null on the last page")
+
+class DecodedArgumentModel(BaseModel):
+    """Decoded function argument; integers are decimal strings and bytes are hex"""
+    name: str = Field(description="Parameter name from the ABI")
+    type: str = Field(description="ABI type")
+    value: Any = Field(description="Decoded value")
+    label: Optional[str] = Field(None, description="Contract name if the value is a configured contract address")
+    calls: Optional[List["DecodedCallModel"]] = Field(None, description="Calls decoded from a bytes or bytes[] argument holding calldata")
+
+class DecodedCallModel(BaseModel):
+    """Calldata resolved against the Treasury, Strategy, Governance and ETHToken ABIs"""
+    selector: Optional[str] = Field(None, description="4-byte function selector")
+    contract: Optional[str] = Field(None, description="Contract whose ABI defines the function")
+    function: Optional[str] = Field(None, description="Function name")
+    signature: Optional[str] = Field(None, description="Canonical function signature")
+    args: List[DecodedArgumentModel] = Field(description="Decoded arguments in order")
+    summary: Optional[str] = Field(None, description="One-line human-readable form of the call")
+    error: Optional[str] = Field(None, description="Why the calldata could not be decoded")
+
+# Resolve the forward reference from arguments to nested calls
+DecodedArgumentModel.model_rebuild()
+
+class DecodeRequest(BaseModel):
+    """Batch of calldata to decode"""
+    calldatas: List[str] = Field(description="Hex-encoded calldata, e.g. the calldatas of a page of proposals", max_length=1000)
+    chain: Optional[str] = Field(None, description="Chain whose configured contract addresses are labelled by name", json_schema_extra={"enum": ["ethereum", "zircuit", "flow", "mantle"]})
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "calldatas": ["0xb61d27f60000000000000000000000005fbdb2315678afecb367f032d93f642f64180aa30000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000000006000000000000000000000000000000000000000000000000000000000000000449571d4c4000000000000000000000000e7f1725e7734ce288f8367e1bb143e90bb3f05120000000000000000000000000000000000000000000000000de0b6b3a764000000000000000000000000000000000000000000000000000000000000"],
+                "chain": "ethereum"
+            }
+        }
+    )
+
+class DecodeResponse(BaseModel):
+    """Decoded calls in request order"""
+    results: List[DecodedCallModel] = Field(description="One entry per calldata")
+
+class BacktestRequest(BaseModel):
+    """Allocations to backtest and the simulation size"""
+    chain: str = Field("ethereum", description="Chain whose recorded strategy metrics are replayed", json_schema_extra={"enum": ["ethereum", "zircuit", "flow", "mantle"]})
+    allocations: Optional[List[List[float]]] = Field(None, description="Weights for strategies 1, 2 and 3 per allocation; every single strategy if omitted", max_length=64)
+    horizon_days: int = Field(90, description="Days to simulate", ge=1, le=3650)
+    paths: int = Field(10000, description="Monte Carlo paths per allocation", ge=100, le=100000)
+    seed: Optional[int] = Field(None, description="Random seed, to reproduce a previous run")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "chain": "ethereum",
+                "allocations": [[1, 0, 0], [0, 1, 0], [0, 0, 1], [0.6, 0.25, 0.15]],
+                "horizon_days": 90,
+                "paths": 10000
+            }
+        }
+    )
+
+@app.post("/propose", response_model=JobResponse, status_code=202)
+async def create_proposal(
+    request: Request,
+    response: Response,
+    chain: str = Query("ethereum", description="EVM chain to use", enum=["ethereum", "zircuit", "flow", "mantle"]),
+    mode: str = Query("crew", description="crew: full AI analysis in a background job; fast: deterministic scoring with no LLM calls", enum=["crew", "fast"]),
+    risk_profile: str = Query("moderate", description="Risk profile used by the fast-mode scorer", enum=list(RISK_PROFILES.keys())),
+    explain: bool = Query(False, description="In fast mode, add LLM reasoning to the job result in the background"),
+    split: bool = Query(False, description="In fast mode, split the proposal across strategies with the portfolio optimizer instead of funding only the top-ranked one"),
+    description: Optional[str] = Query(None, description="Proposal description, which must differ between proposals with the same actions; the DESCRIPTION environment variable if omitted")
+):
     """
-    Create a new governance proposal using AI analysis.
+    Queue a new governance proposal using AI analysis.
     
-    The endpoint will:
+    In crew mode (default) the endpoint returns a job immediately. A background worker will:
     1. Analyze current treasury state
     2. Evaluate available strategies
     3. Create and submit a governance proposal
     
+    Poll GET /jobs/{job_id} for progress and the final ProposalResponse.
+    
+    In fast mode the strategy is picked by a weighted multi-criteria ranker under the
+    chosen risk profile and the proposal is submitted inline, with no LLM calls. The
+    returned job is already completed. With explain=true, the LLM reasoning is added
+    to the same job's result in the background. With split=true, the amount is divided
+    across strategies by the portfolio optimizer under the same risk profile.
+    
     Supports multiple EVM chains through the chain parameter:
     - ethereum: Ethereum Sepolia testnet
     - zircuit: Zircuit testnet
@@ -251,6 +767,8 @@ async def create_proposal(chain: str = Query("ethereum", description="EVM chain
     
     Environment Variables:
     - PRIVATE_KEY: Private key used for all chains
+    - JOB_CONCURRENCY: Jobs allowed to run at once per chain (default 2)
+    - <CHAIN>_JOB_CONCURRENCY: Per-chain override, e.g. MANTLE_JOB_CONCURRENCY
     
     RPC URL Override via Environment Variables:
     - ETHEREUM_RPC_URL: Fallback for Ethereum chain
@@ -268,55 +786,120 @@ async def create_proposal(chain: str = Query("ethereum", description="EVM chain
         chain: EVM chain to use (ethereum, zircuit, flow, mantle). Defaults to ethereum.
     
     Returns:
-        ProposalResponse: The proposal details and analysis results with chain-specific explorer URL
+        JobResponse: The queued job to poll for the proposal result
     """
     try:
-        # Get chain-specific configuration
-        rpc_url = get_rpc_url(chain)
-        
-        # Log which RPC URL is being used for debugging
-        print(f"🌐 Using RPC URL for {chain}: {rpc_url}")
-
-        # Get chain-specific contract addresses
-        chain_addresses = get_contract_addresses_for_chain(chain)
+        if mode == "fast":
+            result, ranking_summary = await run_fast_proposal(request.app.state.providers, chain, risk_profile, split, description)
+            
+            job_store = request.app.state.job_store
+            job_id = job_store.create("propose_fast", chain, {"risk_profile": risk_profile, "explain": explain, "split": split})
+            job_store.update(
+                job_id,
+                status=JOB_COMPLETED,
+                progress="Completed; AI reasoning pending" if explain else "Completed",
+                result=result
+            )
+            track_job_transaction(request.app.state.receipts, job_store, job_id, "propose_fast", chain, result)
+            
+            if explain:
+                request.app.state.jobs.submit("explain", chain, params={
+                    "proposal_job_id": job_id,
+                    "strategy_id": result["strategy_id"],
+                    "allocation": result["allocation"],
+                    "ranking_summary": ranking_summary,
+                    "proposal": result
+                })
+            
+            response.status_code = 200
+            return job_store.get(job_id)
         
-        # Initialize services with chain-specific RPC URL and private key
-        treasury_service = TreasuryService(rpc_url)
-        strategy_service = StrategyService(rpc_url)
-        governance_service = GovernanceService(rpc_url, PRIVATE_KEY)
+        job_id = request.app.state.jobs.submit("propose", chain, params={"description": description})
+        return request.app.state.job_store.get(job_id)
         
-        # Create and run the crew
-        crew = ProposalCrew(
-            treasury_service=treasury_service,
-            strategy_service=strategy_service,
-            governance_service=governance_service,
-            treasury_address=chain_addresses["treasury"],
-            strategy_address=chain_addresses["strategy"],
-            governance_address=chain_addresses["governance"],
-            eth_token_address=chain_addresses["eth_token"],
-            explorer_url=CHAIN_CONFIGS[chain]["explorer_url"]
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to queue proposal: {str(e)}"
         )
-        
-        # Run the analysis
-        result = crew.run_analysis()
-            
-        return result
-        
+
+@app.get("/propose/stream")
+async def stream_proposal(request: Request, chain: str = Query("ethereum", description="EVM chain to use", enum=["ethereum", "zircuit", "flow", "mantle"])):
+    """
+    Create a new governance proposal and stream crew progress as server-sent events.
+    
+    Runs the same background job as POST /propose, so the job can also be polled
+    via GET /jobs/{job_id}. Events are emitted as each phase finishes:
+    - queued: job accepted, with its job_id
+    - started: a worker picked up the job
+    - treasury_data: on-chain treasury data fetched
+    - strategies: on-chain strategy metrics fetched
+    - agent_step / tool_invocation: agent reasoning steps and tool calls
+    - task_output: output of each agent task
+    - tx_hash: proposal transaction submitted
+    - result: final ProposalResponse
+    - error: the job failed
+    
+    Args:
+        chain: EVM chain to use (ethereum, zircuit, flow, mantle). Defaults to ethereum.
+    
+    Returns:
+        StreamingResponse: text/event-stream of crew progress events
+    """
+    loop = asyncio.get_running_loop()
+    events: asyncio.Queue = asyncio.Queue()
+    
+    def listener(event: str, data: Dict[str, Any]) -> None:
+        # Called from the job worker thread
+        loop.call_soon_threadsafe(events.put_nowait, (event, data))
+    
+    try:
+        job_id = request.app.state.jobs.submit("propose", chain, listener=listener)
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to create proposal: {str(e)}"
+            detail=f"Failed to queue proposal: {str(e)}"
         )
+    
+    async def event_stream() -> AsyncIterator[str]:
+        yield f"event: queued\ndata: {json.dumps({'job_id': job_id, 'chain': chain})}\n\n"
+        while True:
+            event, data = await events.get()
+            yield f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+            if event in ("result", "error"):
+                break
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
-@app.post("/execute", response_model=ExecutionResponse)
-async def execute_proposal(chain: str = Query("ethereum", description="EVM chain to use", enum=["ethereum", "zircuit", "flow", "mantle"])):
+@app.post("/execute", response_model=JobResponse, status_code=202)
+async def execute_proposal(
+    request: Request,
+    chain: str = Query("ethereum", description="EVM chain to use", enum=["ethereum", "zircuit", "flow", "mantle"]),
+    allocation: Optional[List[float]] = Query(None, description="Weights for strategies 1, 2 and 3 the proposal was created with, e.g. the allocation returned by /propose"),
+    proposal_id: Optional[str] = Query(None, description="ID of the proposal to execute with its exact actions"),
+    description: Optional[str] = Query(None, description="Description the proposal was created with, alongside allocation; the DESCRIPTION environment variable if omitted")
+):
     """
-    Execute an approved governance proposal.
+    Queue execution of an approved governance proposal.
+    
+    Governor.execute() needs the exact actions that were proposed. They are taken from, in order:
+    1. allocation: the weights the proposal was created with
+    2. proposal_id: the indexed ProposalCreated event of that proposal, or the Governor's
+       proposal storage if it is not indexed yet
+    3. the allocation of the latest proposal submitted on the chain through /propose
+    
+    If none of these is available the request is rejected with 400.
     
-    The endpoint will:
+    The endpoint returns a job immediately. A background worker will:
     1. Execute the approved governance proposal for chosen Strategy
     2. Submit the execution transaction to the blockchain
-    3. Return the execution result
+    3. Store the execution result on the job
+    
+    Poll GET /jobs/{job_id} for progress and the final ExecutionResponse.
     
     Supports multiple EVM chains through the chain parameter:
     - ethereum: Ethereum Sepolia testnet
@@ -338,51 +921,374 @@ async def execute_proposal(chain: str = Query("ethereum", description="EVM chain
     
     Args:
         chain: EVM chain to use (ethereum, zircuit, flow, mantle). Defaults to ethereum.
+        allocation: Strategy weights the proposal was created with
+        proposal_id: Proposal to execute
+        description: Description the proposal was created with
     
     Returns:
-        ExecutionResponse: The execution details and results with chain-specific explorer URL
+        JobResponse: The queued job to poll for the execution result
     """
     try:
-        # Get chain-specific configuration
-        rpc_url = get_rpc_url(chain)
-        
-        # Log which RPC URL is being used for debugging
-        print(f"🌐 Using RPC URL for {chain}: {rpc_url}")
-
-        governance_service = GovernanceService(rpc_url, PRIVATE_KEY)
-        
-        if not governance_service:
-            raise HTTPException(
-                status_code=400,
-                detail="Governance service not available - private key not configured"
-            )
-        
-        # Get chain-specific contract addresses
-        chain_addresses = get_contract_addresses_for_chain(chain)
-        
-        # Create and run the execution crew
-        crew = ExecutionCrew(
-            governance_service=governance_service,
-            treasury_address=chain_addresses["treasury"],
-            strategy_address=chain_addresses["strategy"],
-            governance_address=chain_addresses["governance"],
-            eth_token_address=chain_addresses["eth_token"],
-            explorer_url=CHAIN_CONFIGS[chain]["explorer_url"]
+        params = await resolve_execution_params(
+            request.app.state.providers,
+            request.app.state.index_store,
+            request.app.state.job_store,
+            chain,
+            allocation,
+            proposal_id,
+            description
         )
-        
-        # Run the execution
-        result = crew.run_execution()
-            
-        return result
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    try:
+        job_id = request.app.state.jobs.submit("execute", chain, params=params)
+        return request.app.state.job_store.get(job_id)
         
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Failed to execute proposal: {str(e)}"
+            detail=f"Failed to queue execution: {str(e)}"
         )
 
+@app.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(request: Request, job_id: str):
+    """
+    Get the progress of a background proposal or execution job.
+    
+    Args:
+        job_id: ID returned by POST /propose or POST /execute
+    
+    Returns:
+        JobResponse: Job status, progress and, once completed, the final result
+    """
+    job = request.app.state.job_store.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job
+
+@app.get("/proposals", response_model=ProposalListResponse)
+async def list_proposals(
+    request: Request,
+    response: Response,
+    chain: Optional[str] = Query(None, description="Only proposals on this chain; all chains if omitted", enum=["ethereum", "zircuit", "flow", "mantle"]),
+    state: Optional[str] = Query(None, description="Only proposals in this state", enum=PROPOSAL_STATES),
+    proposer: Optional[str] = Query(None, description="Only proposals created by this address"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE, description="Page size")
+):
+    """
+    List governance proposals from the local event index, newest first.
+    
+    Vote tallies and quorum progress are precomputed by the indexer, so a page is
+    one local query instead of several RPC calls per proposal. Responses carry an
+    ETag; send it back in If-None-Match to get 304 Not Modified until the index changes.
+    
+    Args:
+        chain: Filter by chain (ethereum, zircuit, flow, mantle)
+        state: Filter by proposal state
+        proposer: Filter by proposer address
+        cursor: Cursor returned as next_cursor by the previous page
+        limit: Page size
+    
+    Returns:
+        ProposalListResponse: A page of proposals and the cursor for the next one
+    """
+    queries = request.app.state.proposal_queries
+    etag = queries.etag(chain, "list", state, proposer.lower() if proposer else None, cursor, limit)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    try:
+        page = queries.list_proposals(chain=chain, state=state, proposer=proposer, cursor=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return page
+
+@app.get("/proposals/{proposal_id}", response_model=ProposalDetailModel)
+async def get_proposal(
+    request: Request,
+    response: Response,
+    proposal_id: str,
+    chain: str = Query("ethereum", description="EVM chain the proposal lives on", enum=["ethereum", "zircuit", "flow", "mantle"])
+):
+    """
+    Get one governance proposal from the local event index, with its actions and votes.
+    
+    Supports ETag/If-None-Match like GET /proposals.
+    
+    Args:
+        proposal_id: Governor proposal ID as a decimal string
+        chain: EVM chain the proposal lives on. Defaults to ethereum.
+    
+    Returns:
+        ProposalDetailModel: The proposal, its tally and its votes
+    """
+    queries = request.app.state.proposal_queries
+    etag = queries.etag(chain, "detail", proposal_id)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    
+    proposal = queries.get_proposal(chain, proposal_id)
+    if proposal is None:
+        raise HTTPException(status_code=404, detail=f"Proposal not found on {chain}: {proposal_id}")
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return proposal
+
+@app.post("/decode", response_model=DecodeResponse)
+async def decode_calldata(body: DecodeRequest):
+    """
+    Decode a batch of calldata into function calls.
+    
+    Selectors are resolved against the Treasury, Strategy, Governance and ETHToken ABIs,
+    and bytes arguments that carry calldata themselves (Treasury.execute wrapping
+    Strategy.executeStrategy1, Governor.propose calldatas) are decoded recursively.
+    Results are cached, so decoding the same actions again is a dictionary lookup.
+    
+    Args:
+        body: Calldata to decode and an optional chain for address labels
+    
+    Returns:
+        DecodeResponse: One decoded call per calldata, with an error for unknown selectors
+    """
+    try:
+        return {"results": calldata.decode_many(body.calldatas, body.chain)}
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/backtest", response_model=BacktestReport)
+async def backtest_allocations(request: Request, body: BacktestRequest):
+    """
+    Backtest allocations across strategies before a proposal is voted on.
+    
+    Simulates treasury value paths for each allocation by resampling blocks of the recorded
+    strategy metrics (the indexer's periodic snapshots, or BACKTEST_METRICS_FILE when set)
+    with correlated volatility shocks, and reports percentiles of the final value, annualized
+    return and drawdown. Chains with no recorded history are simulated from the current
+    metrics. Large runs are spread over a process pool.
+    
+    Args:
+        body: Chain, allocations, horizon and number of paths
+    
+    Returns:
+        BacktestReport: One scenario per allocation, in request order
+    """
+    if body.chain not in CHAIN_CONFIGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported chain: {body.chain}. Supported chains: {list(CHAIN_CONFIGS.keys())}")
+    
+    try:
+        allocations = [resolve_allocation(allocation) for allocation in body.allocations or []]
+        allocations = allocations or [single_strategy_allocation(strategy_id) for strategy_id in STRATEGY_IDS]
+        history = await run_in_threadpool(load_metrics_history, body.chain, request.app.state.index_store)
+        if history is None:
+            chain_addresses = get_contract_addresses_for_chain(body.chain)
+            w3 = request.app.state.providers.get_async_web3(body.chain)
+            strategies = await AsyncStrategyService(w3).get_all_strategies(chain_addresses["strategy"])
+            history = MetricsHistory.from_strategies(strategies)
+        
+        # CPU-bound, so it runs off the event loop
+        return await run_in_threadpool(run_backtest, history, allocations, body.horizon_days, body.paths, body.seed)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to run backtest: {str(e)}")
+
+async def check_chain_services(app: FastAPI, chain: str) -> list[ServiceStatus]:
+    """Check the chain connection and read the Treasury and Strategy contracts, all at once"""
+    rpc_url = get_rpc_url(chain)
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    
+    # The chain ID doubles as the connectivity check, so everything goes out in one concurrent round
+    w3 = app.state.providers.get_async_web3(chain)
+    network, block_number, treasury_result, strategy_result = await asyncio.gather(
+        w3.eth.chain_id,
+        w3.eth.block_number,
+        AsyncTreasuryService(w3).get_treasury_data(chain_addresses["treasury"], chain_addresses["eth_token"]),
+        AsyncStrategyService(w3).get_all_strategies(chain_addresses["strategy"]),
+        return_exceptions=True
+    )
+    connected = not isinstance(network, Exception)
+    
+    services = []
+    web3_status = {
+        "name": "web3",
+        "status": "healthy" if connected else "unhealthy",
+        "details": {
+            "connected": connected,
+            "network": network if connected else None,
+            "block_number": None if isinstance(block_number, Exception) else block_number,
+            "chain": chain,
+            "rpc_url": rpc_url
+        }
+    }
+    services.append(ServiceStatus(**web3_status))
+    
+    # Check Treasury contract
+    if isinstance(treasury_result, Exception):
+        treasury_status = {
+            "name": "treasury",
+            "status": "unhealthy",
+            "details": {"error": str(treasury_result), "chain": chain, "address": chain_addresses["treasury"]}
+        }
+    else:
+        treasury_status = {
+            "name": "treasury",
+            "status": "healthy",
+            "details": {
+                "eth_balance": str(treasury_result.eth_balance),
+                "eth_token_balance": str(treasury_result.eth_token_balance),
+                "chain": chain,
+                "address": chain_addresses["treasury"]
+            }
+        }
+    services.append(ServiceStatus(**treasury_status))
+    
+    # Check Strategy contract
+    if isinstance(strategy_result, Exception):
+        strategy_status = {
+            "name": "strategy",
+            "status": "unhealthy",
+            "details": {"error": str(strategy_result), "chain": chain, "address": chain_addresses["strategy"]}
+        }
+    else:
+        strategy_status = {
+            "name": "strategy",
+            "status": "healthy",
+            "details": {
+                "strategies_count": len(strategy_result),
+                "strategies": [
+                    {
+                        "id": s.strategy_id,
+                        "apy": s.apy,
+                        "tvl": str(s.tvl)
+                    } for s in strategy_result
+                ],
+                "chain": chain,
+                "address": chain_addresses["strategy"]
+            }
+        }
+    services.append(ServiceStatus(**strategy_status))
+    return services
+
+def governance_service_status(chain: str) -> ServiceStatus:
+    """Governance configuration of a chain; no RPC calls"""
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    return ServiceStatus(
+        name="governance",
+        status="configured" if PRIVATE_KEY else "unconfigured",
+        details={
+            "has_private_key": bool(PRIVATE_KEY),
+            "private_key_vars_checked": CHAIN_CONFIGS[chain]["private_key_vars"],
+            "address": chain_addresses["governance"],
+            "chain": chain,
+            "contract_env_vars": CHAIN_CONFIGS[chain]["contract_env_vars"]
+        }
+    )
+
+def shared_service_statuses(app: FastAPI) -> list[ServiceStatus]:
+    """Process-wide caches and receipt tracking, shared across chains"""
+    services = []
+    
+    # Contract read cache counters, shared across chains
+    services.append(ServiceStatus(name="read_cache", status="healthy", details=read_cache.stats()))
+    
+    # LLM response cache counters, once a crew has used it
+    llm_stats = llm_cache_stats()
+    services.append(ServiceStatus(name="llm_cache", status="healthy" if llm_stats else "idle", details=llm_stats or {}))
+    
+    # Calldata decoder cache counters
+    services.append(ServiceStatus(name="decode_cache", status="healthy", details=calldata.cache_stats()))
+    
+    # Transactions still waiting for a receipt, per chain
+    services.append(ServiceStatus(name="receipts", status="healthy", details={"in_flight": app.state.receipts.stats()}))
+    return services
+
+def index_service_statuses(app: FastAPI, chain: str) -> list[ServiceStatus]:
+    """Event index progress and recent strategy executions of a chain, from the local index"""
+    services = []
+    
+    # Event index progress for this chain; blocks up to finalized_block are past the confirmation depth
+    index_store = app.state.index_store
+    for name, indexer in (
+        ("governance_index", app.state.indexers.get(chain)),
+        ("strategy_index", app.state.strategy_indexers.get(chain))
+    ):
+        services.append(ServiceStatus(
+            name=name,
+            status="healthy" if indexer else "disabled",
+            details={
+                "last_indexed_block": index_store.get_checkpoint(chain, indexer.address) if indexer else None,
+                "finalized_block": index_store.get_finalized_block(chain, indexer.address) if indexer else None,
+                "confirmations": indexer.confirmations if indexer else None,
+                "reorgs": indexer.reorgs if indexer else None
+            }
+        ))
+    services.append(ServiceStatus(
+        name="strategy_executions",
+        status="healthy" if app.state.strategy_indexers.get(chain) else "disabled",
+        details={"recent": index_store.list_strategy_executions(chain, limit=5)}
+    ))
+    return services
+
+def chain_status_config(chain: str) -> Dict[str, Any]:
+    """Configuration of a chain as reported by the status endpoints (hides sensitive data)"""
+    chain_addresses = get_contract_addresses_for_chain(chain)
+    return {
+        "rpc_url": get_rpc_url(chain),
+        "treasury_address": chain_addresses["treasury"],
+        "strategy_address": chain_addresses["strategy"],
+        "governance_address": chain_addresses["governance"],
+        "eth_token_address": chain_addresses["eth_token"],
+        "has_chain_private_key": bool(PRIVATE_KEY),
+        "chain": chain,
+        "explorer_url": CHAIN_CONFIGS[chain]["explorer_url"]
+    }
+
+@app.get("/status/all", response_model=MultiChainStatusResponse)
+async def get_all_status(request: Request):
+    """
+    Get the status of every configured chain at once.
+    
+    Served from a snapshot that a background task refreshes every STATUS_REFRESH_INTERVAL seconds
+    while it is being polled, so this endpoint never waits on an RPC except for the very first request.
+    Each refresh checks all chains concurrently with a per-chain timeout (STATUS_CHAIN_TIMEOUT); a chain
+    that is slow or failing is reported as timeout/error with its last successful services, if any,
+    and age_seconds tells how old they are.
+    
+    Returns:
+        MultiChainStatusResponse: Status per chain and the process-wide services
+    """
+    entries = await request.app.state.status_snapshot.get()
+    chains = {}
+    for chain in CHAIN_CONFIGS:
+        entry = entries.get(chain) or {"status": CHAIN_ERROR, "error": "Not checked yet", "latency_ms": 0.0}
+        services = list(entry.get("result") or [])
+        # Local statuses are always current, whatever the RPC check returned
+        services.append(governance_service_status(chain))
+        services.extend(index_service_statuses(request.app, chain))
+        chains[chain] = ChainStatusModel(
+            status=entry["status"],
+            error=entry.get("error"),
+            updated_at=entry.get("updated_at"),
+            age_seconds=entry.get("age_seconds"),
+            latency_ms=entry["latency_ms"],
+            services=services,
+            config=chain_status_config(chain)
+        )
+    
+    return MultiChainStatusResponse(
+        api_version="1.0.0",
+        chains=chains,
+        services=shared_service_statuses(request.app)
+    )
+
 @app.get("/status", response_model=StatusResponse)
-async def get_status(chain: str = Query("ethereum", description="EVM chain to check status for", enum=["ethereum", "zircuit", "flow", "mantle"])):
+async def get_status(request: Request, chain: str = Query("ethereum", description="EVM chain to check status for", enum=["ethereum", "zircuit", "flow", "mantle"])):
     """
     Get the current status of the API and its services for a specific chain.
     
@@ -405,108 +1311,15 @@ async def get_status(chain: str = Query("ethereum", description="EVM chain to ch
         StatusResponse: The current status of all services and configuration for the specified chain
     """
     try:
-        # Get RPC URL for the specified chain
-        rpc_url = get_rpc_url(chain)
-        
-        # Get chain-specific contract addresses
-        chain_addresses = get_contract_addresses_for_chain(chain)
-        
-        services = []
-        
-        # Check Web3 connection
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        web3_status = {
-            "name": "web3",
-            "status": "healthy" if w3.is_connected() else "unhealthy",
-            "details": {
-                "connected": w3.is_connected(),
-                "network": w3.eth.chain_id,
-                "block_number": w3.eth.block_number if w3.is_connected() else None,
-                "chain": chain,
-                "rpc_url": rpc_url
-            }
-        }
-        services.append(ServiceStatus(**web3_status))
-        
-        # Check Treasury contract
-        try:
-            treasury_service = TreasuryService(rpc_url)
-            treasury_data = treasury_service.get_treasury_data(chain_addresses["treasury"], chain_addresses["eth_token"])
-            treasury_status = {
-                "name": "treasury",
-                "status": "healthy",
-                "details": {
-                    "eth_balance": str(treasury_data.eth_balance),
-                    "eth_token_balance": str(treasury_data.eth_token_balance),
-                    "chain": chain,
-                    "address": chain_addresses["treasury"]
-                }
-            }
-        except Exception as e:
-            treasury_status = {
-                "name": "treasury",
-                "status": "unhealthy",
-                "details": {"error": str(e), "chain": chain, "address": chain_addresses["treasury"]}
-            }
-        services.append(ServiceStatus(**treasury_status))
-        
-        # Check Strategy contract
-        try:
-            strategy_service = StrategyService(rpc_url)
-            strategies = strategy_service.get_all_strategies(chain_addresses["strategy"])
-            strategy_status = {
-                "name": "strategy",
-                "status": "healthy",
-                "details": {
-                    "strategies_count": len(strategies),
-                    "strategies": [
-                        {
-                            "id": s.strategy_id,
-                            "apy": s.apy,
-                            "tvl": str(s.tvl)
-                        } for s in strategies
-                    ],
-                    "chain": chain,
-                    "address": chain_addresses["strategy"]
-                }
-            }
-        except Exception as e:
-            strategy_status = {
-                "name": "strategy",
-                "status": "unhealthy",
-                "details": {"error": str(e), "chain": chain, "address": chain_addresses["strategy"]}
-            }
-        services.append(ServiceStatus(**strategy_status))
-
-        governance_status = {
-            "name": "governance",
-            "status": "configured" if PRIVATE_KEY else "unconfigured",
-            "details": {
-                "has_private_key": bool(PRIVATE_KEY),
-                "private_key_vars_checked": CHAIN_CONFIGS[chain]["private_key_vars"],
-                "address": chain_addresses["governance"],
-                "chain": chain,
-                "contract_env_vars": CHAIN_CONFIGS[chain]["contract_env_vars"]
-            }
-        }
-        services.append(ServiceStatus(**governance_status))
-        
-        # Prepare configuration status (hide sensitive data)
-        config = {
-            "rpc_url": rpc_url,
-            "treasury_address": chain_addresses["treasury"],
-            "strategy_address": chain_addresses["strategy"],
-            "governance_address": chain_addresses["governance"],
-            "eth_token_address": chain_addresses["eth_token"],
-            "has_chain_private_key": bool(PRIVATE_KEY),
-            "chain": chain,
-            "explorer_url": CHAIN_CONFIGS[chain]["explorer_url"]
-        }
+        services = await check_chain_services(request.app, chain)
+        services.append(governance_service_status(chain))
+        services.extend(shared_service_statuses(request.app))
+        services.extend(index_service_statuses(request.app, chain))
         
         return StatusResponse(
             api_version="1.0.0",
             services=services,
-            config=config
+            config=chain_status_config(chain)
         )
         
     except Exception as e:
@@ -0,0 +1,331 @@
+"""
+Monte Carlo backtests of treasury allocations over a strategy metrics history.
+"""
+
+import csv
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .models import BacktestReport, BacktestScenario, StrategyMetrics
+from .optimizer import STRATEGY_CORRELATION, strategy_volatility
+from .utils import STRATEGY_IDS
+
+SECONDS_PER_YEAR = 365 * 24 * 3600
+
+# Length of one simulated period; histories are resampled to this grid
+BACKTEST_STEP_SECONDS = int(os.getenv("BACKTEST_STEP_SECONDS", "86400"))
+
+# Consecutive historical periods drawn together, so regimes in the history survive resampling
+BACKTEST_BLOCK_LENGTH = int(os.getenv("BACKTEST_BLOCK_LENGTH", "10"))
+
+# Optional CSV or Parquet file of strategy metrics used instead of the indexed snapshots
+BACKTEST_METRICS_FILE = os.getenv("BACKTEST_METRICS_FILE")
+
+# Worker processes for large sweeps, and the path-steps x allocations below which a run stays in process
+BACKTEST_WORKERS = int(os.getenv("BACKTEST_WORKERS", str(os.cpu_count() or 1)))
+PARALLEL_MIN_WORK = int(os.getenv("BACKTEST_PARALLEL_MIN_WORK", "20000000"))
+
+# Path-steps x allocations simulated per array batch; each array of a batch holds this many floats
+# (32 MB at the default), so paths per batch shrink as the horizon and the number of allocations grow
+PATH_BATCH_ELEMENTS = int(os.getenv("BACKTEST_BATCH_ELEMENTS", "4000000"))
+
+# Percentiles reported for every scenario
+BACKTEST_PERCENTILES = (5, 25, 50, 75, 95)
+
+# Columns a metrics file must have; other columns are ignored
+METRICS_FILE_COLUMNS = ("timestamp", "strategy", "apy", "risk_adjusted_returns")
+
+class MetricsHistory:
+    """Strategy APY and risk-adjusted returns resampled to a regular time grid"""
+
+    def __init__(
+        self,
+        timestamps: np.ndarray,
+        strategy_ids: List[int],
+        apy: np.ndarray,
+        risk_adjusted_returns: np.ndarray,
+        source: str,
+        step_seconds: int = BACKTEST_STEP_SECONDS
+    ):
+        self.timestamps = timestamps
+        self.strategy_ids = strategy_ids
+        self.apy = apy
+        self.risk_adjusted_returns = risk_adjusted_returns
+        self.source = source
+        self.step_seconds = step_seconds
+
+    @property
+    def periods(self) -> int:
+        """Number of periods in the grid"""
+        return len(self.timestamps)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]], source: str, step_seconds: int = BACKTEST_STEP_SECONDS) -> "MetricsHistory":
+        """Build a history from per-strategy snapshots, carrying each value forward until the next one"""
+        if not rows:
+            raise ValueError("Metrics history is empty")
+        strategy_ids = sorted({int(row["strategy"]) for row in rows})
+        columns = {strategy_id: column for column, strategy_id in enumerate(strategy_ids)}
+        snapshot_times = np.array(sorted({int(row["timestamp"]) for row in rows}), dtype=np.int64)
+
+        # Pivot to snapshot times x strategies, then fill gaps from the previous (or first) snapshot
+        apy = np.full((len(snapshot_times), len(strategy_ids)), np.nan)
+        risk_adjusted_returns = np.full_like(apy, np.nan)
+        rows_at = np.searchsorted(snapshot_times, [int(row["timestamp"]) for row in rows])
+        for row, index in zip(rows, rows_at):
+            apy[index, columns[int(row["strategy"])]] = float(row["apy"])
+            risk_adjusted_returns[index, columns[int(row["strategy"])]] = float(row["risk_adjusted_returns"])
+        apy, risk_adjusted_returns = _fill_gaps(apy), _fill_gaps(risk_adjusted_returns)
+
+        # Each grid point takes the latest snapshot at or before it
+        grid = np.arange(snapshot_times[0], snapshot_times[-1] + 1, step_seconds, dtype=np.int64)
+        latest = np.searchsorted(snapshot_times, grid, side="right") - 1
+        return cls(grid, strategy_ids, apy[latest], risk_adjusted_returns[latest], source, step_seconds)
+
+    @classmethod
+    def from_strategies(cls, strategies: List[StrategyMetrics], step_seconds: int = BACKTEST_STEP_SECONDS) -> "MetricsHistory":
+        """One-period history from the current metrics, for chains with nothing recorded yet"""
+        timestamp = int(time.time())
+        return cls.from_rows([
+            {
+                "timestamp": timestamp,
+                "strategy": strategy.strategy_id,
+                "apy": strategy.apy,
+                "risk_adjusted_returns": strategy.risk_adjusted_returns
+            }
+            for strategy in strategies
+        ], "snapshot", step_seconds)
+
+    def weights(self, allocations: Sequence[Sequence[int]]) -> np.ndarray:
+        """Allocations over STRATEGY_IDS as fractions per strategy in this history's column order"""
+        weights = np.zeros((len(allocations), len(self.strategy_ids)))
+        for row, allocation in enumerate(allocations):
+            for strategy_id, bps in zip(STRATEGY_IDS, allocation):
+                if not bps:
+                    continue
+                if strategy_id not in self.strategy_ids:
+                    raise ValueError(f"No metrics history for strategy {strategy_id}")
+                weights[row, self.strategy_ids.index(strategy_id)] = bps / 10000
+        return weights
+
+def _fill_gaps(values: np.ndarray) -> np.ndarray:
+    """Forward-fill NaNs down each column, back-filling any leading ones from the first value"""
+    valid = ~np.isnan(values)
+    if not valid.any(axis=0).all():
+        raise ValueError("Metrics history has a strategy with no values")
+    # Index of the last valid row at or above each row, per column
+    last_valid = np.maximum.accumulate(np.where(valid, np.arange(len(values))[:, None], -1), axis=0)
+    first_valid = valid.argmax(axis=0)
+    last_valid = np.where(last_valid < 0, first_valid[None, :], last_valid)
+    return np.take_along_axis(values, last_valid, axis=0)
+
+def _parse_timestamp(value: str) -> int:
+    """Unix seconds from a number or an ISO 8601 string"""
+    try:
+        return int(float(value))
+    except ValueError:
+        return int(datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp())
+
+def load_metrics_file(path: str, step_seconds: int = BACKTEST_STEP_SECONDS) -> MetricsHistory:
+    """Read a metrics history from CSV or Parquet with timestamp, strategy, apy and risk_adjusted_returns columns"""
+    if path.endswith(".parquet"):
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ValueError("Reading Parquet metrics files requires pandas and pyarrow")
+        rows = pd.read_parquet(path, columns=list(METRICS_FILE_COLUMNS)).astype(str).to_dict("records")
+    else:
+        with open(path, newline="") as f:
+            rows = list(csv.DictReader(f))
+
+    if rows:
+        missing = [column for column in METRICS_FILE_COLUMNS if column not in rows[0]]
+        if missing:
+            raise ValueError(f"Metrics file {path} is missing columns: {missing}")
+    for row in rows:
+        row["timestamp"] = _parse_timestamp(str(row["timestamp"]))
+    return MetricsHistory.from_rows(rows, "file", step_seconds)
+
+def load_metrics_history(chain: str, store: Optional[Any] = None, path: Optional[str] = BACKTEST_METRICS_FILE) -> Optional[MetricsHistory]:
+    """Metrics history from the configured file, else the chain's indexed snapshots, else None"""
+    if path:
+        return load_metrics_file(path)
+    if store is not None:
+        rows = store.list_strategy_metrics(chain)
+        if rows:
+            return MetricsHistory.from_rows(rows, "index")
+    return None
+
+def path_batch_size(horizon: int, columns: int) -> int:
+    """Paths per array batch for a horizon in steps and the widest of the strategies and allocations"""
+    return max(PATH_BATCH_ELEMENTS // (horizon * columns), 1)
+
+def simulate_paths(
+    step_returns: np.ndarray,
+    step_volatility: np.ndarray,
+    weights: np.ndarray,
+    horizon: int,
+    paths: int,
+    seed: Any,
+    correlation: float = STRATEGY_CORRELATION,
+    block_length: int = BACKTEST_BLOCK_LENGTH
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Final value multiples and maximum drawdowns, each paths x allocations
+
+    Each path stitches together blocks of consecutive historical periods starting at random
+    points, and adds correlated normal shocks scaled by each strategy's volatility in that period.
+    """
+    rng = np.random.default_rng(seed)
+    periods, strategies = step_returns.shape
+    cholesky = np.linalg.cholesky(np.full((strategies, strategies), correlation) + (1 - correlation) * np.eye(strategies))
+
+    # Shocks and returns are batch x horizon x strategies, portfolio values batch x horizon x allocations
+    batch_size = path_batch_size(horizon, max(strategies, len(weights)))
+    finals, drawdowns = [], []
+    for start in range(0, paths, batch_size):
+        batch = min(batch_size, paths - start)
+        # Period index of every step: block starts plus offsets, wrapping around the history
+        blocks = -(-horizon // block_length)
+        starts = rng.integers(0, periods, size=(batch, blocks, 1))
+        index = ((starts + np.arange(block_length)) % periods).reshape(batch, -1)[:, :horizon]
+
+        shocks = rng.standard_normal((batch, horizon, strategies)) @ cholesky.T
+        returns = step_returns[index] + step_volatility[index] * shocks
+        portfolio = returns @ weights.T
+
+        # Log growth keeps compounding stable; a period cannot lose more than everything
+        values = np.exp(np.cumsum(np.log1p(np.maximum(portfolio, -0.999999)), axis=1))
+        peaks = np.maximum(np.maximum.accumulate(values, axis=1), 1.0)
+        # A copy, since a view of the last step would keep the whole batch alive
+        finals.append(values[:, -1].copy())
+        drawdowns.append((1 - values / peaks).max(axis=1))
+    return np.concatenate(finals), np.concatenate(drawdowns)
+
+def _simulate_chunk(args: Tuple[Any, ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Process pool entry point"""
+    return simulate_paths(*args)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    """Process pool shared by every sweep, started on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Spawned workers, since forking a threaded server process can deadlock
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+def shutdown_pool() -> None:
+    """Stop the sweep worker processes, if any were started"""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(cancel_futures=True)
+            _pool = None
+
+def _percentiles(values: np.ndarray, digits: int) -> List[Dict[str, float]]:
+    """Reported percentiles of each column"""
+    table = np.percentile(values, BACKTEST_PERCENTILES, axis=0)
+    return [
+        {f"p{percentile}": round(float(value), digits) for percentile, value in zip(BACKTEST_PERCENTILES, column)}
+        for column in table.T
+    ]
+
+def run_backtest(
+    history: MetricsHistory,
+    allocations: Sequence[Sequence[int]],
+    horizon_days: int = 90,
+    paths: int = 10000,
+    seed: Optional[int] = None,
+    workers: int = BACKTEST_WORKERS
+) -> BacktestReport:
+    """Simulate every allocation over the same random paths and summarize the outcomes"""
+    if not allocations:
+        raise ValueError("No allocations to backtest")
+    if horizon_days <= 0 or paths <= 0:
+        raise ValueError("Horizon and path count must be positive")
+    started = time.perf_counter()
+    seed = int(np.random.SeedSequence().entropy % 2**32) if seed is None else seed
+    weights = history.weights(allocations)
+    step_fraction = history.step_seconds / SECONDS_PER_YEAR
+    step_returns = history.apy / 10000 * step_fraction
+    step_volatility = strategy_volatility(history.apy, history.risk_adjusted_returns) * np.sqrt(step_fraction)
+    horizon = max(round(horizon_days * 86400 / history.step_seconds), 1)
+
+    # Large sweeps are split by paths across processes, each with an independent random stream
+    chunks = min(workers, -(-paths // path_batch_size(horizon, max(len(STRATEGY_IDS), len(allocations)))))
+    if chunks > 1 and paths * horizon * len(allocations) >= PARALLEL_MIN_WORK:
+        sizes = np.diff(np.linspace(0, paths, chunks + 1).astype(int))
+        seeds = np.random.SeedSequence(seed).spawn(chunks)
+        results = list(_get_pool(workers).map(_simulate_chunk, [
+            (step_returns, step_volatility, weights, horizon, int(size), child) for size, child in zip(sizes, seeds)
+        ]))
+        final = np.concatenate([result[0] for result in results])
+        drawdown = np.concatenate([result[1] for result in results])
+    else:
+        chunks = 1
+        final, drawdown = simulate_paths(step_returns, step_volatility, weights, horizon, paths, seed)
+
+    years = horizon * step_fraction
+    annualized = (np.power(np.maximum(final, 0.0), 1 / years) - 1) * 10000
+    # Replaying the recorded history once, without shocks, shows what actually happened
+    historical = None
+    if history.periods > 1:
+        realized = np.exp(np.log1p(step_returns[1:] @ weights.T).sum(axis=0))
+        historical = (realized ** (1 / ((history.periods - 1) * step_fraction)) - 1) * 10000
+
+    final_percentiles = _percentiles(final, 6)
+    return_percentiles = _percentiles(annualized, 2)
+    drawdown_table = np.percentile(drawdown, (50, 95), axis=0)
+    scenarios = [
+        BacktestScenario(
+            allocation=[int(bps) for bps in allocation],
+            final_value=final_percentiles[column],
+            annualized_return=return_percentiles[column],
+            mean_final_value=round(float(final[:, column].mean()), 6),
+            probability_of_loss=round(float((final[:, column] < 1).mean()), 4),
+            max_drawdown={"p50": round(float(drawdown_table[0, column]), 6), "p95": round(float(drawdown_table[1, column]), 6)},
+            historical_return=round(float(historical[column]), 2) if historical is not None else None
+        )
+        for column, allocation in enumerate(allocations)
+    ]
+    return BacktestReport(
+        source=history.source,
+        periods=history.periods,
+        start_timestamp=int(history.timestamps[0]),
+        end_timestamp=int(history.timestamps[-1]),
+        step_seconds=history.step_seconds,
+        horizon_days=horizon_days,
+        paths=paths,
+        seed=seed,
+        workers=chunks,
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 2),
+        scenarios=scenarios
+    )
+
+def summarize_backtest(report: BacktestReport) -> str:
+    """Human-readable summary of a backtest, one line per allocation"""
+    history = f"{report.periods} recorded periods" if report.periods > 1 else "current metrics only"
+    lines = [f"Backtest over {report.horizon_days} days, {report.paths} paths per allocation ({history}, source {report.source}):"]
+    for scenario in report.scenarios:
+        split = "/".join(str(bps // 100) for bps in scenario.allocation)
+        returns = scenario.annualized_return
+        line = (
+            f"- {split}%: median annualized return {returns['p50'] / 100:.2f}% "
+            f"(5th-95th percentile {returns['p5'] / 100:.2f}% to {returns['p95'] / 100:.2f}%), "
+            f"loss probability {scenario.probability_of_loss * 100:.1f}%, "
+            f"95th percentile drawdown {scenario.max_drawdown['p95'] * 100:.2f}%"
+        )
+        if scenario.historical_return is not None:
+            line += f", historical replay {scenario.historical_return / 100:.2f}%"
+        lines.append(line)
+    return "\n".join(lines)
@@ -2,6 +2,7 @@
 Configuration settings for the DAO Treasury Management system.
 """
 
+import importlib
 import os
 from dotenv import load_dotenv
 
@@ -16,6 +17,124 @@ PRIVATE_KEY = os.getenv("AI_AGENT_PRIVATE_KEY") or os.getenv("PRIVATE_KEY", "")
 if PRIVATE_KEY.startswith('0x'):
     PRIVATE_KEY = PRIVATE_KEY[2:]
 
+# Chain configuration mapping with default RPC URLs
+CHAIN_CONFIGS = {
+    "ethereum": {
+        "default_rpc_url": "https://ethereum-sepolia-rpc.publicnode.com",
+        "explorer_url": "https://sepolia.etherscan.io/tx/",
+        "env_var": "SEPOLIA_RPC_URL",
+        "confirmations": 12,
+        "private_key_vars": ["PRIVATE_KEY"],
+        "contract_env_vars": {
+            "treasury": "ETHEREUM_TREASURY_ADDRESS",
+            "strategy": "ETHEREUM_STRATEGY_ADDRESS", 
+            "governance": "ETHEREUM_GOVERNANCE_ADDRESS",
+            "eth_token": "ETHEREUM_ETH_TOKEN_ADDRESS"
+        }
+    },
+    "zircuit": {
+        "default_rpc_url": "https://zircuit-garfield-testnet.drpc.org",
+        "explorer_url": "https://explorer.garfield-testnet.zircuit.com/tx/",
+        "env_var": "ZIRCUIT_RPC_URL",
+        "confirmations": 10,
+        "private_key_vars": ["PRIVATE_KEY"],
+        "contract_env_vars": {
+            "treasury": "ZIRCUIT_TREASURY_ADDRESS",
+            "strategy": "ZIRCUIT_STRATEGY_ADDRESS",
+            "governance": "ZIRCUIT_GOVERNANCE_ADDRESS", 
+            "eth_token": "ZIRCUIT_ETH_TOKEN_ADDRESS"
+        }
+    },
+    "flow": {
+        "default_rpc_url": "https://testnet.evm.nodes.onflow.org",
+        "explorer_url": "https://evm-testnet.flowscan.io/tx/",
+        "env_var": "FLOW_RPC_URL",
+        "confirmations": 10,
+        "private_key_vars": ["PRIVATE_KEY"],
+        "contract_env_vars": {
+            "treasury": "FLOW_TREASURY_ADDRESS",
+            "strategy": "FLOW_STRATEGY_ADDRESS",
+            "governance": "FLOW_GOVERNANCE_ADDRESS",
+            "eth_token": "FLOW_ETH_TOKEN_ADDRESS"
+        }
+    },
+    "mantle": {
+        "default_rpc_url": "https://endpoints.omniatech.io/v1/mantle/sepolia/public",
+        "explorer_url": "https://sepolia.mantlescan.xyz/tx/",
+        "env_var": "MANTLE_RPC_URL",
+        "confirmations": 10,
+        "private_key_vars": ["PRIVATE_KEY"],
+        "contract_env_vars": {
+            "treasury": "MANTLE_TREASURY_ADDRESS",
+            "strategy": "MANTLE_STRATEGY_ADDRESS",
+            "governance": "MANTLE_GOVERNANCE_ADDRESS",
+            "eth_token": "MANTLE_ETH_TOKEN_ADDRESS"
+        }
+    }
+}
+
+def get_rpc_url(chain: str) -> str:
+    """Get RPC URL for the specified chain"""
+    if chain not in CHAIN_CONFIGS:
+        raise ValueError(f"Unsupported chain: {chain}. Supported chains: {list(CHAIN_CONFIGS.keys())}")
+    
+    chain_config = CHAIN_CONFIGS[chain]
+    
+    # Override RPC URL with environment variable if available
+    rpc_url = os.getenv(chain_config["env_var"])
+    
+    # Fallback to existing ETHEREUM_RPC_URL for ethereum (backward compatibility)
+    if not rpc_url and chain == "ethereum":
+        rpc_url = os.getenv("ETHEREUM_RPC_URL")
+    
+    # Use default RPC URL if no environment override
+    if not rpc_url:
+        rpc_url = chain_config["default_rpc_url"]
+    
+    return rpc_url
+
+# Background job settings
+JOB_DB_PATH = os.getenv("JOB_DB_PATH", "jobs.sqlite")
+DEFAULT_JOB_CONCURRENCY = int(os.getenv("JOB_CONCURRENCY", "2"))
+
+def get_job_concurrency(chain: str) -> int:
+    """Get the number of jobs allowed to run at once on the specified chain"""
+    # Per-chain override, e.g. MANTLE_JOB_CONCURRENCY=1
+    return int(os.getenv(f"{chain.upper()}_JOB_CONCURRENCY", DEFAULT_JOB_CONCURRENCY))
+
+# Governance event index settings
+INDEX_DB_PATH = os.getenv("INDEX_DB_PATH", "governance_index.sqlite")
+INDEXER_ENABLED = os.getenv("INDEXER_ENABLED", "true").lower() == "true"
+INDEXER_POLL_INTERVAL = float(os.getenv("INDEXER_POLL_INTERVAL", "15"))
+# Blocks scanned back from the head when no start block is configured for a chain
+INDEXER_DEFAULT_LOOKBACK = int(os.getenv("INDEXER_DEFAULT_LOOKBACK", "50000"))
+# Blocks between snapshots of the strategy metrics kept for backtesting
+STRATEGY_METRICS_INTERVAL = int(os.getenv("STRATEGY_METRICS_INTERVAL", "300"))
+
+# Persistent LLM response cache for the analysis agents
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite")
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "2000"))
+# Seconds a cached response stays valid even when the on-chain state has not changed
+LLM_CACHE_TTL = float(os.getenv("LLM_CACHE_TTL", "86400"))
+
+# Import the AI stack (crewai, langchain) in the background at startup instead of on the first crew job
+CREW_PRELOAD = os.getenv("CREW_PRELOAD", "false").lower() == "true"
+
+def get_index_start_block(chain: str, contract: str):
+    """Get the block an event indexer starts from, or None to start near the head"""
+    # Per-chain and contract setting, e.g. ZIRCUIT_GOVERNANCE_START_BLOCK=123456 (the deployment block)
+    start_block = os.getenv(f"{chain.upper()}_{contract.upper()}_START_BLOCK")
+    return int(start_block) if start_block else None
+
+def get_confirmation_depth(chain: str) -> int:
+    """Get the number of blocks after which indexed events are treated as final on the specified chain"""
+    # Per-chain override, e.g. MANTLE_CONFIRMATIONS=20
+    confirmations = os.getenv(f"{chain.upper()}_CONFIRMATIONS")
+    if confirmations:
+        return int(confirmations)
+    return CHAIN_CONFIGS[chain]["confirmations"]
+
 def get_contract_addresses_for_chain(chain: str) -> dict:
     """Get contract addresses for the specified chain"""
     
@@ -66,8 +185,18 @@ def get_contract_addresses_for_chain(chain: str) -> dict:
         "eth_token": get_address_for_contract("eth_token")
     }
 
+# Optional "module:function" building the LLM instead of OpenAI, e.g. an offline stand-in for benchmarks
+LLM_FACTORY = os.getenv("LLM_FACTORY", "")
+
 def get_llm():
     """Get the LLM configuration"""
+    if LLM_FACTORY:
+        module_name, _, function_name = LLM_FACTORY.partition(":")
+        return getattr(importlib.import_module(module_name), function_name)()
+    return get_openai_llm()
+
+def get_openai_llm():
+    """Get the OpenAI chat model"""
     from langchain_openai import ChatOpenAI
     
     api_key = os.getenv("OPENAI_API_KEY") or os.getenv("CHAT_GPT_API_KEY")
@@ -4,23 +4,83 @@ CrewAI implementation for strategy analysis and proposal creation.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, UTC
-from typing import Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any, Tuple, Type
+from pydantic import BaseModel, ValidationError
 from web3 import Web3
 from crewai import Agent, Task, Crew, Process
-from crewai_tools import FileReadTool
 
-from .config import get_llm
-from .models import GovernanceProposal
+from .backtest import MetricsHistory
+from .crew_factory import crew_factory
+from .llm import CachedLLM
+from .models import GovernanceProposal, ProposalSubmission, StrategyRecommendation, TreasuryAssessment
+from .optimizer import optimize_allocation, proposal_allocation, summarize_allocation, summarize_frontier
+from .scoring import RISK_PROFILES
 from .services.treasury import TreasuryService
 from .services.strategy import StrategyService
 from .services.governance import GovernanceService
-from .utils import create_proposal_parameters
-from .tools import ProposalTool, ExecuteProposalTool
+from .services.llm_cache import snapshot_hash
+from .tools import BacktestTool, ProposalTool, ExecuteProposalTool
+from .utils import STRATEGY_IDS, proposal_description
 
 # Constants
 SEPOLIA_EXPLORER_URL = "https://sepolia.etherscan.io/tx/"
 
+# Repair prompts sent back to an agent whose final answer does not match its task's schema
+STRUCTURED_OUTPUT_RETRIES = int(os.getenv("STRUCTURED_OUTPUT_RETRIES", "1"))
+
+# Callback receiving crew progress events as (event name, data)
+CrewEventCallback = Callable[[str, Dict[str, Any]], None]
+
+def describe_step(step: Any) -> tuple[str, Dict[str, Any]]:
+    """Turn a CrewAI step callback payload into an event name and data"""
+    # Older CrewAI versions pass a list of (AgentAction, observation) tuples
+    if isinstance(step, list) and step:
+        step = step[-1][0] if isinstance(step[-1], tuple) else step[-1]
+    
+    tool = getattr(step, "tool", None)
+    if tool:
+        return "tool_invocation", {
+            "tool": tool,
+            "tool_input": str(getattr(step, "tool_input", "")),
+            "thought": str(getattr(step, "thought", "") or "")
+        }
+    
+    text = getattr(step, "text", None) or getattr(step, "output", None) or getattr(step, "log", None) or step
+    return "agent_step", {"text": str(text)}
+
+def extract_json(text: str) -> str:
+    """The outermost JSON object in an answer, ignoring code fences and surrounding prose"""
+    start, end = text.find("{"), text.rfind("}")
+    return text[start:end + 1] if start != -1 and end > start else text
+
+def schema_guardrail(model: Type[BaseModel], retries: int = STRUCTURED_OUTPUT_RETRIES) -> Callable[[Any], Tuple[bool, Any]]:
+    """Task guardrail validating the agent's final answer against a Pydantic model
+
+    A mismatch is sent back to the agent with the validation errors for a repair attempt. Once the
+    repairs are used up the answer is let through unvalidated, so one bad answer never fails the crew.
+    """
+    attempts = 0
+    
+    def guardrail(output: Any) -> Tuple[bool, Any]:
+        nonlocal attempts
+        attempts += 1
+        try:
+            output.pydantic = model.model_validate_json(extract_json(output.raw or ""))
+            return True, output
+        except ValidationError as e:
+            if attempts > retries:
+                print(f"⚠️ {model.__name__} output did not match its schema, continuing without it")
+                return True, output
+            errors = "; ".join(f"{'.'.join(str(loc) for loc in error['loc']) or 'answer'}: {error['msg']}" for error in e.errors())
+            return False, (
+                f"The final answer must be a single JSON object matching this schema: "
+                f"{json.dumps(model.model_json_schema())}. Problems: {errors}"
+            )
+    
+    return guardrail
+
 class ProposalCrew:
     """Crew for analyzing strategies and creating proposals"""
     
@@ -33,7 +93,10 @@ class ProposalCrew:
         strategy_address: str = "",
         governance_address: str = "",
         eth_token_address: str = "",
-        explorer_url: str = SEPOLIA_EXPLORER_URL
+        explorer_url: str = SEPOLIA_EXPLORER_URL,
+        on_event: Optional[CrewEventCallback] = None,
+        metrics_history: Optional[MetricsHistory] = None,
+        description: Optional[str] = None
     ):
         self.treasury_service = treasury_service
         self.strategy_service = strategy_service
@@ -43,9 +106,11 @@ class ProposalCrew:
         self.governance_address = governance_address
         self.eth_token_address = eth_token_address
         self.explorer_url = explorer_url
+        self.on_event = on_event
+        self.description = proposal_description(description)
         
-        # Get LLM
-        self.llm = get_llm()
+        # Shared LLM client; analysis prompts repeat until the on-chain state changes, so their answers are cached
+        self.llm = crew_factory.analysis_llm()
         
         # Create proposal tool if governance service is available
         self.proposal_tool = None
@@ -55,50 +120,39 @@ class ProposalCrew:
                 treasury_address=self.treasury_address,
                 strategy_address=self.strategy_address,
                 governance_address=self.governance_address,
-                eth_token_address=self.eth_token_address
+                eth_token_address=self.eth_token_address,
+                on_event=self.on_event,
+                governance_description=self.description
             )
+        
+        # Backtests replay the recorded metrics, or the current ones once fetched if there are none
+        self.backtest_tool = BacktestTool(history=metrics_history)
+    
+    def _emit(self, event: str, data: Dict[str, Any]) -> None:
+        """Send a progress event to the listener, if any"""
+        if self.on_event:
+            self.on_event(event, data)
+    
+    def _on_task_complete(self, task_output: Any) -> None:
+        """CrewAI task callback forwarding each agent's task output"""
+        self._emit("task_output", {
+            "agent": str(getattr(task_output, "agent", "")),
+            "description": str(getattr(task_output, "description", "")).strip()[:200],
+            "output": str(getattr(task_output, "raw", task_output))
+        })
+    
+    def _on_step(self, step: Any) -> None:
+        """CrewAI step callback forwarding agent steps and tool invocations"""
+        event, data = describe_step(step)
+        self._emit(event, data)
     
     def _create_agents(self) -> tuple[Agent, Agent, Agent]:
         """Create the three agents needed for the crew"""
-        treasury_agent = Agent(
-            role="Treasury Analyst",
-            goal="Analyze current treasury balances and financial position",
-            backstory="""You are an expert treasury analyst with deep knowledge of DeFi protocols and 
-            financial risk management. You specialize in analyzing treasury positions and understanding 
-            the current financial state of DAOs.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm,
-            tools=[FileReadTool()]
-        )
-        
-        strategy_agent = Agent(
-            role="Strategy Evaluator",
-            goal="Evaluate available investment strategies and their risk-return profiles",
-            backstory="""You are a DeFi strategy expert with years of experience in yield farming, 
-            liquidity provision, and risk assessment. You understand the nuances of different 
-            investment strategies and can evaluate their suitability based on market conditions 
-            and treasury requirements.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm,
-            tools=[FileReadTool()]
+        return (
+            crew_factory.agent("treasury", self.llm, []),
+            crew_factory.agent("strategy", self.llm, [self.backtest_tool]),
+            crew_factory.agent("proposal", self.llm, [self.backtest_tool, self.proposal_tool])
         )
-        
-        proposal_agent = Agent(
-            role="Governance Proposal Creator",
-            goal="Create optimal governance proposals based on treasury analysis and strategy evaluation",
-            backstory="""You are a governance expert who creates clear, actionable proposals for DAOs. 
-            You understand the technical requirements of governance systems and can translate 
-            strategic decisions into executable proposals. You always provide clear reasoning 
-            for your recommendations.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm,
-            tools=[FileReadTool(), self.proposal_tool] if self.proposal_tool else [FileReadTool()]
-        )
-        
-        return treasury_agent, strategy_agent, proposal_agent
     
     def _create_tasks(self, treasury_info: str, strategy_info: str, agents: tuple[Agent, Agent, Agent]) -> list[Task]:
         """Create the tasks for the crew"""
@@ -125,7 +179,11 @@ class ProposalCrew:
             }}
             """,
             agent=treasury_agent,
-            expected_output="JSON analysis of treasury position"
+            expected_output="JSON analysis of treasury position",
+            guardrail=schema_guardrail(TreasuryAssessment),
+            guardrail_max_retries=STRUCTURED_OUTPUT_RETRIES,
+            # Independent of the strategy evaluation, so the two analyses run side by side
+            async_execution=True
         )
         
         strategy_task = Task(
@@ -139,18 +197,25 @@ class ProposalCrew:
             Available Strategies:
             {strategy_info}
             
+            Use the backtest_tool to check how the strategies and any split you consider would have
+            performed, and cite its return percentiles and loss probability as evidence.
+            
             Provide a comprehensive evaluation in JSON format with the following structure:
             {{
-                "recommended_strategy": "strategy_id (1, 2, or 3)",
+                "recommended_strategy": 1, 2 or 3,
+                "allocation": "optional weights for strategies 1, 2 and 3 when a split is better, e.g. [0.5, 0.3, 0.2], else null",
                 "reasoning": "detailed explanation of why this strategy is best",
                 "expected_apy": "percentage",
                 "risk_level": "low/medium/high",
                 "liquidity_considerations": "text about withdrawal liquidity",
-                "alternative_strategies": "list of other strategies considered"
+                "alternative_strategies": ["other strategies considered"]
             }}
             """,
             agent=strategy_agent,
-            expected_output="JSON evaluation of strategies with recommendation"
+            expected_output="JSON evaluation of strategies with recommendation",
+            guardrail=schema_guardrail(StrategyRecommendation),
+            guardrail_max_retries=STRUCTURED_OUTPUT_RETRIES,
+            async_execution=True
         )
         
         proposal_task = Task(
@@ -158,15 +223,17 @@ class ProposalCrew:
             Create and submit a governance proposal based on the treasury analysis and strategy recommendation.
             
             Based on the treasury analysis and strategy evaluation:
-            1. Choose the best strategy (1, 2, or 3) based on the analysis
+            1. Choose the best strategy (1, 2, or 3) based on the analysis, or a split across several
+               (the portfolio optimizer's allocation fields can be passed to the tool as they are)
             2. Create a detailed proposal explaining the rationale
-            3. Use the proposal_tool to submit the proposal to the blockchain
+            3. Use the proposal_tool to submit the proposal to the blockchain; a split is submitted as one proposal
             
             You must use the proposal_tool with a JSON string containing:
             {{
                 "proposal_title": "title for the proposal",
-                "proposal_description": ${os.getenv("DESCRIPTION")},
+                "proposal_description": {json.dumps(self.description)},
                 "strategy_id": "chosen strategy id (1, 2, or 3)",
+                "allocation": "optional weights for strategies 1, 2 and 3, e.g. [0.5, 0.3, 0.2]; omit to put everything in strategy_id",
                 "expected_profit": "estimated profit in USD",
                 "risk_assessment": "risk analysis",
                 "execution_details": "technical details for execution",
@@ -177,49 +244,164 @@ class ProposalCrew:
             - The reasoning field must be comprehensive and explain the decision-making process
             - Include specific details about treasury health, market conditions, and strategy benefits
             - You MUST use the proposal_tool to actually submit the proposal. Do not just return JSON.
+            - After the tool returns, answer with JSON: {{"submitted": true if the tool reported SUCCESS,
+              "strategy_id": the funded strategy (the largest share of a split), "reasoning": the submitted
+              reasoning, "error": the tool's error message or null}}
             """,
             agent=proposal_agent,
+            # Synchronous, so it starts once both analyses have finished
             context=[treasury_task, strategy_task],
             tools=[self.proposal_tool] if self.proposal_tool else None,
-            expected_output="Result of proposal submission with transaction hash or error message"
+            expected_output="JSON result of the proposal submission",
+            guardrail=schema_guardrail(ProposalSubmission),
+            guardrail_max_retries=STRUCTURED_OUTPUT_RETRIES
         )
         
         return [treasury_task, strategy_task, proposal_task]
     
+    def _gather_info(self) -> tuple[str, str]:
+        """Fetch on-chain treasury and strategy data and format it for the agents"""
+        # Treasury and strategy reads are independent, so both go out at once
+        print("📊 TREASURY AGENT: Analyzing treasury balances...")
+        print("📈 STRATEGY AGENT: Analyzing available strategies...")
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="crew-fetch") as executor:
+            treasury_future = executor.submit(self.treasury_service.get_treasury_data, self.treasury_address, self.eth_token_address)
+            strategies_future = executor.submit(self.strategy_service.get_all_strategies, self.strategy_address)
+            treasury_data = treasury_future.result()
+            self._emit("treasury_data", treasury_data.model_dump())
+            strategies = strategies_future.result()
+        self._emit("strategies", {"strategies": [strategy.model_dump() for strategy in strategies]})
+        self.backtest_tool.strategies = strategies
+        
+        # Cached answers are only reused for the exact state this deployment is in now
+        if isinstance(self.llm, CachedLLM):
+            self.llm.set_snapshot(
+                f"{self.explorer_url}{self.treasury_address}",
+                snapshot_hash(treasury_data.model_dump(), [strategy.model_dump() for strategy in strategies])
+            )
+        
+        # Prepare data for agents
+        treasury_info = f"""
+        Treasury Analysis:
+        - Treasury Address: {treasury_data.treasury_address}
+        - ETH Balance: {treasury_data.eth_balance / 1e18:.4f} ETH
+        - {treasury_data.eth_token_symbol} Balance: {treasury_data.eth_token_balance / 1e18:.2f}
+        - Total Value USD: ${treasury_data.total_value_usd:,.2f}
+        """
+        
+        strategy_info = "Available Strategies:\n"
+        for strategy in strategies:
+            strategy_info += f"""
+            Strategy {strategy.strategy_id}:
+            - APY: {strategy.apy / 100:.2f}%
+            - TVL: ${strategy.tvl / 1e18:,.0f}
+            - Utilization Rate: {strategy.utilization_rate / 100:.2f}%
+            - Risk-Adjusted Returns: {strategy.risk_adjusted_returns / 100:.2f}
+            - Withdrawal Liquidity: {strategy.withdrawal_liquidity / 100:.2f}%
+            - Description: {strategy.description}
+            """
+        
+        # Precomputed optimal splits so the agents compare allocations without doing the arithmetic
+        if strategies:
+            optimized = optimize_allocation(strategies, treasury_data)
+            strategy_info += "\nPortfolio optimizer (mean-variance, per risk profile):\n"
+            for result in optimized:
+                strategy_info += f"- {summarize_allocation(result)} Allocation field: {json.dumps(proposal_allocation(result))}\n"
+            strategy_info += "Efficient frontier, Strategy 1/2/3 weights (moderate profile limits):\n"
+            strategy_info += summarize_frontier(optimized[list(RISK_PROFILES).index("moderate")]) + "\n"
+        
+        return treasury_info, strategy_info
+    
+    @staticmethod
+    def _selection(strategy_id: int, allocation: Optional[List[int]]) -> str:
+        """The decided proposal in words: a single strategy, or a split and its largest share"""
+        if allocation and max(allocation) < 10000:
+            split = ", ".join(f"Strategy {strategy} {bps / 100:g}%" for strategy, bps in zip(STRATEGY_IDS, allocation) if bps)
+            return f"The selected allocation splits the treasury as {split}, the largest share going to Strategy {strategy_id}."
+        return f"The selected strategy is Strategy {strategy_id}."
+    
+    def _kickoff_single(self, agent: Agent, task: Task) -> Any:
+        """Run one task in a crew of its own"""
+        task.async_execution = False
+        crew = Crew(
+            agents=[agent],
+            tasks=[task],
+            verbose=True,
+            process=Process.sequential,
+            task_callback=self._on_task_complete if self.on_event else None,
+            step_callback=self._on_step if self.on_event else None
+        )
+        return crew.kickoff()
+    
+    def run_explanation(self, strategy_id: int, ranking_summary: str, allocation: Optional[List[int]] = None) -> Dict[str, Any]:
+        """Run only the treasury and strategy agents to explain an already selected strategy or split"""
+        print("🧠 CAPITALIST CREW - Explaining deterministic strategy selection")
+        print("=" * 60)
+        
+        treasury_info, strategy_info = self._gather_info()
+        strategy_info += f"""
+            Deterministic ranking (already decided, explain it rather than re-deciding):
+            {ranking_summary}
+            {self._selection(strategy_id, allocation)}
+            """
+        
+        treasury_agent, strategy_agent, proposal_agent = self._create_agents()
+        treasury_task, strategy_task, _ = self._create_tasks(
+            treasury_info, strategy_info, (treasury_agent, strategy_agent, proposal_agent)
+        )
+        
+        # A crew waits for pending async tasks before any synchronous one, and may not end with two
+        # async tasks, so the two analyses run as single-task crews side by side instead
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="crew-explain") as executor:
+            treasury_future = executor.submit(self._kickoff_single, treasury_agent, treasury_task)
+            strategy_future = executor.submit(self._kickoff_single, strategy_agent, strategy_task)
+            results = [treasury_future.result(), strategy_future.result()]
+        
+        # The strategy agent's output is the explanation; keep both analyses as the full output
+        task_outputs = [str(result) for result in results]
+        return {
+            "final_output": "\n\n".join(task_outputs),
+            "reasoning": task_outputs[1]
+        }
+    
+    @staticmethod
+    def _structured_output(task: Task, model: type) -> Optional[Any]:
+        """A task's validated output model, or None if the agent's answer never matched the schema"""
+        output = task.output
+        if output is None:
+            return None
+        return output.pydantic if isinstance(output.pydantic, model) else None
+    
+    @staticmethod
+    def _compose_reasoning(
+        treasury_assessment: Optional[TreasuryAssessment],
+        recommendation: Optional[StrategyRecommendation],
+        submission: Optional[ProposalSubmission]
+    ) -> str:
+        """Combine the treasury and strategy analyses into the proposal reasoning"""
+        reasoning_parts = []
+        if treasury_assessment:
+            reasoning_parts.append(
+                f"Treasury health: {treasury_assessment.treasury_health}, "
+                f"risk tolerance: {treasury_assessment.risk_tolerance}, "
+                f"market conditions: {treasury_assessment.market_conditions}"
+            )
+        if recommendation:
+            reasoning_parts.append(f"{recommendation.reasoning.rstrip('.')} with {recommendation.risk_level} risk level")
+        elif submission:
+            reasoning_parts.append(submission.reasoning.rstrip("."))
+        
+        if not reasoning_parts:
+            return "Strategy selection based on AI analysis"
+        return ". ".join(reasoning_parts) + "."
+    
     def run_analysis(self) -> Dict[str, Any]:
         """Run the crew analysis and return the results"""
         print("🤖 CAPITALIST CREW - AI-Driven Treasury Management")
         print("=" * 60)
         
         try:
-            # Get treasury data
-            print("📊 TREASURY AGENT: Analyzing treasury balances...")
-            treasury_data = self.treasury_service.get_treasury_data(self.treasury_address, self.eth_token_address)
-            
-            # Get strategy data
-            print("📈 STRATEGY AGENT: Analyzing available strategies...")
-            strategies = self.strategy_service.get_all_strategies(self.strategy_address)
-            
-            # Prepare data for agents
-            treasury_info = f"""
-            Treasury Analysis:
-            - Treasury Address: {treasury_data.treasury_address}
-            - ETH Balance: {treasury_data.eth_balance / 1e18:.4f} ETH
-            - {treasury_data.eth_token_symbol} Balance: {treasury_data.eth_token_balance / 1e18:.2f}
-            - Total Value USD: ${treasury_data.total_value_usd:,.2f}
-            """
-            
-            strategy_info = "Available Strategies:\n"
-            for strategy in strategies:
-                strategy_info += f"""
-                Strategy {strategy.strategy_id}:
-                - APY: {strategy.apy / 100:.2f}%
-                - TVL: ${strategy.tvl / 1e18:,.0f}
-                - Utilization Rate: {strategy.utilization_rate / 100:.2f}%
-                - Risk-Adjusted Returns: {strategy.risk_adjusted_returns / 100:.2f}
-                - Withdrawal Liquidity: {strategy.withdrawal_liquidity / 100:.2f}%
-                - Description: {strategy.description}
-                """
+            treasury_info, strategy_info = self._gather_info()
             
             # Create and run the crew
             agents = self._create_agents()
@@ -229,148 +411,51 @@ class ProposalCrew:
                 agents=list(agents),
                 tasks=tasks,
                 verbose=True,
-                process=Process.sequential
+                process=Process.sequential,
+                task_callback=self._on_task_complete if self.on_event else None,
+                step_callback=self._on_step if self.on_event else None
             )
             
             print("🚀 Starting AI Crew Analysis...")
             result = crew.kickoff()
             
-            # Parse the results - the tool should have handled the proposal creation
-            result_str = str(result)
-            
-            # Extract detailed task outputs from the crew result
-            # The crew result contains outputs from all three agents
-            tasks_outputs = []
-            if hasattr(result, 'tasks_output') and result.tasks_output:
-                for task_output in result.tasks_output:
-                    tasks_outputs.append(str(task_output.raw))
-            
-            # Extract transaction hash from the result if present
-            tx_hash = None
-            if "SUCCESS: Proposal submitted with transaction hash:" in result_str:
-                # Extract transaction hash from the success message
-                import re
-                hash_match = re.search(r'0x[a-fA-F0-9]{64}', result_str)
-                if hash_match:
-                    tx_hash = hash_match.group()
-                    print(f"✅ Proposal submitted successfully!")
-                    print(f"📊 Transaction Hash: {tx_hash}")
-                    print(f"🔍 View on Explorer: {self.explorer_url}{tx_hash}")
-            elif "ERROR:" in result_str:
+            # Each task's final answer was validated against its schema when it finished
+            treasury_assessment = self._structured_output(tasks[0], TreasuryAssessment)
+            recommendation = self._structured_output(tasks[1], StrategyRecommendation)
+            submission = self._structured_output(tasks[2], ProposalSubmission)
+            
+            # The proposal tool records what it actually submitted, which outranks anything the agent says
+            tx_hash = self.proposal_tool.last_tx_hash if self.proposal_tool else None
+            if tx_hash:
+                print(f"✅ Proposal submitted successfully!")
+                print(f"📊 Transaction Hash: {tx_hash}")
+                print(f"🔍 View on Explorer: {self.explorer_url}{tx_hash}")
+            else:
                 print("❌ Failed to submit proposal:")
-                print(result_str)
-            
-            # Extract detailed reasoning from the AI analysis
-            reasoning = "Strategy selection based on AI analysis"  # Default fallback
-            recommended_strategy_id = 1  # Default fallback
-            
-            import re
+                print(submission.error if submission and submission.error else str(result))
             
-            # First, extract strategy ID from any of the outputs
-            all_content = result_str + " " + " ".join(tasks_outputs)
-            strategy_match = re.search(r'strategy\s*(\d+)', all_content.lower())
-            if strategy_match:
-                recommended_strategy_id = int(strategy_match.group(1))
-                if recommended_strategy_id not in [1, 2, 3]:
-                    recommended_strategy_id = 1
-            
-            # Extract reasoning from individual task outputs (treasury and strategy analysis)
-            treasury_analysis = ""
-            strategy_analysis = ""
-            
-            if len(tasks_outputs) >= 2:
-                # First task is treasury analysis
-                treasury_output = tasks_outputs[0] if tasks_outputs else ""
-                
-                # Extract treasury insights
-                treasury_patterns = [
-                    r'"treasury_health"\s*:\s*"([^"]+)"',
-                    r'"risk_tolerance"\s*:\s*"([^"]+)"', 
-                    r'"market_conditions"\s*:\s*"([^"]+)"',
-                    r'"analysis_summary"\s*:\s*"([^"]+)"'
-                ]
-                
-                treasury_insights = []
-                for pattern in treasury_patterns:
-                    match = re.search(pattern, treasury_output)
-                    if match:
-                        treasury_insights.append(match.group(1))
-                
-                if treasury_insights:
-                    treasury_analysis = f"Treasury health: {treasury_insights[0] if treasury_insights else 'assessed'}"
-                    if len(treasury_insights) > 1:
-                        treasury_analysis += f", risk tolerance: {treasury_insights[1]}"
-                    if len(treasury_insights) > 2:
-                        treasury_analysis += f", market conditions: {treasury_insights[2]}"
-                
-                # Second task is strategy analysis
-                strategy_output = tasks_outputs[1] if len(tasks_outputs) > 1 else ""
-                
-                # Extract strategy insights
-                strategy_patterns = [
-                    r'"recommended_strategy"\s*:\s*"([^"]+)"',
-                    r'"reasoning"\s*:\s*"([^"]+)"',
-                    r'"risk_level"\s*:\s*"([^"]+)"',
-                    r'"expected_apy"\s*:\s*"([^"]+)"'
-                ]
-                
-                strategy_insights = []
-                for pattern in strategy_patterns:
-                    match = re.search(pattern, strategy_output)
-                    if match:
-                        strategy_insights.append(match.group(1))
-                
-                if strategy_insights:
-                    if len(strategy_insights) > 1:
-                        strategy_analysis = strategy_insights[1]  # Use the reasoning field
-                    else:
-                        strategy_analysis = f"Strategy {strategy_insights[0]} recommended"
-                    
-                    if len(strategy_insights) > 2:
-                        strategy_analysis += f" with {strategy_insights[2]} risk level"
-            
-            # Combine treasury and strategy analysis for comprehensive reasoning
-            reasoning_parts = []
-            if treasury_analysis:
-                reasoning_parts.append(treasury_analysis)
-            if strategy_analysis and len(strategy_analysis) > 30:
-                reasoning_parts.append(strategy_analysis)
-            
-            if reasoning_parts:
-                reasoning = ". ".join(reasoning_parts)
-                if not reasoning.endswith('.'):
-                    reasoning += '.'
+            recommended_strategy_id = (
+                (self.proposal_tool.last_strategy_id if self.proposal_tool and tx_hash else None)
+                or (submission.strategy_id if submission else None)
+                or (recommendation.recommended_strategy if recommendation else None)
+                or 1
+            )
+            reasoning = self._compose_reasoning(treasury_assessment, recommendation, submission)
             
-            # Fallback: extract any substantial reasoning from the outputs
-            if len(reasoning) < 80:
-                # Look for substantial sentences that explain the decision
-                all_outputs_text = " ".join(tasks_outputs)
-                
-                # Extract sentences that contain key reasoning words
-                reasoning_sentences = re.findall(
-                    r'[A-Z][^\.]*(?:because|due to|given|selected|recommended|chosen|analysis|assessment)[^\.]*\.',
-                    all_outputs_text
-                )
-                
-                # Filter out tool-related sentences
-                filtered_sentences = [
-                    sentence.strip() for sentence in reasoning_sentences
-                    if not any(word in sentence.lower() for word in ['tool', 'error', 'validation', 'input', 'transaction', 'hash'])
-                    and len(sentence) > 40
-                ]
-                
-                if filtered_sentences:
-                    reasoning = " ".join(filtered_sentences[:3])  # Take first 3 relevant sentences
-                        
             # Set description to hardcoded value
             # description = "Investing strategy1"
-            description = os.getenv("DESCRIPTION")
+            description = self.description
+            
+            # Split the submitted proposal actually used, needed again to execute it
+            allocation = self.proposal_tool.last_allocation if self.proposal_tool and tx_hash else None
             
             # Create the response
             response = {
                 "timestamp": datetime.now(UTC).isoformat(),
+                "tx_hash": tx_hash,
                 "tx_url": f"{self.explorer_url}{tx_hash}" if tx_hash else None,
                 "strategy_id": recommended_strategy_id,
+                "allocation": allocation,
                 "reasoning": reasoning,
                 "description": description,
                 "ai_analysis": {
@@ -378,7 +463,9 @@ class ProposalCrew:
                     "strategy_recommendation": {
                         "strategy_id": recommended_strategy_id,
                         "reasoning": reasoning
-                    }
+                    },
+                    "treasury_assessment": treasury_assessment.model_dump() if treasury_assessment else None,
+                    "strategy_evaluation": recommendation.model_dump() if recommendation else None
                 }
             }
             
@@ -399,17 +486,26 @@ class ExecutionCrew:
         strategy_address: str = "",
         governance_address: str = "",
         eth_token_address: str = "",
-        explorer_url: str = SEPOLIA_EXPLORER_URL
+        explorer_url: str = SEPOLIA_EXPLORER_URL,
+        allocation: Optional[List[int]] = None,
+        proposal_actions: Optional[Dict[str, Any]] = None,
+        description: Optional[str] = None
     ):
+        if not allocation and not proposal_actions:
+            raise ValueError("An allocation or the proposal's actions are required to execute it")
         self.governance_service = governance_service
         self.treasury_address = treasury_address
         self.strategy_address = strategy_address
         self.governance_address = governance_address
         self.eth_token_address = eth_token_address
         self.explorer_url = explorer_url
+        # Basis points per strategy the proposal was created with, or the exact actions of an indexed proposal
+        self.allocation = allocation
+        self.proposal_actions = proposal_actions
+        self.description = description
         
-        # Get LLM
-        self.llm = get_llm()
+        # Shared LLM client, uncached: every execution sends a transaction
+        self.llm = crew_factory.llm()
         
         # Create execution tool if governance service is available
         self.execute_tool = None
@@ -419,23 +515,21 @@ class ExecutionCrew:
                 treasury_address=self.treasury_address,
                 strategy_address=self.strategy_address,
                 governance_address=self.governance_address,
-                eth_token_address=self.eth_token_address
+                eth_token_address=self.eth_token_address,
+                proposal_actions=self.proposal_actions,
+                governance_description=self.description
             )
     
     def _create_execution_agent(self) -> Agent:
         """Create the execution agent"""
-        execution_agent = Agent(
-            role="Proposal Executor",
-            goal="Execute governance proposals that have been approved by the DAO",
-            backstory="""You are a proposal execution specialist who handles the technical 
-            execution of approved governance proposals. You ensure that proposals are 
-            executed correctly and safely, following all necessary protocols.""",
-            verbose=True,
-            allow_delegation=False,
-            llm=self.llm,
-            tools=[self.execute_tool] if self.execute_tool else []
-        )
-        return execution_agent
+        return crew_factory.agent("execution", self.llm, [self.execute_tool], file_access=False)
+    
+    def _tool_input(self) -> Dict[str, Any]:
+        """Input the agent passes to the execute_proposal_tool"""
+        if self.proposal_actions:
+            # The tool already holds the indexed actions
+            return {"proposal_id": self.proposal_actions["proposal_id"], "reasoning": "Executing approved governance proposal"}
+        return {"allocation": self.allocation, "reasoning": "Executing approved governance proposal"}
     
     def _create_execution_task(self, agent: Agent) -> Task:
         """Create the execution task"""
@@ -446,7 +540,7 @@ class ExecutionCrew:
             IMPORTANT: You must use the execute_proposal_tool to execute the proposal.
             
             Call the execute_proposal_tool with this exact JSON:
-            {{"strategy_id": "1", "reasoning": "Executing approved governance proposal for Strategy 1"}}
+            {json.dumps(self._tool_input())}
             
             The tool will handle all the technical details including:
             - Using the correct proposal parameters
@@ -482,30 +576,26 @@ class ExecutionCrew:
             print("🚀 Starting Proposal Execution...")
             result = crew.kickoff()
             
-            # Parse the results
             result_str = str(result)
             
-            # Extract transaction hash from the result if present
-            tx_hash = None
-            if "SUCCESS: Proposal executed with transaction hash:" in result_str:
-                # Extract transaction hash from the success message
-                import re
-                hash_match = re.search(r'0x[a-fA-F0-9]{64}', result_str)
-                if hash_match:
-                    tx_hash = hash_match.group()
-                    print(f"✅ Proposal executed successfully!")
-                    print(f"📊 Transaction Hash: {tx_hash}")
-                    print(f"🔍 View on Explorer: {self.explorer_url}{tx_hash}")
-            elif "ERROR:" in result_str:
+            # The tool records the transaction it sent, so nothing is scraped from the agent's answer
+            tx_hash = self.execute_tool.last_tx_hash if self.execute_tool else None
+            if tx_hash:
+                print(f"✅ Proposal executed successfully!")
+                print(f"📊 Transaction Hash: {tx_hash}")
+                print(f"🔍 View on Explorer: {self.explorer_url}{tx_hash}")
+            else:
                 print("❌ Failed to execute proposal:")
                 print(result_str)
             
             # Create the response
             response = {
                 "timestamp": datetime.now(UTC).isoformat(),
+                "tx_hash": tx_hash,
                 "tx_url": f"{self.explorer_url}{tx_hash}" if tx_hash else None,
                 "execution_result": result_str,
-                "success": tx_hash is not None
+                # Unknown until the receipt tracker sees the transaction mined
+                "success": None if tx_hash else False
             }
             
             return response
@@ -0,0 +1,94 @@
+"""
+Process-wide LLM client and agent templates shared by every crew, so a request only builds what is
+specific to it: the tasks, the chain-bound tools and a snapshot-bound cache view of the LLM.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from crewai import Agent
+from crewai.llms.base_llm import BaseLLM
+from crewai.utilities.llm_utils import create_llm
+from crewai_tools import FileReadTool
+
+from .config import LLM_CACHE_ENABLED, get_llm
+from .llm import cached_llm
+
+# Static part of each agent; the LLM and the request's tools are added when the agent is built
+AGENT_TEMPLATES: Dict[str, Dict[str, Any]] = {
+    "treasury": {
+        "role": "Treasury Analyst",
+        "goal": "Analyze current treasury balances and financial position",
+        "backstory": """You are an expert treasury analyst with deep knowledge of DeFi protocols and
+            financial risk management. You specialize in analyzing treasury positions and understanding
+            the current financial state of DAOs."""
+    },
+    "strategy": {
+        "role": "Strategy Evaluator",
+        "goal": "Evaluate available investment strategies and their risk-return profiles",
+        "backstory": """You are a DeFi strategy expert with years of experience in yield farming,
+            liquidity provision, and risk assessment. You understand the nuances of different
+            investment strategies and can evaluate their suitability based on market conditions
+            and treasury requirements."""
+    },
+    "proposal": {
+        "role": "Governance Proposal Creator",
+        "goal": "Create optimal governance proposals based on treasury analysis and strategy evaluation",
+        "backstory": """You are a governance expert who creates clear, actionable proposals for DAOs.
+            You understand the technical requirements of governance systems and can translate
+            strategic decisions into executable proposals. You always provide clear reasoning
+            for your recommendations."""
+    },
+    "execution": {
+        "role": "Proposal Executor",
+        "goal": "Execute governance proposals that have been approved by the DAO",
+        "backstory": """You are a proposal execution specialist who handles the technical
+            execution of approved governance proposals. You ensure that proposals are
+            executed correctly and safely, following all necessary protocols."""
+    }
+}
+
+class CrewFactory:
+    """Builds the LLM client once per process and agents from the templates per request"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._llm: Optional[BaseLLM] = None
+        # Stateless, so one instance serves every agent
+        self.file_read_tool = FileReadTool()
+
+    def llm(self) -> BaseLLM:
+        """Shared CrewAI LLM built from config.get_llm on first use"""
+        with self._lock:
+            if self._llm is None:
+                # CrewAI converts the LangChain client into its own, which is the expensive part
+                self._llm = create_llm(get_llm())
+            return self._llm
+
+    def analysis_llm(self) -> BaseLLM:
+        """LLM for one analysis run: a cache view of the shared client when caching is enabled
+
+        The view carries the run's on-chain snapshot, so concurrent runs each get their own.
+        """
+        llm = self.llm()
+        if not LLM_CACHE_ENABLED:
+            return llm
+        return cached_llm(llm)
+
+    def agent(self, template: str, llm: BaseLLM, tools: List[Any], file_access: bool = True) -> Agent:
+        """Agent from a template with the given LLM and request tools"""
+        return Agent(
+            **AGENT_TEMPLATES[template],
+            verbose=True,
+            allow_delegation=False,
+            llm=llm,
+            tools=([self.file_read_tool] if file_access else []) + [tool for tool in tools if tool is not None]
+        )
+
+    def reset(self) -> None:
+        """Drop the shared client, e.g. after the API key changed"""
+        with self._lock:
+            self._llm = None
+
+# Process-wide factory used by every crew
+crew_factory = CrewFactory()
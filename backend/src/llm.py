@@ -0,0 +1,98 @@
+"""
+CrewAI LLM wrapper serving repeated prompts from the persistent LLM cache.
+"""
+
+from typing import Any, Optional
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from crewai.utilities.llm_utils import create_llm
+from pydantic import Field
+
+from .services.llm_cache import LLMCache, cache_key, get_llm_cache
+
+class CachedLLM(BaseLLM):
+    """Delegates to another CrewAI LLM, answering from the cache when the same prompt was seen for the same snapshot
+
+    Only text answers are cached. Native tool calls and calls that run tools inside the LLM go
+    through every time, so a cache hit never skips a side effect.
+    """
+
+    llm_type: str = "cached"
+    inner: BaseLLM = Field(description="LLM that answers cache misses")
+    cache: Any = Field(description="LLMCache holding the responses")
+    scope: str = Field("", description="Deployment the prompts describe, e.g. the chain's treasury")
+    snapshot: Optional[str] = Field(None, description="Digest of the on-chain state the prompts were built from")
+
+    def set_snapshot(self, scope: str, snapshot: str) -> None:
+        """Bind later calls to a snapshot, dropping responses cached for the scope's previous one"""
+        self.scope = scope
+        self.snapshot = snapshot
+        dropped = self.cache.set_snapshot(scope, snapshot)
+        if dropped:
+            print(f"🧹 On-chain state changed, dropped {dropped} cached LLM responses")
+
+    def _settings(self, tools: Any, response_model: Any) -> dict:
+        """Everything besides the prompt that changes the answer"""
+        return {
+            "temperature": self.inner.temperature,
+            "max_tokens": self.inner.max_tokens,
+            "stop": sorted(self.stop_sequences),
+            "tools": tools,
+            "response_model": response_model.__name__ if response_model else None
+        }
+
+    def call(
+        self,
+        messages: Any,
+        tools: Any = None,
+        callbacks: Any = None,
+        available_functions: Any = None,
+        from_task: Any = None,
+        from_agent: Any = None,
+        response_model: Any = None
+    ) -> Any:
+        key = None
+        if not available_functions:
+            key = cache_key(self.scope, self.snapshot, self.inner.model, self._settings(tools, response_model), messages)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        # The executor scopes extra stop words to this wrapper, so hand them on to the inner LLM
+        with call_stop_override(self.inner, self.stop_sequences):
+            response = self.inner.call(
+                messages,
+                tools=tools,
+                callbacks=callbacks,
+                available_functions=available_functions,
+                from_task=from_task,
+                from_agent=from_agent,
+                response_model=response_model
+            )
+
+        if key is not None and isinstance(response, str) and response.strip():
+            self.cache.set(key, response, self.scope, self.snapshot)
+        return response
+
+    def supports_function_calling(self) -> bool:
+        return self.inner.supports_function_calling()
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def supports_multimodal(self) -> bool:
+        return self.inner.supports_multimodal()
+
+def cached_llm(llm: Any, cache: Optional[LLMCache] = None) -> CachedLLM:
+    """Wrap an LLM, e.g. the ChatOpenAI from config.get_llm, in the response cache"""
+    inner = create_llm(llm)
+    return CachedLLM(
+        model=inner.model,
+        temperature=inner.temperature,
+        stop=list(inner.stop),
+        inner=inner,
+        cache=cache or get_llm_cache()
+    )
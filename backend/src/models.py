@@ -2,8 +2,8 @@
 Data models for the DAO Treasury Management system.
 """
 
-from typing import List
-from pydantic import BaseModel, Field, ConfigDict
+from typing import Any, Dict, List, Optional
+from pydantic import BaseModel, Field, ConfigDict, field_validator
 
 class TreasuryBalance(BaseModel):
     """Treasury balance information"""
@@ -123,4 +123,210 @@ class GovernanceProposal(BaseModel):
                 "reasoning": "Strategy 1 selected based on optimal risk-adjusted returns"
             }
         }
-    ) 
\ No newline at end of file
+    )
+
+class RiskProfile(BaseModel):
+    """Weights and constraints used to rank strategies deterministically"""
+    name: str = Field(description="Profile name")
+    apy_weight: float = Field(description="Weight of APY in the score")
+    risk_adjusted_returns_weight: float = Field(description="Weight of risk-adjusted returns in the score")
+    withdrawal_liquidity_weight: float = Field(description="Weight of withdrawal liquidity in the score")
+    utilization_weight: float = Field(description="Weight of low utilization (spare capacity) in the score")
+    min_withdrawal_liquidity: int = Field(0, description="Minimum withdrawal liquidity in basis points")
+    max_allocation: int = Field(10000, description="Largest share of a split allocation one strategy may take, in basis points")
+    risk_aversion: float = Field(4.0, description="Penalty on portfolio variance when optimizing a split allocation")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "name": "moderate",
+                "apy_weight": 0.35,
+                "risk_adjusted_returns_weight": 0.35,
+                "withdrawal_liquidity_weight": 0.2,
+                "utilization_weight": 0.1,
+                "min_withdrawal_liquidity": 5000,
+                "max_allocation": 8000,
+                "risk_aversion": 4.0
+            }
+        }
+    )
+
+class StrategyScore(BaseModel):
+    """Deterministic score of a strategy under a risk profile"""
+    strategy_id: int = Field(description="The ID of the strategy")
+    score: float = Field(description="Weighted score between 0 and 1")
+    eligible: bool = Field(description="Whether the strategy meets the profile constraints")
+    components: Dict[str, float] = Field(description="Normalized value of each criterion")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "strategy_id": 1,
+                "score": 0.82,
+                "eligible": True,
+                "components": {
+                    "apy": 1.0,
+                    "risk_adjusted_returns": 0.5,
+                    "withdrawal_liquidity": 0.0,
+                    "utilization": 0.0
+                }
+            }
+        }
+    )
+
+class PortfolioPoint(BaseModel):
+    """Split allocation across strategies and its portfolio-level metrics"""
+    allocation: List[int] = Field(description="Basis points allocated to strategies in order, summing to 10000")
+    expected_apy: float = Field(description="Weighted APY in basis points")
+    volatility: float = Field(description="Estimated annual volatility in basis points")
+    sharpe: float = Field(description="Expected APY over volatility")
+    withdrawal_liquidity: float = Field(description="Weighted withdrawal liquidity in basis points")
+    utilization_rate: float = Field(description="Weighted utilization rate in basis points")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "allocation": [5000, 3000, 2000],
+                "expected_apy": 845.0,
+                "volatility": 402.1,
+                "sharpe": 2.1,
+                "withdrawal_liquidity": 7700.0,
+                "utilization_rate": 7650.0
+            }
+        }
+    )
+
+class PortfolioAllocation(BaseModel):
+    """Optimal split allocation for a risk profile, with the efficient frontier it was chosen from"""
+    profile: str = Field(description="Risk profile the allocation was optimized for")
+    strategy_ids: List[int] = Field(description="Strategy IDs in allocation order")
+    optimal: PortfolioPoint = Field(description="Highest-utility allocation meeting the profile constraints")
+    feasible: bool = Field(description="Whether any allocation met the liquidity and concentration constraints")
+    frontier: List[PortfolioPoint] = Field(description="Efficient allocations by increasing volatility")
+    candidates_evaluated: int = Field(description="Number of candidate allocations scored")
+    amounts: List[int] = Field(description="Treasury token balance split by the optimal allocation, in wei")
+    expected_annual_yield: float = Field(description="Expected yield on the treasury token balance per year, in token units")
+
+class BacktestScenario(BaseModel):
+    """Simulated outcome distribution of one allocation"""
+    allocation: List[int] = Field(description="Basis points allocated to strategies 1, 2 and 3")
+    final_value: Dict[str, float] = Field(description="Percentiles of the final treasury value, as a multiple of the starting value")
+    annualized_return: Dict[str, float] = Field(description="Percentiles of the annualized return in basis points")
+    mean_final_value: float = Field(description="Mean final value as a multiple of the starting value")
+    probability_of_loss: float = Field(description="Share of paths ending below the starting value")
+    max_drawdown: Dict[str, float] = Field(description="Median and 95th percentile of the worst peak-to-trough fall, as a fraction")
+    historical_return: Optional[float] = Field(None, description="Annualized return in basis points of replaying the recorded history once, if it spans more than one period")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "allocation": [6000, 2500, 1500],
+                "final_value": {"p5": 1.0121, "p25": 1.0173, "p50": 1.0201, "p75": 1.0229, "p95": 1.0281},
+                "annualized_return": {"p5": 496.2, "p25": 710.4, "p50": 824.9, "p75": 940.1, "p95": 1153.7},
+                "mean_final_value": 1.0201,
+                "probability_of_loss": 0.0,
+                "max_drawdown": {"p50": 0.0031, "p95": 0.0079},
+                "historical_return": 812.5
+            }
+        }
+    )
+
+class BacktestReport(BaseModel):
+    """Backtest of several allocations over the same strategy metrics history"""
+    source: str = Field(description="Where the metrics history came from: index, file or snapshot")
+    periods: int = Field(description="Number of regular periods in the history")
+    start_timestamp: int = Field(description="Unix time of the first period")
+    end_timestamp: int = Field(description="Unix time of the last period")
+    step_seconds: int = Field(description="Length of one simulated period in seconds")
+    horizon_days: int = Field(description="Simulated horizon in days")
+    paths: int = Field(description="Monte Carlo paths per allocation")
+    seed: int = Field(description="Random seed, to reproduce the run")
+    workers: int = Field(description="Processes the paths were simulated on")
+    elapsed_ms: float = Field(description="Simulation wall time in milliseconds")
+    scenarios: List[BacktestScenario] = Field(description="One entry per allocation, in request order")
+
+class TreasuryAssessment(BaseModel):
+    """Treasury agent's analysis, validated from its final answer"""
+    treasury_health: str = Field(description="Treasury health: excellent, good, fair or poor")
+    available_capital: str = Field(description="Capital available for investment, in USD")
+    risk_tolerance: str = Field(description="Risk tolerance: conservative, moderate or aggressive")
+    market_conditions: str = Field(description="Market conditions: bullish, bearish or neutral")
+    analysis_summary: str = Field(description="Detailed analysis text")
+
+    @field_validator("available_capital", mode="before")
+    @classmethod
+    def _text(cls, value: Any) -> Any:
+        """Accept a bare number where text is expected"""
+        return str(value) if isinstance(value, (int, float)) else value
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "treasury_health": "good",
+                "available_capital": "2000.00",
+                "risk_tolerance": "moderate",
+                "market_conditions": "neutral",
+                "analysis_summary": "The treasury holds 1 ETH and 2 ETH tokens with no outstanding obligations..."
+            }
+        }
+    )
+
+class StrategyRecommendation(BaseModel):
+    """Strategy agent's evaluation, validated from its final answer"""
+    recommended_strategy: int = Field(ge=1, le=3, description="Recommended strategy ID: 1, 2 or 3")
+    allocation: Optional[List[float]] = Field(None, description="Weights for strategies 1, 2 and 3 when recommending a split")
+    reasoning: str = Field(description="Why this strategy is best")
+    expected_apy: str = Field(description="Expected APY as a percentage")
+    risk_level: str = Field(description="Risk level: low, medium or high")
+    liquidity_considerations: str = Field(description="Withdrawal liquidity considerations")
+    alternative_strategies: List[str] = Field(default_factory=list, description="Other strategies considered")
+
+    @field_validator("recommended_strategy", mode="before")
+    @classmethod
+    def _strategy_number(cls, value: Any) -> Any:
+        """Accept forms like "Strategy 2" for the strategy ID"""
+        if isinstance(value, str):
+            digits = "".join(character for character in value if character.isdigit())
+            return digits or value
+        return value
+
+    @field_validator("expected_apy", mode="before")
+    @classmethod
+    def _text(cls, value: Any) -> Any:
+        """Accept a bare number where text is expected"""
+        return str(value) if isinstance(value, (int, float)) else value
+
+    @field_validator("alternative_strategies", mode="before")
+    @classmethod
+    def _text_list(cls, value: Any) -> Any:
+        """Accept a single string or numbers for the alternatives"""
+        if isinstance(value, (str, int, float)):
+            value = [value]
+        return [str(item) for item in value] if isinstance(value, list) else value
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "recommended_strategy": 1,
+                "allocation": None,
+                "reasoning": "Strategy 1 offers the best risk-adjusted return with 85% withdrawal liquidity...",
+                "expected_apy": "7.2",
+                "risk_level": "low",
+                "liquidity_considerations": "85% of funds can be withdrawn at any time",
+                "alternative_strategies": ["Strategy 2: higher APY but lower liquidity", "Strategy 3"]
+            }
+        }
+    )
+
+class ProposalSubmission(BaseModel):
+    """Proposal agent's report of the proposal it submitted, validated from its final answer"""
+    submitted: bool = Field(description="Whether the proposal_tool reported SUCCESS")
+    strategy_id: int = Field(ge=1, le=3, description="Strategy the proposal funds, or the largest share of a split")
+    reasoning: str = Field(description="Reasoning submitted with the proposal")
+    error: Optional[str] = Field(None, description="Error message from the proposal_tool, if it failed")
+
+    @field_validator("strategy_id", mode="before")
+    @classmethod
+    def _strategy_number(cls, value: Any) -> Any:
+        """Accept forms like "Strategy 2" for the strategy ID"""
+        return StrategyRecommendation._strategy_number(value)
@@ -0,0 +1,183 @@
+"""
+Vectorized portfolio optimizer splitting treasury funds across strategies.
+"""
+
+import itertools
+import os
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from .models import PortfolioAllocation, PortfolioPoint, RiskProfile, StrategyMetrics, TreasuryData
+from .scoring import RISK_PROFILES
+from .utils import STRATEGY_IDS
+
+# Candidate allocations are every split on this grid, e.g. 100 bps gives 5151 splits of 3 strategies
+OPTIMIZER_GRID_STEP = int(os.getenv("OPTIMIZER_GRID_STEP_BPS", "100"))
+
+# Assumed pairwise correlation of strategy returns, for the portfolio variance
+STRATEGY_CORRELATION = float(os.getenv("STRATEGY_CORRELATION", "0.3"))
+
+# Floor on the Sharpe-like ratio when deriving volatility, so a zero ratio does not divide by zero
+MIN_RISK_ADJUSTED_RETURN = 0.1
+
+# Efficient frontier points returned, evenly spread by volatility
+FRONTIER_POINTS = 12
+
+def strategy_volatility(apy: np.ndarray, risk_adjusted_returns: np.ndarray) -> np.ndarray:
+    """Annual volatility as a fraction from APY and risk-adjusted returns in basis points
+
+    Risk-adjusted returns are Sharpe-like, so volatility is return over that ratio.
+    """
+    sharpe = np.maximum(np.asarray(risk_adjusted_returns, dtype=float) / 100, MIN_RISK_ADJUSTED_RETURN)
+    return np.asarray(apy, dtype=float) / 10000 / sharpe
+
+@lru_cache(maxsize=16)
+def allocation_grid(strategies: int, step_bps: int = OPTIMIZER_GRID_STEP) -> np.ndarray:
+    """Every split of 10000 bps across the strategies in step_bps increments, as rows of basis points"""
+    if step_bps <= 0 or 10000 % step_bps:
+        raise ValueError(f"Grid step must divide 10000 bps: {step_bps}")
+    steps = 10000 // step_bps
+    # Stars and bars: each choice of divider positions is one composition of the steps
+    dividers = np.array(list(itertools.combinations(range(steps + strategies - 1), strategies - 1)), dtype=np.int64).reshape(-1, strategies - 1)
+    bounds = np.hstack([np.full((len(dividers), 1), -1), dividers, np.full((len(dividers), 1), steps + strategies - 1)])
+    grid = (np.diff(bounds, axis=1) - 1) * step_bps
+    grid.setflags(write=False)
+    return grid
+
+class PortfolioOptimizer:
+    """Scores every candidate allocation of one set of strategies at once and picks the best per risk profile"""
+
+    def __init__(
+        self,
+        strategies: List[StrategyMetrics],
+        correlation: float = STRATEGY_CORRELATION,
+        step_bps: int = OPTIMIZER_GRID_STEP
+    ):
+        if not strategies:
+            raise ValueError("No strategies to allocate across")
+        self.strategies = strategies
+        self.strategy_ids = [strategy.strategy_id for strategy in strategies]
+
+        # Per-strategy vectors as fractions
+        apy = np.array([s.apy for s in strategies], dtype=float) / 10000
+        volatility = strategy_volatility([s.apy for s in strategies], [s.risk_adjusted_returns for s in strategies])
+        liquidity = np.array([s.withdrawal_liquidity for s in strategies], dtype=float) / 10000
+        utilization = np.array([s.utilization_rate for s in strategies], dtype=float) / 10000
+
+        covariance = correlation * np.outer(volatility, volatility)
+        np.fill_diagonal(covariance, volatility ** 2)
+
+        # Portfolio metrics for every candidate in a handful of matrix products
+        self.grid = allocation_grid(len(strategies), step_bps)
+        weights = self.grid / 10000
+        self.returns = weights @ apy
+        self.variance = np.einsum("ij,jk,ik->i", weights, covariance, weights)
+        self.volatility = np.sqrt(self.variance)
+        self.liquidity = weights @ liquidity
+        self.utilization = weights @ utilization
+        self.max_weight = self.grid.max(axis=1)
+
+    def _point(self, index: int) -> PortfolioPoint:
+        """Metrics of one candidate allocation"""
+        volatility = float(self.volatility[index])
+        return PortfolioPoint(
+            allocation=[int(bps) for bps in self.grid[index]],
+            expected_apy=round(float(self.returns[index]) * 10000, 2),
+            volatility=round(volatility * 10000, 2),
+            sharpe=round(float(self.returns[index]) / volatility, 4) if volatility else 0.0,
+            withdrawal_liquidity=round(float(self.liquidity[index]) * 10000, 2),
+            utilization_rate=round(float(self.utilization[index]) * 10000, 2)
+        )
+
+    def feasible(self, profiles: Sequence[RiskProfile]) -> np.ndarray:
+        """Profiles x candidates mask of allocations meeting each profile's liquidity floor and concentration cap"""
+        floors = np.array([profile.min_withdrawal_liquidity for profile in profiles], dtype=float) / 10000
+        caps = np.array([profile.max_allocation for profile in profiles])
+        return (self.liquidity[None, :] >= floors[:, None] - 1e-12) & (self.max_weight[None, :] <= caps[:, None])
+
+    def efficient_frontier(self, mask: Optional[np.ndarray] = None) -> np.ndarray:
+        """Indices of candidates no other candidate beats on both return and volatility, by increasing volatility"""
+        candidates = np.flatnonzero(mask) if mask is not None else np.arange(len(self.grid))
+        if not len(candidates):
+            return candidates
+        # Sweep by volatility (highest return first on ties); a point is efficient if it beats every calmer one
+        order = candidates[np.lexsort((-self.returns[candidates], self.volatility[candidates]))]
+        returns = self.returns[order]
+        best_so_far = np.concatenate([[-np.inf], np.maximum.accumulate(returns)[:-1]])
+        return order[returns > best_so_far]
+
+    def optimize(self, profiles: Sequence[RiskProfile], treasury_data: Optional[TreasuryData] = None) -> List[PortfolioAllocation]:
+        """Best allocation per profile by mean-variance utility, subject to the profile constraints"""
+        risk_aversion = np.array([profile.risk_aversion for profile in profiles])
+        feasible = self.feasible(profiles)
+        utility = self.returns[None, :] - 0.5 * risk_aversion[:, None] * self.variance[None, :]
+        best = np.argmax(np.where(feasible, utility, -np.inf), axis=1)
+
+        balance = treasury_data.eth_token_balance if treasury_data else 0
+        results = []
+        for row, profile in enumerate(profiles):
+            any_feasible = bool(feasible[row].any())
+            # With no feasible split, fall back to the most liquid allocation rather than failing
+            index = int(best[row]) if any_feasible else int(np.argmax(self.liquidity))
+            frontier = self.efficient_frontier(feasible[row] if any_feasible else None)
+            if len(frontier) > FRONTIER_POINTS:
+                frontier = frontier[np.linspace(0, len(frontier) - 1, FRONTIER_POINTS).round().astype(int)]
+
+            amounts = [balance * int(bps) // 10000 for bps in self.grid[index]]
+            results.append(PortfolioAllocation(
+                profile=profile.name,
+                strategy_ids=self.strategy_ids,
+                optimal=self._point(index),
+                feasible=any_feasible,
+                frontier=[self._point(int(i)) for i in frontier],
+                candidates_evaluated=len(self.grid),
+                amounts=amounts,
+                expected_annual_yield=round(balance / 1e18 * float(self.returns[index]), 6)
+            ))
+        return results
+
+def optimize_allocation(
+    strategies: List[StrategyMetrics],
+    treasury_data: Optional[TreasuryData] = None,
+    profiles: Optional[Sequence[str]] = None
+) -> List[PortfolioAllocation]:
+    """Optimal split allocation for each named risk profile, all profiles by default"""
+    names = list(profiles) if profiles else list(RISK_PROFILES)
+    unknown = [name for name in names if name not in RISK_PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown risk profile: {unknown[0]}. Supported profiles: {list(RISK_PROFILES.keys())}")
+    return PortfolioOptimizer(strategies).optimize([RISK_PROFILES[name] for name in names], treasury_data)
+
+def proposal_allocation(result: PortfolioAllocation) -> List[int]:
+    """Optimal basis points in the strategy order the proposal builder expects"""
+    weights = dict(zip(result.strategy_ids, result.optimal.allocation))
+    return [weights.get(strategy_id, 0) for strategy_id in STRATEGY_IDS]
+
+def summarize_allocation(result: PortfolioAllocation) -> str:
+    """Human-readable summary of an optimized allocation"""
+    optimal = result.optimal
+    split = ", ".join(
+        f"Strategy {strategy_id} {bps / 100:.0f}%"
+        for strategy_id, bps in zip(result.strategy_ids, optimal.allocation) if bps
+    )
+    text = (
+        f"{result.profile.capitalize()} profile optimal split: {split}. "
+        f"Expected APY {optimal.expected_apy / 100:.2f}%, volatility {optimal.volatility / 100:.2f}%, "
+        f"Sharpe {optimal.sharpe:.2f}, withdrawal liquidity {optimal.withdrawal_liquidity / 100:.2f}% "
+        f"({result.candidates_evaluated} allocations scored)."
+    )
+    if any(result.amounts):
+        text += f" Expected yield on the treasury balance: {result.expected_annual_yield:.4f} tokens per year."
+    if not result.feasible:
+        text += " No split met the profile's liquidity and concentration limits, so the most liquid one is shown."
+    return text
+
+def summarize_frontier(result: PortfolioAllocation) -> str:
+    """One line per efficient allocation, for prompts"""
+    return "\n".join(
+        f"- {'/'.join(str(bps // 100) for bps in point.allocation)}%: APY {point.expected_apy / 100:.2f}%, "
+        f"volatility {point.volatility / 100:.2f}%, liquidity {point.withdrawal_liquidity / 100:.2f}%"
+        for point in result.frontier
+    )
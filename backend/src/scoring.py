@@ -0,0 +1,145 @@
+"""
+Deterministic strategy scoring for selecting strategies without LLM calls.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Type
+
+from .models import RiskProfile, StrategyMetrics, StrategyScore
+
+# Built-in risk profiles, from capital preservation to yield seeking
+RISK_PROFILES: Dict[str, RiskProfile] = {
+    "conservative": RiskProfile(
+        name="conservative",
+        apy_weight=0.15,
+        risk_adjusted_returns_weight=0.35,
+        withdrawal_liquidity_weight=0.35,
+        utilization_weight=0.15,
+        min_withdrawal_liquidity=8000,
+        max_allocation=6000,
+        risk_aversion=8.0
+    ),
+    "moderate": RiskProfile(
+        name="moderate",
+        apy_weight=0.35,
+        risk_adjusted_returns_weight=0.35,
+        withdrawal_liquidity_weight=0.2,
+        utilization_weight=0.1,
+        min_withdrawal_liquidity=5000,
+        max_allocation=8000,
+        risk_aversion=4.0
+    ),
+    "aggressive": RiskProfile(
+        name="aggressive",
+        apy_weight=0.6,
+        risk_adjusted_returns_weight=0.25,
+        withdrawal_liquidity_weight=0.1,
+        utilization_weight=0.05,
+        min_withdrawal_liquidity=0,
+        max_allocation=10000,
+        risk_aversion=1.0
+    )
+}
+
+def _normalize(values: List[float]) -> List[float]:
+    """Min-max normalize values to [0, 1]; identical values all score 1"""
+    low, high = min(values), max(values)
+    if high == low:
+        return [1.0 for _ in values]
+    return [(value - low) / (high - low) for value in values]
+
+def best_score(ranking: List[StrategyScore]) -> StrategyScore:
+    """Best eligible strategy of a ranking, or the best overall if none are eligible"""
+    if not ranking:
+        raise ValueError("No strategies to score")
+    return next((score for score in ranking if score.eligible), ranking[0])
+
+class StrategyScorer(ABC):
+    """Base class for strategy scorers; subclasses implement rank()"""
+
+    def __init__(self, profile: RiskProfile):
+        self.profile = profile
+
+    @abstractmethod
+    def rank(self, strategies: List[StrategyMetrics]) -> List[StrategyScore]:
+        """Score strategies and return them best first"""
+
+    def select(self, strategies: List[StrategyMetrics]) -> StrategyScore:
+        """Return the best eligible strategy, or the best overall if none are eligible"""
+        return best_score(self.rank(strategies))
+
+class WeightedScorer(StrategyScorer):
+    """Weighted multi-criteria ranker over normalized strategy metrics"""
+
+    def rank(self, strategies: List[StrategyMetrics]) -> List[StrategyScore]:
+        if not strategies:
+            return []
+
+        apy = _normalize([s.apy for s in strategies])
+        risk_adjusted = _normalize([s.risk_adjusted_returns for s in strategies])
+        liquidity = _normalize([s.withdrawal_liquidity for s in strategies])
+        # Lower utilization leaves more headroom for withdrawals, so it is inverted
+        headroom = _normalize([-s.utilization_rate for s in strategies])
+
+        weights = self.profile
+        total_weight = (
+            weights.apy_weight
+            + weights.risk_adjusted_returns_weight
+            + weights.withdrawal_liquidity_weight
+            + weights.utilization_weight
+        ) or 1.0
+
+        scores = []
+        for i, strategy in enumerate(strategies):
+            components = {
+                "apy": apy[i],
+                "risk_adjusted_returns": risk_adjusted[i],
+                "withdrawal_liquidity": liquidity[i],
+                "utilization": headroom[i]
+            }
+            score = (
+                weights.apy_weight * apy[i]
+                + weights.risk_adjusted_returns_weight * risk_adjusted[i]
+                + weights.withdrawal_liquidity_weight * liquidity[i]
+                + weights.utilization_weight * headroom[i]
+            ) / total_weight
+            scores.append(StrategyScore(
+                strategy_id=strategy.strategy_id,
+                score=round(score, 6),
+                eligible=strategy.withdrawal_liquidity >= weights.min_withdrawal_liquidity,
+                components=components
+            ))
+
+        # Eligible strategies first, then by score; ties go to the lower strategy ID
+        return sorted(scores, key=lambda s: (not s.eligible, -s.score, s.strategy_id))
+
+# Registered scorers, selectable by name
+SCORERS: Dict[str, Type[StrategyScorer]] = {
+    "weighted": WeightedScorer
+}
+
+def get_scorer(risk_profile: str = "moderate", scorer: str = "weighted") -> StrategyScorer:
+    """Build a scorer for the named risk profile"""
+    if risk_profile not in RISK_PROFILES:
+        raise ValueError(f"Unknown risk profile: {risk_profile}. Supported profiles: {list(RISK_PROFILES.keys())}")
+    if scorer not in SCORERS:
+        raise ValueError(f"Unknown scorer: {scorer}. Supported scorers: {list(SCORERS.keys())}")
+    return SCORERS[scorer](RISK_PROFILES[risk_profile])
+
+def summarize_ranking(ranking: List[StrategyScore], strategies: List[StrategyMetrics], profile: RiskProfile) -> str:
+    """Human-readable explanation of a deterministic ranking"""
+    by_id = {strategy.strategy_id: strategy for strategy in strategies}
+    best = best_score(ranking)
+    chosen = by_id[best.strategy_id]
+
+    lines = [
+        f"Strategy {best.strategy_id} selected by the {profile.name} risk profile with score {best.score:.3f}: "
+        f"APY {chosen.apy / 100:.2f}%, risk-adjusted returns {chosen.risk_adjusted_returns / 100:.2f}, "
+        f"withdrawal liquidity {chosen.withdrawal_liquidity / 100:.2f}%, utilization {chosen.utilization_rate / 100:.2f}%."
+    ]
+    for score in ranking:
+        if score.strategy_id == best.strategy_id:
+            continue
+        reason = "below the liquidity floor" if not score.eligible else f"scored {score.score:.3f}"
+        lines.append(f"Strategy {score.strategy_id} {reason}.")
+    return " ".join(lines)
@@ -0,0 +1,267 @@
+"""
+Block-keyed cache for contract reads, layered under the treasury and strategy services.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence, Tuple
+from eth_utils import keccak
+from web3 import Web3
+
+from .multicall import AsyncBatchReader, BatchReader
+
+# Cache policies: "code" results live until the contract's code changes, "block" results for one block
+POLICY_CODE = "code"
+POLICY_BLOCK = "block"
+
+# Explicit per-method policies; anything else follows its ABI stateMutability
+CACHE_POLICIES = {
+    # ERC-20 metadata is view but fixed at deployment
+    "symbol": POLICY_CODE,
+    "name": POLICY_CODE,
+    "decimals": POLICY_CODE
+}
+
+# Cache tuning, overridable from the environment
+CACHE_MAX_ENTRIES = int(os.getenv("READ_CACHE_MAX_ENTRIES", "4096"))
+CACHE_VIEW_TTL = float(os.getenv("READ_CACHE_VIEW_TTL", "60"))
+CACHE_BLOCK_TTL = float(os.getenv("READ_CACHE_BLOCK_TTL", "2"))
+CACHE_CODE_HASH_TTL = float(os.getenv("READ_CACHE_CODE_HASH_TTL", "300"))
+
+_MISSING = object()
+
+def get_policy(fn: Any) -> str:
+    """Cache policy for a contract function"""
+    name = fn.abi.get("name")
+    if name in CACHE_POLICIES:
+        return CACHE_POLICIES[name]
+    return POLICY_CODE if fn.abi.get("stateMutability") == "pure" else POLICY_BLOCK
+
+class ReadCache:
+    """Thread-safe LRU of decoded call results with per-policy keys and hit/miss counters"""
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        view_ttl: float = CACHE_VIEW_TTL,
+        block_ttl: float = CACHE_BLOCK_TTL,
+        code_hash_ttl: float = CACHE_CODE_HASH_TTL
+    ):
+        self.max_entries = max_entries
+        self.view_ttl = view_ttl
+        self.block_ttl = block_ttl
+        self.code_hash_ttl = code_hash_ttl
+        self._lock = threading.Lock()
+        # key -> (value, expiry or None)
+        self._entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        # (endpoint, address) -> (code hash, fetched at)
+        self._code_hashes: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        # endpoint -> (latest block number, fetched at)
+        self._latest_blocks: Dict[str, Tuple[int, float]] = {}
+        self._counters = {
+            POLICY_CODE: {"hits": 0, "misses": 0},
+            POLICY_BLOCK: {"hits": 0, "misses": 0}
+        }
+        self._evictions = 0
+
+    def code_hash(self, endpoint: str, address: str) -> Optional[str]:
+        """Recently verified code hash of a contract, or None if it needs re-checking"""
+        with self._lock:
+            cached = self._code_hashes.get((endpoint, address))
+        if cached is None or time.monotonic() - cached[1] > self.code_hash_ttl:
+            return None
+        return cached[0]
+
+    def set_code(self, endpoint: str, address: str, code: bytes) -> str:
+        """Remember the hash of a contract's deployed code"""
+        code_hash = keccak(code).hex()
+        with self._lock:
+            self._code_hashes[(endpoint, address)] = (code_hash, time.monotonic())
+        return code_hash
+
+    def latest_block(self, endpoint: str, allow_stale: bool = False) -> Optional[int]:
+        """Latest block seen on an endpoint, or None once it is older than the block TTL"""
+        with self._lock:
+            cached = self._latest_blocks.get(endpoint)
+        if cached is None:
+            return None
+        if not allow_stale and time.monotonic() - cached[1] > self.block_ttl:
+            return None
+        return cached[0]
+
+    def set_latest_block(self, endpoint: str, block_number: int) -> None:
+        """Record the head block an unpinned read observed"""
+        with self._lock:
+            current = self._latest_blocks.get(endpoint)
+            if current is None or block_number >= current[0]:
+                self._latest_blocks[endpoint] = (block_number, time.monotonic())
+
+    def key(self, endpoint: str, fn: Any, code_hash: Optional[str], block_number: Optional[int]) -> Optional[Hashable]:
+        """Cache key for a call, or None if it cannot be cached right now"""
+        address = Web3.to_checksum_address(fn.address)
+        calldata = fn._encode_transaction_data()
+        if get_policy(fn) == POLICY_CODE:
+            return (POLICY_CODE, endpoint, address, code_hash, calldata) if code_hash else None
+        return (POLICY_BLOCK, endpoint, address, block_number, calldata) if block_number is not None else None
+
+    def get(self, key: Optional[Hashable], policy: str) -> Any:
+        """Look up a cached result, counting the hit or miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key) if key is not None else None
+            if entry is not None and entry[1] is not None and entry[1] < now:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._counters[policy]["misses"] += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            self._counters[policy]["hits"] += 1
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any, policy: str) -> None:
+        """Store a result, evicting the least recently used entries past the size bound"""
+        expiry = time.monotonic() + self.view_ttl if policy == POLICY_BLOCK else None
+        with self._lock:
+            self._entries[key] = (value, expiry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters per policy plus current size"""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                **{policy: dict(counters) for policy, counters in self._counters.items()}
+            }
+
+    def clear(self) -> None:
+        """Drop all cached results and code hashes"""
+        with self._lock:
+            self._entries.clear()
+            self._code_hashes.clear()
+            self._latest_blocks.clear()
+
+# Process-wide cache shared by every service instance
+read_cache = ReadCache()
+
+def _lookup(
+    cache: ReadCache,
+    endpoint: str,
+    calls: Sequence[Any],
+    code_hashes: Dict[str, str]
+) -> Tuple[List[Any], List[Optional[Hashable]], Optional[int]]:
+    """Resolve calls against the cache, returning results (with _MISSING gaps), keys and the block they are keyed on
+
+    The block is None when no recent block is known; the misses then run at the latest block.
+    """
+    block_number = cache.latest_block(endpoint)
+    results, keys = [], []
+    for fn in calls:
+        policy = get_policy(fn)
+        key = cache.key(endpoint, fn, code_hashes.get(Web3.to_checksum_address(fn.address)), block_number)
+        keys.append(key)
+        results.append(cache.get(key, policy))
+    return results, keys, block_number
+
+def _store(
+    cache: ReadCache,
+    endpoint: str,
+    calls: Sequence[Any],
+    results: List[Any],
+    keys: List[Optional[Hashable]],
+    code_hashes: Dict[str, str],
+    fetched: List[Any],
+    block_number: int,
+    pinned: bool
+) -> None:
+    """Fill the _MISSING gaps with freshly fetched results and cache them"""
+    # A read pinned to the cached block says nothing about the head, so only unpinned reads refresh it;
+    # otherwise steady misses would keep an old block fresh forever
+    if not pinned:
+        cache.set_latest_block(endpoint, block_number)
+    fetched_iter = iter(fetched)
+    for i, fn in enumerate(calls):
+        if results[i] is not _MISSING:
+            continue
+        results[i] = next(fetched_iter)
+        policy = get_policy(fn)
+        key = keys[i] or cache.key(endpoint, fn, code_hashes.get(Web3.to_checksum_address(fn.address)), block_number)
+        if key is not None:
+            cache.set(key, results[i], policy)
+
+def _code_addresses(calls: Sequence[Any]) -> List[str]:
+    """Distinct contract addresses with code-policy calls"""
+    return list(dict.fromkeys(Web3.to_checksum_address(fn.address) for fn in calls if get_policy(fn) == POLICY_CODE))
+
+class CachedBatchReader(BatchReader):
+    """BatchReader that serves repeat reads from the block-keyed cache"""
+
+    def __init__(self, w3: Web3, cache: ReadCache = read_cache, **kwargs):
+        super().__init__(w3, **kwargs)
+        self.cache = cache
+
+    def _code_hashes(self, calls: Sequence[Any]) -> Dict[str, str]:
+        """Code hashes for every contract with code-policy calls, re-checked after the TTL"""
+        endpoint = self.endpoint
+        code_hashes = {}
+        for address in _code_addresses(calls):
+            code_hash = self.cache.code_hash(endpoint, address)
+            if code_hash is None:
+                code_hash = self.cache.set_code(endpoint, address, bytes(self.w3.eth.get_code(address)))
+            code_hashes[address] = code_hash
+        return code_hashes
+
+    def call(self, calls: Sequence[Any]) -> Tuple[List[Any], int]:
+        endpoint = self.endpoint
+        code_hashes = self._code_hashes(calls)
+        results, keys, block_number = _lookup(self.cache, endpoint, calls, code_hashes)
+
+        misses = [fn for fn, result in zip(calls, results) if result is _MISSING]
+        if not misses:
+            return results, block_number or self.cache.latest_block(endpoint, allow_stale=True) or 0
+
+        # Misses run at the block the hits are keyed on, so every result comes from one block
+        pinned = block_number is not None
+        fetched, block_number = super().call(misses, block_number)
+        _store(self.cache, endpoint, calls, results, keys, code_hashes, fetched, block_number, pinned)
+        return results, block_number
+
+class AsyncCachedBatchReader(AsyncBatchReader):
+    """AsyncBatchReader that serves repeat reads from the block-keyed cache"""
+
+    def __init__(self, w3: Any, cache: ReadCache = read_cache, **kwargs):
+        super().__init__(w3, **kwargs)
+        self.cache = cache
+
+    async def _code_hashes(self, calls: Sequence[Any]) -> Dict[str, str]:
+        """Code hashes for every contract with code-policy calls, re-checked after the TTL"""
+        endpoint = self.endpoint
+        code_hashes = {}
+        for address in _code_addresses(calls):
+            code_hash = self.cache.code_hash(endpoint, address)
+            if code_hash is None:
+                code_hash = self.cache.set_code(endpoint, address, bytes(await self.w3.eth.get_code(address)))
+            code_hashes[address] = code_hash
+        return code_hashes
+
+    async def call(self, calls: Sequence[Any]) -> Tuple[List[Any], int]:
+        endpoint = self.endpoint
+        code_hashes = await self._code_hashes(calls)
+        results, keys, block_number = _lookup(self.cache, endpoint, calls, code_hashes)
+
+        misses = [fn for fn, result in zip(calls, results) if result is _MISSING]
+        if not misses:
+            return results, block_number or self.cache.latest_block(endpoint, allow_stale=True) or 0
+
+        # Misses run at the block the hits are keyed on, so every result comes from one block
+        pinned = block_number is not None
+        fetched, block_number = await super().call(misses, block_number)
+        _store(self.cache, endpoint, calls, results, keys, code_hashes, fetched, block_number, pinned)
+        return results, block_number
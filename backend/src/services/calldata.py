@@ -0,0 +1,171 @@
+"""
+Calldata decoder resolving function selectors against the project's contract ABIs.
+"""
+
+import os
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from eth_abi import decode
+from eth_utils import function_abi_to_4byte_selector
+from web3 import Web3
+
+from ..abis import ETHToken_ABI, GOVERNANCE_ABI, STRATEGY_ABI, TREASURY_ABI
+from ..config import CHAIN_CONFIGS, get_contract_addresses_for_chain
+from ..utils import abi_signature, abi_type
+
+# Contracts whose functions can be decoded, by display name
+DECODABLE_ABIS = {
+    "Treasury": TREASURY_ABI,
+    "Strategy": STRATEGY_ABI,
+    "Governance": GOVERNANCE_ABI,
+    "ETHToken": ETHToken_ABI
+}
+
+# Config key of each contract's address, used to label addresses in decoded arguments
+CONTRACT_ADDRESS_KEYS = {
+    "Treasury": "treasury",
+    "Strategy": "strategy",
+    "Governance": "governance",
+    "ETHToken": "eth_token"
+}
+
+# How many levels of calldata nested in bytes arguments are decoded
+MAX_DECODE_DEPTH = 4
+
+# Distinct (calldata, chain) pairs whose decoding is kept in memory
+DECODE_CACHE_SIZE = int(os.getenv("DECODE_CACHE_SIZE", "2048"))
+
+def _build_selector_index() -> Dict[bytes, List[Dict[str, Any]]]:
+    """Map every 4-byte selector to the function fragments that share it"""
+    index: Dict[bytes, List[Dict[str, Any]]] = {}
+    seen = set()
+    for contract, abi in DECODABLE_ABIS.items():
+        for fragment in abi:
+            if fragment.get("type") != "function":
+                continue
+            signature = abi_signature(fragment)
+            # The same function on two contracts decodes identically, so keep the first
+            if signature in seen:
+                continue
+            seen.add(signature)
+            index.setdefault(function_abi_to_4byte_selector(fragment), []).append({
+                "contract": contract,
+                "function": fragment["name"],
+                "signature": signature,
+                "names": [param["name"] for param in fragment["inputs"]],
+                "types": [abi_type(param) for param in fragment["inputs"]]
+            })
+    return index
+
+# Built once at import; lookups are a dict access per call
+SELECTOR_INDEX = _build_selector_index()
+
+def address_labels(chain: Optional[str]) -> Dict[str, str]:
+    """Configured contract addresses on a chain, lowercased, mapped to contract names"""
+    if chain is None:
+        return {}
+    if chain not in CHAIN_CONFIGS:
+        raise ValueError(f"Unsupported chain: {chain}. Supported chains: {list(CHAIN_CONFIGS.keys())}")
+    addresses = get_contract_addresses_for_chain(chain)
+    return {addresses[key].lower(): contract for contract, key in CONTRACT_ADDRESS_KEYS.items() if int(addresses[key], 16) != 0}
+
+def _json_value(value: Any) -> Any:
+    """Make a decoded ABI value JSON-safe: integers as decimal strings, bytes as hex"""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, bytes):
+        return "0x" + value.hex()
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    return value
+
+def _render(value: Any, labels: Dict[str, str]) -> str:
+    """Short human-readable form of a decoded argument"""
+    if isinstance(value, str) and value.lower() in labels:
+        return labels[value.lower()]
+    if isinstance(value, list):
+        return "[" + ", ".join(_render(item, labels) for item in value) + "]"
+    return str(value)
+
+def _undecoded(selector: Optional[str], error: Optional[str] = None) -> Dict[str, Any]:
+    """Decoding result with no function resolved yet"""
+    return {"selector": selector, "contract": None, "function": None, "signature": None, "args": [], "summary": None, "error": error}
+
+def _decode_call(data: bytes, labels: Dict[str, str], depth: int) -> Dict[str, Any]:
+    """Decode one call, recursing into bytes arguments that hold calldata themselves"""
+    if len(data) < 4:
+        return _undecoded(None, "Calldata shorter than a selector")
+    result = _undecoded("0x" + data[:4].hex())
+
+    candidates = SELECTOR_INDEX.get(data[:4], [])
+    if not candidates:
+        result["error"] = "Unknown selector"
+        return result
+
+    for fragment in candidates:
+        try:
+            values = decode(fragment["types"], data[4:])
+            break
+        except Exception as e:
+            error = str(e)
+    else:
+        result["error"] = f"Arguments do not match {candidates[0]['signature']}: {error}"
+        return result
+
+    args = []
+    for name, param_type, value in zip(fragment["names"], fragment["types"], values):
+        arg: Dict[str, Any] = {"name": name, "type": param_type, "value": _json_value(value), "label": None, "calls": None}
+        if param_type == "address":
+            arg["value"] = Web3.to_checksum_address(value)
+            arg["label"] = labels.get(value.lower())
+        elif param_type == "address[]":
+            arg["value"] = [Web3.to_checksum_address(address) for address in value]
+        elif depth < MAX_DECODE_DEPTH and param_type in ("bytes", "bytes[]"):
+            payloads = [value] if param_type == "bytes" else list(value)
+            # Only descend into payloads that start with a selector we know
+            if any(len(payload) >= 4 and payload[:4] in SELECTOR_INDEX for payload in payloads):
+                arg["calls"] = [_decode_call(payload, labels, depth + 1) for payload in payloads]
+        args.append(arg)
+
+    rendered = []
+    for arg in args:
+        if arg["calls"]:
+            calls = [call["summary"] or payload for call, payload in zip(arg["calls"], arg["value"] if arg["type"] == "bytes[]" else [arg["value"]])]
+            rendered.append(calls[0] if arg["type"] == "bytes" else "[" + ", ".join(calls) + "]")
+        else:
+            rendered.append(arg["label"] or _render(arg["value"], labels))
+
+    result.update({
+        "contract": fragment["contract"],
+        "function": fragment["function"],
+        "signature": fragment["signature"],
+        "args": args,
+        "summary": f"{fragment['contract']}.{fragment['function']}({', '.join(rendered)})"
+    })
+    return result
+
+@lru_cache(maxsize=DECODE_CACHE_SIZE)
+def _decode_cached(data: str, chain: Optional[str]) -> Dict[str, Any]:
+    """Memoized decoding keyed by normalized calldata and chain"""
+    try:
+        payload = bytes.fromhex(data[2:] if data.startswith("0x") else data)
+    except ValueError:
+        return _undecoded(None, "Calldata is not valid hex")
+    return _decode_call(payload, address_labels(chain), 0)
+
+def decode_calldata(data: str, chain: Optional[str] = None) -> Dict[str, Any]:
+    """Decode calldata, labelling the chain's configured contract addresses by name"""
+    return _decode_cached(data.lower(), chain)
+
+def decode_many(calldatas: List[str], chain: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Decode a batch of calldata, e.g. every action of a page of proposals"""
+    # Fail the whole batch up front on an unknown chain rather than per item
+    address_labels(chain)
+    return [decode_calldata(data, chain) for data in calldatas]
+
+def cache_stats() -> Dict[str, int]:
+    """Hit and miss counters of the decode cache"""
+    info = _decode_cached.cache_info()
+    return {"hits": info.hits, "misses": info.misses, "entries": info.currsize, "max_entries": info.maxsize}
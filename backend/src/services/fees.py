@@ -0,0 +1,163 @@
+"""
+Gas estimation and EIP-1559 fee oracle for outgoing transactions.
+"""
+
+import os
+import statistics
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .cache import read_cache
+
+# Headroom added on top of eth_estimateGas, e.g. 1.2 for 20%
+GAS_ESTIMATE_MARGIN = float(os.getenv("GAS_ESTIMATE_MARGIN", "1.2"))
+
+# Rolling eth_feeHistory window and the reward percentile used as the priority fee
+FEE_HISTORY_BLOCKS = int(os.getenv("FEE_HISTORY_BLOCKS", "10"))
+FEE_REWARD_PERCENTILE = float(os.getenv("FEE_REWARD_PERCENTILE", "50"))
+
+# maxFeePerGas = multiplier * next base fee + priority fee, surviving several full blocks of base fee growth
+BASE_FEE_MULTIPLIER = int(os.getenv("BASE_FEE_MULTIPLIER", "2"))
+
+# Floor for the priority fee on chains whose recent blocks paid no tips
+MIN_PRIORITY_FEE = int(os.getenv("MIN_PRIORITY_FEE_WEI", "1000000"))
+
+# How long fees are reused when the latest block is unknown, in seconds
+FEE_CACHE_TTL = float(os.getenv("FEE_CACHE_TTL", "2"))
+
+# Fee parameters per chain ID: (block number, fetched at, params)
+_fee_cache: Dict[int, Tuple[int, float, Dict[str, int]]] = {}
+# Chains found not to support EIP-1559, which use legacy gasPrice from then on
+_legacy_chains: set = set()
+_fee_lock = threading.Lock()
+
+def with_margin(gas: int, margin: float = GAS_ESTIMATE_MARGIN) -> int:
+    """Apply the safety margin to a gas estimate"""
+    return int(gas * margin)
+
+def max_fee_per_gas(fees: Dict[str, int]) -> int:
+    """Highest price per gas the transaction may pay"""
+    return fees.get("maxFeePerGas", fees.get("gasPrice", 0))
+
+def _fees_from_history(history: Any) -> Optional[Tuple[int, Dict[str, int]]]:
+    """Build EIP-1559 fee fields from an eth_feeHistory result, or None if the chain has no base fee"""
+    base_fees = history["baseFeePerGas"]
+    if not base_fees or not any(base_fees):
+        return None
+
+    # The last base fee is the one the next block will charge
+    next_base_fee = base_fees[-1]
+    rewards = [block_rewards[0] for block_rewards in history.get("reward") or [] if block_rewards]
+    priority_fee = max(int(statistics.median(rewards)) if rewards else 0, MIN_PRIORITY_FEE)
+    newest_block = history["oldestBlock"] + len(base_fees) - 2
+
+    return newest_block, {
+        "maxPriorityFeePerGas": priority_fee,
+        "maxFeePerGas": BASE_FEE_MULTIPLIER * next_base_fee + priority_fee
+    }
+
+def _cached_fees(chain_id: int, endpoint: str) -> Optional[Dict[str, int]]:
+    """Fees computed for the current block, if still valid"""
+    with _fee_lock:
+        cached = _fee_cache.get(chain_id)
+    if cached is None:
+        return None
+
+    block_number, fetched_at, fees = cached
+    latest = read_cache.latest_block(endpoint)
+    if latest is not None:
+        return fees if latest <= block_number else None
+    return fees if time.monotonic() - fetched_at < FEE_CACHE_TTL else None
+
+def _store_fees(chain_id: int, block_number: int, fees: Dict[str, int]) -> None:
+    """Remember fees for a chain at a block"""
+    with _fee_lock:
+        _fee_cache[chain_id] = (block_number, time.monotonic(), fees)
+
+def _mark_legacy(chain_id: int, reason: Any) -> None:
+    """Switch a chain to legacy gas pricing"""
+    print(f"⛽ Chain {chain_id} has no EIP-1559 fee market ({reason}), using legacy gasPrice")
+    with _fee_lock:
+        _legacy_chains.add(chain_id)
+
+def _is_unsupported(error: Exception) -> bool:
+    """Whether an eth_feeHistory error means the node does not implement it at all"""
+    text = str(error).lower()
+    return any(message in text for message in ("-32601", "not found", "not supported", "does not exist"))
+
+def _endpoint(w3: Any) -> str:
+    """RPC endpoint of a Web3 or AsyncWeb3 provider"""
+    return str(getattr(w3.provider, "endpoint_uri", ""))
+
+class FeeOracle:
+    """Estimates gas and prices transactions for one chain"""
+
+    def __init__(self, w3: Any):
+        self.w3 = w3
+
+    def estimate_gas(self, contract_function: Any, sender: str) -> int:
+        """eth_estimateGas for a contract call, plus the safety margin"""
+        return with_margin(contract_function.estimate_gas({'from': sender}))
+
+    def fee_params(self) -> Dict[str, int]:
+        """EIP-1559 fee fields, or legacy gasPrice on chains without a base fee"""
+        chain_id = self.w3.eth.chain_id
+        if chain_id in _legacy_chains:
+            return {"gasPrice": self.w3.eth.gas_price}
+
+        fees = _cached_fees(chain_id, _endpoint(self.w3))
+        if fees is not None:
+            return fees
+
+        try:
+            history = self.w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [FEE_REWARD_PERCENTILE])
+            computed = _fees_from_history(history)
+        except Exception as e:
+            # Only give up on EIP-1559 for good when the method is missing, not on a transient failure
+            if _is_unsupported(e):
+                _mark_legacy(chain_id, e)
+            return {"gasPrice": self.w3.eth.gas_price}
+        if computed is None:
+            _mark_legacy(chain_id, "no base fee")
+            return {"gasPrice": self.w3.eth.gas_price}
+
+        block_number, fees = computed
+        _store_fees(chain_id, block_number, fees)
+        return fees
+
+class AsyncFeeOracle:
+    """Async counterpart of FeeOracle, sharing its per-chain fee cache"""
+
+    def __init__(self, w3: Any):
+        self.w3 = w3
+
+    async def estimate_gas(self, contract_function: Any, sender: str) -> int:
+        """eth_estimateGas for a contract call, plus the safety margin"""
+        return with_margin(await contract_function.estimate_gas({'from': sender}))
+
+    async def fee_params(self) -> Dict[str, int]:
+        """EIP-1559 fee fields, or legacy gasPrice on chains without a base fee"""
+        chain_id = await self.w3.eth.chain_id
+        if chain_id in _legacy_chains:
+            return {"gasPrice": await self.w3.eth.gas_price}
+
+        fees = _cached_fees(chain_id, _endpoint(self.w3))
+        if fees is not None:
+            return fees
+
+        try:
+            history = await self.w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [FEE_REWARD_PERCENTILE])
+            computed = _fees_from_history(history)
+        except Exception as e:
+            # Only give up on EIP-1559 for good when the method is missing, not on a transient failure
+            if _is_unsupported(e):
+                _mark_legacy(chain_id, e)
+            return {"gasPrice": await self.w3.eth.gas_price}
+        if computed is None:
+            _mark_legacy(chain_id, "no base fee")
+            return {"gasPrice": await self.w3.eth.gas_price}
+
+        block_number, fees = computed
+        _store_fees(chain_id, block_number, fees)
+        return fees
@@ -2,129 +2,191 @@
 Governance service for creating and submitting governance proposals.
 """
 
-from typing import Optional
-from web3 import Web3
+import asyncio
+from typing import Any, Dict, Optional
+from web3 import AsyncWeb3, Web3
 from eth_account import Account
 from ..models import GovernanceProposal
 from ..abis import GOVERNANCE_ABI
+from .fees import AsyncFeeOracle, FeeOracle, max_fee_per_gas
+from .transactions import AsyncTransactionPipeline, TransactionPipeline
+
+def has_sufficient_funds(account_address: str, balance: int, gas_price: int, estimated_gas: int) -> bool:
+    """Log the expected transaction cost and check the account can pay for it"""
+    estimated_cost = gas_price * estimated_gas
+
+    print(f"👤 Account Address: {account_address}")
+    print(f"💰 Account Balance: {balance / 1e18:.6f} ETH")
+    print(f"⛽ Gas Price: {gas_price / 1e9:.2f} Gwei")
+    print(f"🔥 Estimated Gas: {estimated_gas:,}")
+    print(f"💸 Estimated Cost: {estimated_cost / 1e18:.6f} ETH")
+
+    if balance < estimated_cost:
+        shortage = estimated_cost - balance
+        print(f"❌ Insufficient funds: Need {estimated_cost / 1e18:.6f} ETH, have {balance / 1e18:.6f} ETH")
+        print(f"💰 Short by: {shortage / 1e18:.6f} ETH")
+        print(f"🔗 Please send ETH to: {account_address}")
+        return False
+
+    return True
 
 class GovernanceService:
     """Service for creating governance proposals"""
-    
-    def __init__(self, rpc_url: str, private_key: str):
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not self.w3.is_connected():
-            raise ValueError(f"Failed to connect to RPC: {rpc_url}")
-        
+
+    def __init__(self, rpc_url: str, private_key: str, w3: Optional[Web3] = None):
+        # Reuse a shared provider when given one, otherwise open a dedicated connection
+        if w3 is None:
+            w3 = Web3(Web3.HTTPProvider(rpc_url))
+            if not w3.is_connected():
+                raise ValueError(f"Failed to connect to RPC: {rpc_url}")
+        self.w3 = w3
+
         self.account = Account.from_key(private_key)
         self.w3.eth.default_account = self.account.address
-    
+        self.pipeline = TransactionPipeline(self.w3, self.account)
+        self.fees = FeeOracle(self.w3)
+
+    def _send(self, contract_function, label: str) -> Optional[str]:
+        """Check funds, then sign and submit a governance transaction through the nonce pipeline"""
+        # Estimate gas and fees for this call, then check the account can pay the worst case
+        gas = self.fees.estimate_gas(contract_function, self.account.address)
+        fees = self.fees.fee_params()
+        balance = self.w3.eth.get_balance(self.account.address)
+        if not has_sufficient_funds(self.account.address, balance, max_fee_per_gas(fees), gas):
+            return None
+
+        print(f"📤 Sending {label}...")
+        tx_hash = self.pipeline.send(contract_function, {'gas': gas, **fees})
+
+        print(f"✅ {label.capitalize()} sent: {tx_hash}")
+        return tx_hash
+
     def create_proposal(self, governance_address: str, proposal: GovernanceProposal) -> Optional[str]:
         """Create a governance proposal"""
         governance_contract = self.w3.eth.contract(
             address=Web3.to_checksum_address(governance_address),
             abi=GOVERNANCE_ABI
         )
-        
+
         try:
-            # Check account balance first
-            balance = self.w3.eth.get_balance(self.account.address)
-            gas_price = self.w3.eth.gas_price
-            estimated_gas = 500000  # other chains gas
-            # estimated_gas = 50440817951 # mantle gas
-            estimated_cost = gas_price * estimated_gas
-            
-            print(f"👤 Account Address: {self.account.address}")
-            print(f"💰 Account Balance: {balance / 1e18:.6f} ETH")
-            print(f"⛽ Gas Price: {gas_price / 1e9:.2f} Gwei")
-            print(f"🔥 Estimated Gas: {estimated_gas:,}")
-            print(f"💸 Estimated Cost: {estimated_cost / 1e18:.6f} ETH")
-            
-            if balance < estimated_cost:
-                shortage = estimated_cost - balance
-                print(f"❌ Insufficient funds: Need {estimated_cost / 1e18:.6f} ETH, have {balance / 1e18:.6f} ETH")
-                print(f"💰 Short by: {shortage / 1e18:.6f} ETH")
-                print(f"🔗 Please send ETH to: {self.account.address}")
-                return None
-            
-            # Build transaction
-            tx = governance_contract.functions.propose(
-                proposal.targets,
-                proposal.values,
-                proposal.calldatas,
-                proposal.description
-            ).build_transaction({
-                'from': self.account.address,
-                'gas': estimated_gas,
-                'gasPrice': gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address)
-            })
-            
-            # Sign transaction
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.account.key)
-            
-            print("📤 Sending transaction...")
-            # Send the raw transaction bytes directly
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            print(f"✅ Transaction sent: {self.w3.to_hex(tx_hash)}")
-            return self.w3.to_hex(tx_hash)
-            
+            return self._send(
+                governance_contract.functions.propose(
+                    proposal.targets,
+                    proposal.values,
+                    proposal.calldatas,
+                    proposal.description
+                ),
+                "transaction"
+            )
         except Exception as e:
             print(f"❌ Error creating proposal: {str(e)}")
             return None
-    
+
     def execute_proposal(self, governance_address: str, targets: list, values: list, calldatas: list, description_hash: bytes) -> Optional[str]:
         """Execute a governance proposal"""
         governance_contract = self.w3.eth.contract(
             address=Web3.to_checksum_address(governance_address),
             abi=GOVERNANCE_ABI
         )
-        
+
         try:
-            # Check account balance first
-            balance = self.w3.eth.get_balance(self.account.address)
-            gas_price = self.w3.eth.gas_price
-            estimated_gas = 500000
-            # estimated_gas = 50440817951 # mantle gas
-            estimated_cost = gas_price * estimated_gas
-            
-            print(f"👤 Account Address: {self.account.address}")
-            print(f"💰 Account Balance: {balance / 1e18:.6f} ETH")
-            print(f"⛽ Gas Price: {gas_price / 1e9:.2f} Gwei")
-            print(f"🔥 Estimated Gas: {estimated_gas:,}")
-            print(f"💸 Estimated Cost: {estimated_cost / 1e18:.6f} ETH")
-            
-            if balance < estimated_cost:
-                shortage = estimated_cost - balance
-                print(f"❌ Insufficient funds: Need {estimated_cost / 1e18:.6f} ETH, have {balance / 1e18:.6f} ETH")
-                print(f"💰 Short by: {shortage / 1e18:.6f} ETH")
-                print(f"🔗 Please send ETH to: {self.account.address}")
-                return None
-            
-            # Build transaction
-            tx = governance_contract.functions.execute(
-                targets,
-                values,
-                calldatas,
-                description_hash
-            ).build_transaction({
-                'from': self.account.address,
-                'gas': estimated_gas,
-                'gasPrice': gas_price,
-                'nonce': self.w3.eth.get_transaction_count(self.account.address)
-            })
-            
-            # Sign transaction
-            signed_tx = self.w3.eth.account.sign_transaction(tx, self.account.key)
-            
-            print("📤 Sending execution transaction...")
-            # Send the raw transaction bytes directly
-            tx_hash = self.w3.eth.send_raw_transaction(signed_tx.rawTransaction)
-            
-            print(f"✅ Execution transaction sent: {self.w3.to_hex(tx_hash)}")
-            return self.w3.to_hex(tx_hash)
-            
+            return self._send(
+                governance_contract.functions.execute(
+                    targets,
+                    values,
+                    calldatas,
+                    description_hash
+                ),
+                "execution transaction"
+            )
         except Exception as e:
             print(f"❌ Error executing proposal: {str(e)}")
-            return None 
\ No newline at end of file
+            return None
+
+async def fetch_proposal_actions(w3: AsyncWeb3, governance_address: str, proposal_id: str) -> Optional[Dict[str, Any]]:
+    """Actions and description hash of a proposal stored by the Governor, or None if it has no such proposal"""
+    governance_contract = w3.eth.contract(
+        address=Web3.to_checksum_address(governance_address),
+        abi=GOVERNANCE_ABI
+    )
+
+    try:
+        targets, values, calldatas, description_hash = await governance_contract.functions.proposalDetails(int(proposal_id)).call()
+    except Exception as e:
+        print(f"❌ Error reading proposal {proposal_id}: {str(e)}")
+        return None
+    return {
+        "proposal_id": proposal_id,
+        "targets": list(targets),
+        "values": [str(value) for value in values],
+        "calldatas": ["0x" + bytes(calldata).hex() for calldata in calldatas],
+        "description_hash": "0x" + bytes(description_hash).hex()
+    }
+
+class AsyncGovernanceService:
+    """Async service for creating governance proposals"""
+
+    def __init__(self, w3: AsyncWeb3, private_key: str):
+        self.w3 = w3
+        self.account = Account.from_key(private_key)
+        self.pipeline = AsyncTransactionPipeline(self.w3, self.account)
+        self.fees = AsyncFeeOracle(self.w3)
+
+    async def _send(self, contract_function, label: str) -> Optional[str]:
+        """Check funds, then sign and submit a governance transaction through the nonce pipeline"""
+        # Estimate gas and fees for this call, then check the account can pay the worst case
+        gas, fees, balance = await asyncio.gather(
+            self.fees.estimate_gas(contract_function, self.account.address),
+            self.fees.fee_params(),
+            self.w3.eth.get_balance(self.account.address)
+        )
+        if not has_sufficient_funds(self.account.address, balance, max_fee_per_gas(fees), gas):
+            return None
+
+        print(f"📤 Sending {label}...")
+        tx_hash = await self.pipeline.send(contract_function, {'gas': gas, **fees})
+
+        print(f"✅ {label.capitalize()} sent: {tx_hash}")
+        return tx_hash
+
+    async def create_proposal(self, governance_address: str, proposal: GovernanceProposal) -> Optional[str]:
+        """Create a governance proposal"""
+        governance_contract = self.w3.eth.contract(
+            address=Web3.to_checksum_address(governance_address),
+            abi=GOVERNANCE_ABI
+        )
+
+        try:
+            return await self._send(
+                governance_contract.functions.propose(
+                    proposal.targets,
+                    proposal.values,
+                    proposal.calldatas,
+                    proposal.description
+                ),
+                "transaction"
+            )
+        except Exception as e:
+            print(f"❌ Error creating proposal: {str(e)}")
+            return None
+
+    async def execute_proposal(self, governance_address: str, targets: list, values: list, calldatas: list, description_hash: bytes) -> Optional[str]:
+        """Execute a governance proposal"""
+        governance_contract = self.w3.eth.contract(
+            address=Web3.to_checksum_address(governance_address),
+            abi=GOVERNANCE_ABI
+        )
+
+        try:
+            return await self._send(
+                governance_contract.functions.execute(
+                    targets,
+                    values,
+                    calldatas,
+                    description_hash
+                ),
+                "execution transaction"
+            )
+        except Exception as e:
+            print(f"❌ Error executing proposal: {str(e)}")
+            return None
@@ -0,0 +1,880 @@
+"""
+Reorg-safe event indexers keeping a local SQLite copy of governance and strategy activity per chain.
+"""
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+from eth_utils import event_abi_to_log_topic
+from web3 import AsyncWeb3, Web3
+
+from ..abis import GOVERNANCE_ABI, STRATEGY_ABI
+from ..config import (
+    INDEXER_DEFAULT_LOOKBACK,
+    INDEXER_POLL_INTERVAL,
+    STRATEGY_METRICS_INTERVAL,
+    get_confirmation_depth,
+    get_index_start_block
+)
+from ..models import StrategyMetrics
+from .multicall import AsyncBatchReader
+from .strategy import build_strategy_metrics
+
+# Governor events the indexer follows
+INDEXED_EVENTS = [
+    "ProposalCreated",
+    "VoteCast",
+    "VoteCastWithParams",
+    "ProposalQueued",
+    "ProposalExecuted",
+    "ProposalCanceled"
+]
+
+# Strategy contract events and the strategy number each one records
+STRATEGY_EVENTS = {
+    "Strategy1Executed": 1,
+    "Strategy2Executed": 2,
+    "Strategy3Executed": 3
+}
+
+# Tables written by each indexer, cleared above the fork point when a reorg is detected
+GOVERNANCE_TABLES = ("proposals", "votes", "proposal_state_changes")
+STRATEGY_TABLES = ("strategy_executions", "strategy_metrics")
+
+# Block hashes compared against the chain per batched request
+BLOCK_HASH_BATCH_SIZE = 100
+
+# Proposal states, mirroring Governor.state(): the first four follow the vote window, the rest come from events
+PROPOSAL_PENDING = "pending"
+PROPOSAL_ACTIVE = "active"
+PROPOSAL_SUCCEEDED = "succeeded"
+PROPOSAL_DEFEATED = "defeated"
+PROPOSAL_QUEUED = "queued"
+PROPOSAL_EXECUTED = "executed"
+PROPOSAL_CANCELED = "canceled"
+PROPOSAL_STATES = [
+    PROPOSAL_PENDING,
+    PROPOSAL_ACTIVE,
+    PROPOSAL_SUCCEEDED,
+    PROPOSAL_DEFEATED,
+    PROPOSAL_QUEUED,
+    PROPOSAL_EXECUTED,
+    PROPOSAL_CANCELED
+]
+
+# GovernorCountingSimple vote types and the tally column each one adds to
+VOTE_TALLY_COLUMNS = {
+    0: "against_votes",
+    1: "for_votes",
+    2: "abstain_votes"
+}
+
+# eth_getLogs block range bounds; the range shrinks on provider limits and grows back on success
+LOG_CHUNK_INITIAL = int(os.getenv("INDEXER_LOG_CHUNK", "2000"))
+LOG_CHUNK_MIN = 1
+LOG_CHUNK_MAX = int(os.getenv("INDEXER_LOG_CHUNK_MAX", "10000"))
+
+# Provider error messages meaning the eth_getLogs range or result set was too large
+LOG_RANGE_ERRORS = (
+    "range",
+    "too many",
+    "limit",
+    "exceed",
+    "timeout",
+    "timed out",
+    "response size"
+)
+
+class GovernanceIndexStore:
+    """SQLite store of normalized governance events, shared by all chains"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            # uint256 values (IDs, weights) are stored as decimal text since SQLite integers are 64-bit
+            self._conn.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS proposals (
+                    chain TEXT NOT NULL,
+                    proposal_id TEXT NOT NULL,
+                    proposer TEXT NOT NULL,
+                    targets TEXT NOT NULL,
+                    "values" TEXT NOT NULL,
+                    signatures TEXT NOT NULL,
+                    calldatas TEXT NOT NULL,
+                    vote_start INTEGER NOT NULL,
+                    vote_end INTEGER NOT NULL,
+                    description TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    eta INTEGER,
+                    for_votes TEXT NOT NULL DEFAULT '0',
+                    against_votes TEXT NOT NULL DEFAULT '0',
+                    abstain_votes TEXT NOT NULL DEFAULT '0',
+                    quorum TEXT,
+                    block_number INTEGER NOT NULL,
+                    tx_hash TEXT NOT NULL,
+                    log_index INTEGER NOT NULL,
+                    PRIMARY KEY (chain, proposal_id)
+                );
+                CREATE INDEX IF NOT EXISTS idx_proposals_state ON proposals (chain, state);
+                CREATE INDEX IF NOT EXISTS idx_proposals_proposer ON proposals (chain, proposer);
+                CREATE INDEX IF NOT EXISTS idx_proposals_block ON proposals (chain, block_number);
+                CREATE INDEX IF NOT EXISTS idx_proposals_order ON proposals (block_number DESC, log_index DESC, chain DESC);
+
+                CREATE TABLE IF NOT EXISTS votes (
+                    chain TEXT NOT NULL,
+                    proposal_id TEXT NOT NULL,
+                    voter TEXT NOT NULL,
+                    support INTEGER NOT NULL,
+                    weight TEXT NOT NULL,
+                    reason TEXT NOT NULL,
+                    params TEXT,
+                    block_number INTEGER NOT NULL,
+                    tx_hash TEXT NOT NULL,
+                    log_index INTEGER NOT NULL,
+                    PRIMARY KEY (chain, tx_hash, log_index)
+                );
+                CREATE INDEX IF NOT EXISTS idx_votes_proposal ON votes (chain, proposal_id);
+                CREATE INDEX IF NOT EXISTS idx_votes_voter ON votes (chain, voter);
+                CREATE INDEX IF NOT EXISTS idx_votes_block ON votes (chain, block_number);
+
+                CREATE TABLE IF NOT EXISTS proposal_state_changes (
+                    chain TEXT NOT NULL,
+                    proposal_id TEXT NOT NULL,
+                    state TEXT NOT NULL,
+                    eta INTEGER,
+                    block_number INTEGER NOT NULL,
+                    tx_hash TEXT NOT NULL,
+                    log_index INTEGER NOT NULL,
+                    PRIMARY KEY (chain, tx_hash, log_index)
+                );
+                CREATE INDEX IF NOT EXISTS idx_state_changes_proposal ON proposal_state_changes (chain, proposal_id);
+                CREATE INDEX IF NOT EXISTS idx_state_changes_block ON proposal_state_changes (chain, block_number);
+
+                CREATE TABLE IF NOT EXISTS strategy_executions (
+                    chain TEXT NOT NULL,
+                    strategy INTEGER NOT NULL,
+                    token TEXT NOT NULL,
+                    amount TEXT NOT NULL,
+                    block_number INTEGER NOT NULL,
+                    tx_hash TEXT NOT NULL,
+                    log_index INTEGER NOT NULL,
+                    PRIMARY KEY (chain, tx_hash, log_index)
+                );
+                CREATE INDEX IF NOT EXISTS idx_strategy_executions_block ON strategy_executions (chain, block_number);
+
+                -- Periodic snapshots of the Strategy contract's metrics, the history backtests replay
+                CREATE TABLE IF NOT EXISTS strategy_metrics (
+                    chain TEXT NOT NULL,
+                    strategy INTEGER NOT NULL,
+                    apy INTEGER NOT NULL,
+                    tvl TEXT NOT NULL,
+                    utilization_rate INTEGER NOT NULL,
+                    risk_adjusted_returns INTEGER NOT NULL,
+                    withdrawal_liquidity INTEGER NOT NULL,
+                    block_number INTEGER NOT NULL,
+                    timestamp INTEGER NOT NULL,
+                    PRIMARY KEY (chain, strategy, block_number)
+                );
+
+                CREATE TABLE IF NOT EXISTS index_checkpoints (
+                    chain TEXT NOT NULL,
+                    contract TEXT NOT NULL,
+                    last_block INTEGER NOT NULL,
+                    finalized_block INTEGER,
+                    PRIMARY KEY (chain, contract)
+                );
+
+                -- Hashes of indexed blocks that are not final yet, used to detect reorgs
+                CREATE TABLE IF NOT EXISTS block_hashes (
+                    chain TEXT NOT NULL,
+                    contract TEXT NOT NULL,
+                    block_number INTEGER NOT NULL,
+                    block_hash TEXT NOT NULL,
+                    PRIMARY KEY (chain, contract, block_number)
+                );
+                """
+            )
+            # Indexes created before tallies and Governor states were tracked
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(proposals)")}
+            for column in ("for_votes", "against_votes", "abstain_votes"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE proposals ADD COLUMN {column} TEXT NOT NULL DEFAULT '0'")
+            if "quorum" not in columns:
+                self._conn.execute("ALTER TABLE proposals ADD COLUMN quorum TEXT")
+            self._conn.execute("UPDATE proposals SET state = ? WHERE state = 'created'", (PROPOSAL_PENDING,))
+            # Checkpoints written before finality was tracked
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(index_checkpoints)")}
+            if "finalized_block" not in columns:
+                self._conn.execute("ALTER TABLE index_checkpoints ADD COLUMN finalized_block INTEGER")
+
+        # Content version per chain, bumped on every change so readers can cache and send ETags
+        self.epoch = uuid.uuid4().hex[:8]
+        self._versions: Dict[str, int] = {}
+
+    def version(self, chain: Optional[str] = None) -> str:
+        """Opaque version of one chain's indexed data, or of all chains"""
+        with self._lock:
+            if chain is not None:
+                return f"{self.epoch}.{self._versions.get(chain, 0)}"
+            return f"{self.epoch}." + ".".join(f"{name}{version}" for name, version in sorted(self._versions.items()))
+
+    def _bump(self, chain: str) -> None:
+        """Mark a chain's data as changed; the caller holds the lock"""
+        self._versions[chain] = self._versions.get(chain, 0) + 1
+
+    def get_checkpoint(self, chain: str, contract: str) -> Optional[int]:
+        """Last fully indexed block for a contract, or None if never indexed"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_block FROM index_checkpoints WHERE chain = ? AND contract = ?",
+                (chain, contract)
+            ).fetchone()
+        return row["last_block"] if row else None
+
+    def get_finalized_block(self, chain: str, contract: str) -> Optional[int]:
+        """Highest block whose events for a contract are treated as final, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT finalized_block FROM index_checkpoints WHERE chain = ? AND contract = ?",
+                (chain, contract)
+            ).fetchone()
+        return row["finalized_block"] if row else None
+
+    def latest_block_hash(self, chain: str, contract: str) -> Optional[Tuple[int, str]]:
+        """Newest recorded (block number, hash) for a contract, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT block_number, block_hash FROM block_hashes
+                WHERE chain = ? AND contract = ? ORDER BY block_number DESC LIMIT 1
+                """,
+                (chain, contract)
+            ).fetchone()
+        return (row["block_number"], row["block_hash"]) if row else None
+
+    def list_block_hashes(self, chain: str, contract: str) -> List[Tuple[int, str]]:
+        """Every recorded (block number, hash) for a contract, newest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT block_number, block_hash FROM block_hashes
+                WHERE chain = ? AND contract = ? ORDER BY block_number DESC
+                """,
+                (chain, contract)
+            ).fetchall()
+        return [(row["block_number"], row["block_hash"]) for row in rows]
+
+    def write_events(
+        self,
+        chain: str,
+        contract: str,
+        events: List[Dict[str, Any]],
+        last_block: int,
+        block_hashes: Optional[Dict[int, str]] = None
+    ) -> None:
+        """Write decoded events for a block range, their block hashes and the checkpoint in one transaction"""
+        with self._lock, self._conn:
+            for event in events:
+                self._write_event(chain, event)
+            if events:
+                self._bump(chain)
+            self._conn.executemany(
+                """
+                INSERT INTO block_hashes (chain, contract, block_number, block_hash) VALUES (?, ?, ?, ?)
+                ON CONFLICT (chain, contract, block_number) DO UPDATE SET block_hash = excluded.block_hash
+                """,
+                [(chain, contract, block_number, block_hash) for block_number, block_hash in (block_hashes or {}).items()]
+            )
+            self._conn.execute(
+                """
+                INSERT INTO index_checkpoints (chain, contract, last_block) VALUES (?, ?, ?)
+                ON CONFLICT (chain, contract) DO UPDATE SET last_block = excluded.last_block
+                """,
+                (chain, contract, last_block)
+            )
+
+    def finalize(self, chain: str, contract: str, finalized_block: int) -> None:
+        """Mark events up to a block as final and drop the block hashes no longer needed to detect reorgs"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                UPDATE index_checkpoints SET finalized_block = MAX(COALESCE(finalized_block, 0), ?)
+                WHERE chain = ? AND contract = ?
+                """,
+                (finalized_block, chain, contract)
+            )
+            self._conn.execute(
+                "DELETE FROM block_hashes WHERE chain = ? AND contract = ? AND block_number < ?",
+                (chain, contract, finalized_block)
+            )
+
+    def rollback(self, chain: str, contract: str, fork_block: int, tables: Tuple[str, ...]) -> None:
+        """Drop everything a contract's indexer wrote above a fork point and rewind its checkpoint there"""
+        with self._lock, self._conn:
+            # Proposals whose tally or state depends on the rows about to go
+            affected = set()
+            for table in ("votes", "proposal_state_changes"):
+                if table in tables:
+                    affected.update(
+                        row["proposal_id"] for row in self._conn.execute(
+                            f"SELECT DISTINCT proposal_id FROM {table} WHERE chain = ? AND block_number > ?",
+                            (chain, fork_block)
+                        )
+                    )
+
+            for table in tables:
+                self._conn.execute(f"DELETE FROM {table} WHERE chain = ? AND block_number > ?", (chain, fork_block))
+            for proposal_id in affected:
+                self._recompute_proposal(chain, proposal_id)
+
+            self._conn.execute(
+                "DELETE FROM block_hashes WHERE chain = ? AND contract = ? AND block_number > ?",
+                (chain, contract, fork_block)
+            )
+            self._conn.execute(
+                "UPDATE index_checkpoints SET last_block = MIN(last_block, ?) WHERE chain = ? AND contract = ?",
+                (fork_block, chain, contract)
+            )
+            self._bump(chain)
+
+    def _recompute_proposal(self, chain: str, proposal_id: str) -> None:
+        """Rebuild a proposal's tally and event state from its remaining rows; the caller holds the lock and transaction"""
+        tally = {column: 0 for column in VOTE_TALLY_COLUMNS.values()}
+        for row in self._conn.execute(
+            "SELECT support, weight FROM votes WHERE chain = ? AND proposal_id = ?", (chain, proposal_id)
+        ):
+            column = VOTE_TALLY_COLUMNS.get(row["support"])
+            if column is not None:
+                tally[column] += int(row["weight"])
+
+        # Latest remaining state event wins; without one the vote window decides again on the next refresh
+        changes = self._conn.execute(
+            """
+            SELECT state, eta FROM proposal_state_changes WHERE chain = ? AND proposal_id = ?
+            ORDER BY block_number, log_index
+            """,
+            (chain, proposal_id)
+        ).fetchall()
+        state = changes[-1]["state"] if changes else PROPOSAL_PENDING
+        etas = [change["eta"] for change in changes if change["eta"] is not None]
+
+        self._conn.execute(
+            """
+            UPDATE proposals SET for_votes = ?, against_votes = ?, abstain_votes = ?, state = ?, eta = ?
+            WHERE chain = ? AND proposal_id = ?
+            """,
+            (
+                str(tally["for_votes"]),
+                str(tally["against_votes"]),
+                str(tally["abstain_votes"]),
+                state,
+                etas[-1] if etas else None,
+                chain,
+                proposal_id
+            )
+        )
+
+    def _write_event(self, chain: str, event: Dict[str, Any]) -> None:
+        """Insert one decoded event; the caller holds the lock and transaction"""
+        args = event["args"]
+        position = (event["block_number"], event["tx_hash"], event["log_index"])
+        name = event["event"]
+
+        if name == "ProposalCreated":
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO proposals (
+                    chain, proposal_id, proposer, targets, "values", signatures, calldatas,
+                    vote_start, vote_end, description, state, eta, block_number, tx_hash, log_index
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, NULL, ?, ?, ?)
+                """,
+                (
+                    chain,
+                    str(args["proposalId"]),
+                    args["proposer"],
+                    json.dumps(list(args["targets"])),
+                    json.dumps([str(value) for value in args["values"]]),
+                    json.dumps(list(args["signatures"])),
+                    json.dumps(["0x" + bytes(calldata).hex() for calldata in args["calldatas"]]),
+                    args["voteStart"],
+                    args["voteEnd"],
+                    args["description"],
+                    PROPOSAL_PENDING,
+                    *position
+                )
+            )
+        elif name in STRATEGY_EVENTS:
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO strategy_executions (
+                    chain, strategy, token, amount, block_number, tx_hash, log_index
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (chain, STRATEGY_EVENTS[name], args["token"], str(args["amount"]), *position)
+            )
+        elif name in ("VoteCast", "VoteCastWithParams"):
+            params = args.get("params")
+            inserted = self._conn.execute(
+                """
+                INSERT OR IGNORE INTO votes (
+                    chain, proposal_id, voter, support, weight, reason, params, block_number, tx_hash, log_index
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    chain,
+                    str(args["proposalId"]),
+                    args["voter"],
+                    args["support"],
+                    str(args["weight"]),
+                    args["reason"],
+                    "0x" + bytes(params).hex() if params is not None else None,
+                    *position
+                )
+            ).rowcount
+            # Keep the running tally current, counting each vote log once
+            if inserted:
+                self._add_vote_weight(chain, str(args["proposalId"]), args["support"], args["weight"])
+        else:
+            state = {
+                "ProposalQueued": PROPOSAL_QUEUED,
+                "ProposalExecuted": PROPOSAL_EXECUTED,
+                "ProposalCanceled": PROPOSAL_CANCELED
+            }[name]
+            eta = args.get("etaSeconds")
+            self._conn.execute(
+                """
+                INSERT OR IGNORE INTO proposal_state_changes (
+                    chain, proposal_id, state, eta, block_number, tx_hash, log_index
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (chain, str(args["proposalId"]), state, eta, *position)
+            )
+            if eta is not None:
+                self._conn.execute(
+                    "UPDATE proposals SET state = ?, eta = ? WHERE chain = ? AND proposal_id = ?",
+                    (state, eta, chain, str(args["proposalId"]))
+                )
+            else:
+                self._conn.execute(
+                    "UPDATE proposals SET state = ? WHERE chain = ? AND proposal_id = ?",
+                    (state, chain, str(args["proposalId"]))
+                )
+
+    def _add_vote_weight(self, chain: str, proposal_id: str, support: int, weight: int) -> None:
+        """Add a vote's weight to its proposal's tally; the caller holds the lock and transaction"""
+        column = VOTE_TALLY_COLUMNS.get(support)
+        if column is None:
+            return
+        row = self._conn.execute(
+            f"SELECT {column} FROM proposals WHERE chain = ? AND proposal_id = ?", (chain, proposal_id)
+        ).fetchone()
+        if row is None:
+            return
+        self._conn.execute(
+            f"UPDATE proposals SET {column} = ? WHERE chain = ? AND proposal_id = ?",
+            (str(int(row[column]) + weight), chain, proposal_id)
+        )
+
+    def proposals_missing_quorum(self, chain: str, timepoint: int) -> List[Dict[str, Any]]:
+        """Proposals whose snapshot is before the Governor clock timepoint but whose quorum has not been read yet"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT proposal_id, vote_start FROM proposals WHERE chain = ? AND quorum IS NULL AND vote_start < ?",
+                (chain, timepoint)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def set_quorums(self, chain: str, quorums: Dict[str, int]) -> None:
+        """Store the quorum required at each proposal's snapshot"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "UPDATE proposals SET quorum = ? WHERE chain = ? AND proposal_id = ?",
+                [(str(quorum), chain, proposal_id) for proposal_id, quorum in quorums.items()]
+            )
+            if quorums:
+                self._bump(chain)
+
+    def refresh_states(self, chain: str, timepoint: int) -> None:
+        """Advance vote-window states the way Governor.state() would at the given Governor clock timepoint"""
+        with self._lock, self._conn:
+            changed = self._conn.execute(
+                "UPDATE proposals SET state = ? WHERE chain = ? AND state = ? AND vote_start < ? AND vote_end >= ?",
+                (PROPOSAL_ACTIVE, chain, PROPOSAL_PENDING, timepoint, timepoint)
+            ).rowcount
+
+            # Closed votes need the quorum to decide between succeeded and defeated
+            closed = self._conn.execute(
+                """
+                SELECT proposal_id, for_votes, against_votes, abstain_votes, quorum FROM proposals
+                WHERE chain = ? AND state IN (?, ?) AND vote_end < ? AND quorum IS NOT NULL
+                """,
+                (chain, PROPOSAL_PENDING, PROPOSAL_ACTIVE, timepoint)
+            ).fetchall()
+            for row in closed:
+                for_votes, against_votes, abstain_votes = int(row["for_votes"]), int(row["against_votes"]), int(row["abstain_votes"])
+                # GovernorCountingSimple: for and abstain count toward quorum, and for must beat against
+                succeeded = for_votes > against_votes and for_votes + abstain_votes >= int(row["quorum"])
+                self._conn.execute(
+                    "UPDATE proposals SET state = ? WHERE chain = ? AND proposal_id = ?",
+                    (PROPOSAL_SUCCEEDED if succeeded else PROPOSAL_DEFEATED, chain, row["proposal_id"])
+                )
+
+            if changed or closed:
+                self._bump(chain)
+
+    def list_proposals(
+        self,
+        chain: Optional[str] = None,
+        state: Optional[str] = None,
+        proposer: Optional[str] = None,
+        after: Optional[tuple] = None,
+        limit: int = 50
+    ) -> List[Dict[str, Any]]:
+        """List indexed proposals newest first, continuing after a (block number, log index, chain) position"""
+        clauses, values = [], []
+        if chain is not None:
+            clauses.append("chain = ?")
+            values.append(chain)
+        if state is not None:
+            clauses.append("state = ?")
+            values.append(state)
+        if proposer is not None:
+            clauses.append("proposer = ?")
+            values.append(Web3.to_checksum_address(proposer))
+        if after is not None:
+            clauses.append("(block_number, log_index, chain) < (?, ?, ?)")
+            values.extend(after)
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM proposals {where} ORDER BY block_number DESC, log_index DESC, chain DESC LIMIT ?",
+                (*values, limit)
+            ).fetchall()
+        return [self._proposal_row(row) for row in rows]
+
+    def get_proposal(self, chain: str, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """Get one indexed proposal"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM proposals WHERE chain = ? AND proposal_id = ?", (chain, proposal_id)
+            ).fetchone()
+        return self._proposal_row(row) if row else None
+
+    def list_strategy_executions(self, chain: str, limit: int = 50) -> List[Dict[str, Any]]:
+        """List a chain's indexed strategy executions newest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT * FROM strategy_executions WHERE chain = ?
+                ORDER BY block_number DESC, log_index DESC LIMIT ?
+                """,
+                (chain, limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def latest_strategy_metrics_block(self, chain: str) -> Optional[int]:
+        """Block of a chain's newest strategy metrics snapshot, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(block_number) AS block_number FROM strategy_metrics WHERE chain = ?", (chain,)
+            ).fetchone()
+        return row["block_number"]
+
+    def write_strategy_metrics(self, chain: str, block_number: int, timestamp: int, strategies: List[StrategyMetrics]) -> None:
+        """Store one snapshot of every strategy's metrics"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                """
+                INSERT OR REPLACE INTO strategy_metrics (
+                    chain, strategy, apy, tvl, utilization_rate, risk_adjusted_returns, withdrawal_liquidity,
+                    block_number, timestamp
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    (
+                        chain,
+                        strategy.strategy_id,
+                        strategy.apy,
+                        str(strategy.tvl),
+                        strategy.utilization_rate,
+                        strategy.risk_adjusted_returns,
+                        strategy.withdrawal_liquidity,
+                        block_number,
+                        timestamp
+                    )
+                    for strategy in strategies
+                ]
+            )
+
+    def list_strategy_metrics(self, chain: str, since: Optional[int] = None) -> List[Dict[str, Any]]:
+        """A chain's strategy metrics snapshots in time order, optionally from a timestamp on"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT * FROM strategy_metrics WHERE chain = ? AND timestamp >= ?
+                ORDER BY block_number, strategy
+                """,
+                (chain, since or 0)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def list_votes(self, chain: str, proposal_id: str) -> List[Dict[str, Any]]:
+        """List the votes cast on a proposal in chain order"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM votes WHERE chain = ? AND proposal_id = ? ORDER BY block_number, log_index",
+                (chain, proposal_id)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _proposal_row(row: sqlite3.Row) -> Dict[str, Any]:
+        """Decode the JSON columns of a proposal row"""
+        proposal = dict(row)
+        for column in ("targets", "values", "signatures", "calldatas"):
+            proposal[column] = json.loads(proposal[column])
+        return proposal
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+def _is_range_error(error: Exception) -> bool:
+    """Whether an eth_getLogs failure means the block range should shrink"""
+    text = str(error).lower()
+    return any(message in text for message in LOG_RANGE_ERRORS)
+
+def _hex_hash(value: Any) -> str:
+    """Normalize a block hash from a raw or decoded response to 0x-prefixed hex"""
+    return value.lower() if isinstance(value, str) else "0x" + bytes(value).hex()
+
+class ContractLogIndexer:
+    """Follows one contract's events on one chain, surviving reorgs within the confirmation depth
+
+    Each poll re-reads the hash of the newest indexed block alongside the head in one batched
+    request. Block hashes commit to every ancestor, so an unchanged hash means nothing indexed
+    has been reorged out; on a mismatch the stored window of recent hashes locates the fork point
+    and everything above it is rolled back and indexed again.
+    """
+
+    # Set by subclasses: contract ABI, followed events, tables written and start block setting name
+    abi: List[Dict[str, Any]] = []
+    events: List[str] = []
+    tables: Tuple[str, ...] = ()
+    kind = ""
+
+    def __init__(
+        self,
+        chain: str,
+        w3: AsyncWeb3,
+        store: GovernanceIndexStore,
+        address: str,
+        poll_interval: float = INDEXER_POLL_INTERVAL,
+        confirmations: Optional[int] = None
+    ):
+        self.chain = chain
+        self.w3 = w3
+        self.store = store
+        self.address = Web3.to_checksum_address(address)
+        self.poll_interval = poll_interval
+        self.confirmations = confirmations if confirmations is not None else get_confirmation_depth(chain)
+        self.chunk_size = LOG_CHUNK_INITIAL
+        # Largest range the provider is believed to accept, lowered whenever it rejects one
+        self.chunk_ceiling = LOG_CHUNK_MAX
+        self.reorgs = 0
+        self.head_timestamp: Optional[int] = None
+        self.contract = w3.eth.contract(address=self.address, abi=self.abi)
+        # topic0 -> event name, so one eth_getLogs call covers every followed event
+        self.topics = {
+            "0x" + event_abi_to_log_topic(abi).hex(): abi["name"]
+            for abi in self.abi
+            if abi.get("type") == "event" and abi["name"] in self.events
+        }
+
+    def _start_block(self, head: int) -> int:
+        """First block to index: after the checkpoint, the configured start, or a lookback from the head"""
+        checkpoint = self.store.get_checkpoint(self.chain, self.address)
+        if checkpoint is not None:
+            return checkpoint + 1
+
+        start_block = get_index_start_block(self.chain, self.kind)
+        if start_block is not None:
+            return start_block
+        return max(head - INDEXER_DEFAULT_LOOKBACK, 0)
+
+    async def _get_blocks(self, block_ids: List[Any]) -> List[Optional[Dict[str, Any]]]:
+        """Fetch block headers by number or tag in one JSON-RPC round trip"""
+        responses = await self.w3.provider.make_batch_request(
+            [("eth_getBlockByNumber", [hex(block_id) if isinstance(block_id, int) else block_id, False]) for block_id in block_ids]
+        )
+        if not isinstance(responses, list):
+            raise ValueError(f"Batched block request failed: {responses.get('error')}")
+        return [response.get("result") for response in responses]
+
+    async def _find_fork_block(self) -> int:
+        """Highest recorded block still on the canonical chain, or the finalized block if none is"""
+        window = self.store.list_block_hashes(self.chain, self.address)
+        for start in range(0, len(window), BLOCK_HASH_BATCH_SIZE):
+            batch = window[start:start + BLOCK_HASH_BATCH_SIZE]
+            blocks = await self._get_blocks([block_number for block_number, _ in batch])
+            for (block_number, block_hash), block in zip(batch, blocks):
+                if block is not None and _hex_hash(block["hash"]) == block_hash:
+                    return block_number
+
+        finalized_block = self.store.get_finalized_block(self.chain, self.address)
+        print(f"⚠️ No recorded block on {self.chain} survived the reorg, rolling back to the finalized block {finalized_block}")
+        if finalized_block is not None:
+            return finalized_block
+        return window[-1][0] - 1 if window else 0
+
+    async def _rollback(self) -> None:
+        """Undo everything indexed above the fork point so it is indexed again from the new chain"""
+        fork_block = await self._find_fork_block()
+        self.store.rollback(self.chain, self.address, fork_block, self.tables)
+        self.reorgs += 1
+        print(f"🔀 Reorg detected on {self.chain}, rolled back {self.kind} index to block {fork_block}")
+
+    async def _get_logs(self, from_block: int, to_block: int) -> List[Any]:
+        """Fetch every followed event in a block range"""
+        return await self.w3.eth.get_logs({
+            "address": self.address,
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "topics": [list(self.topics)]
+        })
+
+    def _decode(self, log: Any) -> Dict[str, Any]:
+        """Decode a raw log into a flat event record"""
+        topic = log["topics"][0]
+        name = self.topics["0x" + bytes(topic).hex()]
+        decoded = self.contract.events[name]().process_log(log)
+        return {
+            "event": name,
+            "args": dict(decoded["args"]),
+            "block_number": log["blockNumber"],
+            "block_hash": _hex_hash(log["blockHash"]),
+            "tx_hash": "0x" + bytes(log["transactionHash"]).hex(),
+            "log_index": log["logIndex"]
+        }
+
+    async def sync_range(self, from_block: int, to_block: int, to_block_hash: Optional[str] = None) -> int:
+        """Index a block range in adaptive chunks and return the number of events written"""
+        # Blocks above this may still be reorged, so their hashes are kept for the next check
+        unfinalized_from = to_block - self.confirmations
+        written = 0
+        while from_block <= to_block:
+            chunk_end = min(from_block + self.chunk_size - 1, to_block)
+            try:
+                logs = await self._get_logs(from_block, chunk_end)
+            except Exception as e:
+                if not _is_range_error(e) or self.chunk_size <= LOG_CHUNK_MIN:
+                    raise
+                # Provider rejected the range or result size: halve it, remember the limit and retry
+                self.chunk_size = max(self.chunk_size // 2, LOG_CHUNK_MIN)
+                self.chunk_ceiling = self.chunk_size
+                continue
+
+            events = [self._decode(log) for log in logs]
+            block_hashes = {}
+            if chunk_end == to_block and to_block_hash is not None:
+                block_hashes[to_block] = to_block_hash
+            # Log block hashes come for free and win over the head hash if a reorg slipped in between
+            block_hashes.update({
+                event["block_number"]: event["block_hash"] for event in events if event["block_number"] > unfinalized_from
+            })
+            self.store.write_events(self.chain, self.address, events, chunk_end, block_hashes)
+            written += len(events)
+            from_block = chunk_end + 1
+
+            # Sparse ranges are cheap, so widen the next request
+            if len(logs) < 1000:
+                self.chunk_size = min(self.chunk_size * 2, self.chunk_ceiling)
+        return written
+
+    async def sync(self) -> int:
+        """Check for reorgs, then index everything from the checkpoint up to the current head"""
+        anchor = self.store.latest_block_hash(self.chain, self.address)
+        blocks = await self._get_blocks(["latest"] + ([anchor[0]] if anchor else []))
+        head, head_hash = int(blocks[0]["number"], 16), _hex_hash(blocks[0]["hash"])
+        self.head_timestamp = int(blocks[0]["timestamp"], 16)
+        if anchor is not None and (blocks[1] is None or _hex_hash(blocks[1]["hash"]) != anchor[1]):
+            await self._rollback()
+
+        written = await self.sync_range(self._start_block(head), head, head_hash)
+        if written:
+            print(f"🗂️ Indexed {written} {self.kind} events on {self.chain} up to block {head}")
+        self.store.finalize(self.chain, self.address, head - self.confirmations)
+
+        await self._after_sync(head)
+        return written
+
+    async def _after_sync(self, head: int) -> None:
+        """Hook for derived data that depends on the head, run after every poll"""
+
+    async def run(self) -> None:
+        """Keep the index current until cancelled"""
+        while True:
+            try:
+                await self.sync()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                print(f"⚠️ {self.kind.capitalize()} indexing failed on {self.chain}: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+class GovernanceIndexer(ContractLogIndexer):
+    """Follows one chain's Governor contract and writes its proposals, votes and state changes"""
+
+    abi = GOVERNANCE_ABI
+    events = INDEXED_EVENTS
+    tables = GOVERNANCE_TABLES
+    kind = "governance"
+
+    async def _after_sync(self, head: int) -> None:
+        """Fill in quorums and advance vote-window states"""
+        # The Governor clock is block.timestamp (CLOCK_MODE "mode=timestamp"), so voteStart and voteEnd
+        # are Unix seconds and are compared with the head's timestamp, not its number
+        await self._fill_quorums(self.head_timestamp)
+        self.store.refresh_states(self.chain, self.head_timestamp)
+
+    async def _fill_quorums(self, timepoint: int) -> None:
+        """Read quorum(voteStart) for proposals whose snapshot has passed, in batched calls"""
+        missing = self.store.proposals_missing_quorum(self.chain, timepoint)
+        reader = AsyncBatchReader(self.w3)
+        for start in range(0, len(missing), 100):
+            batch = missing[start:start + 100]
+            quorums, _ = await reader.call([self.contract.functions.quorum(proposal["vote_start"]) for proposal in batch])
+            self.store.set_quorums(self.chain, {
+                proposal["proposal_id"]: quorum for proposal, quorum in zip(batch, quorums)
+            })
+
+class StrategyIndexer(ContractLogIndexer):
+    """Follows one chain's Strategy contract, recording each strategy execution and periodic metrics snapshots"""
+
+    abi = STRATEGY_ABI
+    events = list(STRATEGY_EVENTS)
+    tables = STRATEGY_TABLES
+    kind = "strategy"
+
+    async def _after_sync(self, head: int) -> None:
+        """Snapshot the strategy metrics once every STRATEGY_METRICS_INTERVAL blocks"""
+        latest = self.store.latest_strategy_metrics_block(self.chain)
+        if latest is not None and head - latest < STRATEGY_METRICS_INTERVAL:
+            return
+        metrics, block_number = await AsyncBatchReader(self.w3).call([
+            self.contract.functions.getStrategy1Metrics(),
+            self.contract.functions.getStrategy2Metrics(),
+            self.contract.functions.getStrategy3Metrics()
+        ])
+        self.store.write_strategy_metrics(self.chain, block_number, self.head_timestamp, build_strategy_metrics(metrics))
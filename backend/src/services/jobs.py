@@ -0,0 +1,253 @@
+"""
+Background job subsystem for long-running crew work, persisted in SQLite.
+"""
+
+import json
+import sqlite3
+import threading
+import traceback
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, UTC
+from typing import Any, Callable, Dict, Optional
+
+from ..config import CHAIN_CONFIGS, get_job_concurrency
+
+# Job lifecycle states
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+# Reporter called by runners as work progresses: report(progress, event="progress", data=None)
+JobReporter = Callable[..., None]
+
+# A runner receives the chain, a progress reporter and the job parameters, and returns a JSON-serializable result
+JobRunner = Callable[[str, JobReporter, Dict[str, Any]], Dict[str, Any]]
+
+# Listener receiving a job's events as (event name, data) while it runs
+JobListener = Callable[[str, Dict[str, Any]], None]
+
+# Hook called with (job ID, kind, chain, result) after a job completes and its result is stored
+JobCompletionHook = Callable[[str, str, str, Dict[str, Any]], None]
+
+class JobStore:
+    """SQLite-backed store so job state and results survive restarts"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    chain TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    progress TEXT,
+                    params TEXT,
+                    result TEXT,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+            # Databases created before job parameters existed
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            if "params" not in columns:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN params TEXT")
+
+    def create(self, kind: str, chain: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Insert a new queued job and return its ID"""
+        job_id = uuid.uuid4().hex
+        now = datetime.now(UTC).isoformat()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO jobs (id, kind, chain, status, progress, params, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (job_id, kind, chain, JOB_QUEUED, "Waiting for a worker", json.dumps(params or {}), now, now)
+            )
+        return job_id
+
+    def update(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        progress: Optional[str] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> None:
+        """Update the given fields of a job"""
+        fields = {"updated_at": datetime.now(UTC).isoformat()}
+        if status is not None:
+            fields["status"] = status
+        if progress is not None:
+            fields["progress"] = progress
+        if result is not None:
+            fields["result"] = json.dumps(result)
+        if error is not None:
+            fields["error"] = error
+
+        assignments = ", ".join(f"{column} = ?" for column in fields)
+        with self._lock, self._conn:
+            self._conn.execute(f"UPDATE jobs SET {assignments} WHERE id = ?", (*fields.values(), job_id))
+
+    def merge_result(self, job_id: str, fields: Dict[str, Any], progress: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Merge fields into a job's stored result in one transaction; returns the merged result, or None if it has none
+
+        Receipts and AI reasoning land on the same job from different threads, so a read-modify-write
+        outside the lock could drop one of them.
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT result FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            if row is None or not row["result"]:
+                return None
+            result = {**json.loads(row["result"]), **fields}
+            self._conn.execute(
+                "UPDATE jobs SET result = ?, progress = COALESCE(?, progress), updated_at = ? WHERE id = ?",
+                (json.dumps(result), progress, datetime.now(UTC).isoformat(), job_id)
+            )
+        return result
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Get a job by ID, or None if it does not exist"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+
+        job = dict(row)
+        job["params"] = json.loads(job["params"]) if job["params"] else {}
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        return job
+
+    def list_by_status(self, status: str) -> list[Dict[str, Any]]:
+        """List jobs in the given status, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, kind, chain, params FROM jobs WHERE status = ? ORDER BY created_at", (status,)
+            ).fetchall()
+        return [{**dict(row), "params": json.loads(row["params"]) if row["params"] else {}} for row in rows]
+
+    def latest_result(self, chain: str, kinds: tuple, field: str) -> Optional[Dict[str, Any]]:
+        """Result of the newest completed job of the given kinds on a chain that sent a transaction and has the field set"""
+        placeholders = ", ".join("?" for _ in kinds)
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                SELECT result FROM jobs
+                WHERE chain = ? AND kind IN ({placeholders}) AND status = ?
+                    AND json_extract(result, '$.tx_hash') IS NOT NULL AND json_extract(result, ?) IS NOT NULL
+                ORDER BY created_at DESC LIMIT 1
+                """,
+                (chain, *kinds, JOB_COMPLETED, f"$.{field}")
+            ).fetchone()
+        return json.loads(row["result"]) if row else None
+
+    def list_pending_transactions(self) -> list[Dict[str, Any]]:
+        """List completed jobs whose transaction receipt is still pending"""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, kind, chain, json_extract(result, '$.tx_hash') AS tx_hash FROM jobs
+                WHERE status = ? AND json_extract(result, '$.receipt.status') = 'pending'
+                ORDER BY created_at
+                """,
+                (JOB_COMPLETED,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+class JobQueue:
+    """Bounded worker pool running jobs with a per-chain concurrency limit"""
+
+    def __init__(self, store: JobStore, runners: Dict[str, JobRunner], on_complete: Optional[JobCompletionHook] = None):
+        self.store = store
+        self.runners = runners
+        self.on_complete = on_complete
+        # One executor per chain so a busy chain cannot starve the others
+        self._executors = {
+            chain: ThreadPoolExecutor(max_workers=get_job_concurrency(chain), thread_name_prefix=f"jobs-{chain}")
+            for chain in CHAIN_CONFIGS
+        }
+
+    def submit(
+        self,
+        kind: str,
+        chain: str,
+        listener: Optional[JobListener] = None,
+        params: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Queue a new job and return its ID, optionally streaming its events to a listener"""
+        if kind not in self.runners:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if chain not in self._executors:
+            raise ValueError(f"Unsupported chain: {chain}. Supported chains: {list(CHAIN_CONFIGS.keys())}")
+
+        job_id = self.store.create(kind, chain, params)
+        self._executors[chain].submit(self._run, job_id, kind, chain, params or {}, listener)
+        return job_id
+
+    def resume(self) -> None:
+        """Re-queue jobs that never started and fail jobs interrupted mid-run by a restart"""
+        for job in self.store.list_by_status(JOB_RUNNING):
+            # A half-run proposal may already have submitted a transaction, so it is not retried
+            self.store.update(job["id"], status=JOB_FAILED, error="Interrupted by server restart")
+
+        for job in self.store.list_by_status(JOB_QUEUED):
+            if job["kind"] in self.runners and job["chain"] in self._executors:
+                self._executors[job["chain"]].submit(self._run, job["id"], job["kind"], job["chain"], job["params"])
+
+    def _run(
+        self,
+        job_id: str,
+        kind: str,
+        chain: str,
+        params: Dict[str, Any],
+        listener: Optional[JobListener] = None
+    ) -> None:
+        """Execute a job in a worker thread and persist its outcome"""
+
+        def notify(event: str, data: Dict[str, Any]) -> None:
+            if listener is not None:
+                try:
+                    listener(event, data)
+                except Exception:
+                    # A disconnected listener must not fail the job
+                    traceback.print_exc()
+
+        def report(progress: str, event: str = "progress", data: Optional[Dict[str, Any]] = None) -> None:
+            self.store.update(job_id, progress=progress)
+            notify(event, {"progress": progress, **(data or {})})
+
+        self.store.update(job_id, status=JOB_RUNNING, progress="Started")
+        notify("started", {"job_id": job_id, "kind": kind, "chain": chain})
+
+        try:
+            result = self.runners[kind](chain, report, params)
+            self.store.update(job_id, status=JOB_COMPLETED, progress="Completed", result=result)
+            if self.on_complete is not None:
+                try:
+                    self.on_complete(job_id, kind, chain, result)
+                except Exception:
+                    # The result is already stored, so a failing hook must not fail the job
+                    traceback.print_exc()
+            notify("result", result)
+        except Exception as e:
+            traceback.print_exc()
+            self.store.update(job_id, status=JOB_FAILED, progress="Failed", error=str(e))
+            notify("error", {"error": str(e)})
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running jobs to finish"""
+        for executor in self._executors.values():
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,147 @@
+"""
+Persistent cache of LLM responses keyed on the model, its settings, the normalized prompt and the
+on-chain snapshot the prompt was built from.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from ..config import LLM_CACHE_MAX_ENTRIES, LLM_CACHE_PATH, LLM_CACHE_TTL
+
+def normalize_prompt(messages: Any) -> Any:
+    """Messages with whitespace runs collapsed, so indentation changes in prompt templates still hit"""
+    if isinstance(messages, str):
+        return " ".join(messages.split())
+    normalized = []
+    for message in messages or []:
+        content = message.get("content")
+        if not isinstance(content, str):
+            content = json.dumps(content, sort_keys=True, default=str)
+        normalized.append({"role": message.get("role"), "content": " ".join(content.split())})
+    return normalized
+
+def snapshot_hash(*states: Any) -> str:
+    """Stable digest of on-chain state, e.g. the model dumps a prompt was built from"""
+    return hashlib.sha256(json.dumps(states, sort_keys=True, default=str).encode()).hexdigest()
+
+def cache_key(scope: str, snapshot: Optional[str], model: str, settings: Dict[str, Any], messages: Any) -> str:
+    """Digest identifying one LLM call"""
+    payload = {
+        "scope": scope,
+        "snapshot": snapshot,
+        "model": model,
+        "settings": settings,
+        "messages": normalize_prompt(messages)
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+class LLMCache:
+    """SQLite-backed LRU of LLM responses with a TTL, invalidated per scope when its snapshot changes"""
+
+    def __init__(self, db_path: str = LLM_CACHE_PATH, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl: float = LLM_CACHE_TTL):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._counters = {"hits": 0, "misses": 0, "invalidations": 0, "evictions": 0}
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_responses (
+                    key TEXT PRIMARY KEY,
+                    scope TEXT NOT NULL,
+                    snapshot TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_scope ON llm_responses (scope, snapshot)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_accessed ON llm_responses (accessed_at)")
+            # Latest snapshot seen per scope, so a state change drops the scope's stale responses
+            self._conn.execute("CREATE TABLE IF NOT EXISTS llm_snapshots (scope TEXT PRIMARY KEY, snapshot TEXT NOT NULL)")
+
+    def get(self, key: str) -> Optional[str]:
+        """Cached response, or None if missing or past the TTL"""
+        now = time.time()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT response, created_at FROM llm_responses WHERE key = ?", (key,)).fetchone()
+            if row is None or now - row["created_at"] > self.ttl:
+                if row is not None:
+                    self._conn.execute("DELETE FROM llm_responses WHERE key = ?", (key,))
+                self._counters["misses"] += 1
+                return None
+            self._conn.execute("UPDATE llm_responses SET accessed_at = ? WHERE key = ?", (now, key))
+            self._counters["hits"] += 1
+            return row["response"]
+
+    def set(self, key: str, response: str, scope: str = "", snapshot: Optional[str] = None) -> None:
+        """Store a response, then drop expired entries and the least recently used past the size bound"""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (key, scope, snapshot, response, created_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, scope, snapshot, response, now, now)
+            )
+            self._conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl,))
+            overflow = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0] - self.max_entries
+            if overflow > 0:
+                self._conn.execute(
+                    "DELETE FROM llm_responses WHERE key IN (SELECT key FROM llm_responses ORDER BY accessed_at LIMIT ?)",
+                    (overflow,)
+                )
+                self._counters["evictions"] += overflow
+
+    def set_snapshot(self, scope: str, snapshot: str) -> int:
+        """Record the current snapshot of a scope, dropping responses cached for any other; returns the number dropped"""
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT snapshot FROM llm_snapshots WHERE scope = ?", (scope,)).fetchone()
+            if row is not None and row["snapshot"] == snapshot:
+                return 0
+            dropped = self._conn.execute(
+                "DELETE FROM llm_responses WHERE scope = ? AND (snapshot IS NULL OR snapshot != ?)",
+                (scope, snapshot)
+            ).rowcount
+            self._conn.execute("INSERT OR REPLACE INTO llm_snapshots (scope, snapshot) VALUES (?, ?)", (scope, snapshot))
+            self._counters["invalidations"] += dropped
+            return dropped
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit, miss and eviction counters plus current size"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM llm_responses").fetchone()[0]
+            return {"entries": entries, "max_entries": self.max_entries, "ttl": self.ttl, **self._counters}
+
+    def clear(self) -> None:
+        """Drop every cached response and snapshot"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.execute("DELETE FROM llm_snapshots")
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+_llm_cache: Optional[LLMCache] = None
+_llm_cache_lock = threading.Lock()
+
+def get_llm_cache() -> LLMCache:
+    """Process-wide LLM cache, opened on first use"""
+    global _llm_cache
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = LLMCache()
+        return _llm_cache
+
+def llm_cache_stats() -> Optional[Dict[str, Any]]:
+    """Counters of the process-wide LLM cache, or None if nothing has used it yet"""
+    return _llm_cache.stats() if _llm_cache is not None else None
@@ -0,0 +1,149 @@
+"""
+Batched read layer for packing multiple contract calls into a single round trip.
+"""
+
+import asyncio
+import os
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from eth_utils.abi import collapse_if_tuple
+from web3 import AsyncWeb3, Web3
+from web3.contract.async_contract import AsyncContractFunction
+from web3.contract.contract import ContractFunction
+
+from ..abis import MULTICALL3_ABI
+
+# Multicall3 is deployed at the same address on most EVM chains
+MULTICALL3_ADDRESS = os.getenv("MULTICALL3_ADDRESS", "0xcA11bde05977b3631167028862bE2a173976CA11")
+
+# Whether Multicall3 is deployed, remembered per RPC endpoint
+_multicall_support: Dict[str, bool] = {}
+_support_lock = threading.Lock()
+
+def _decode_output(w3: Any, fn: Any, data: bytes) -> Any:
+    """Decode return data the same way ContractFunction.call() does"""
+    output_types = [collapse_if_tuple(output) for output in fn.abi["outputs"]]
+    decoded = w3.codec.decode(output_types, data)
+    return decoded[0] if len(decoded) == 1 else decoded
+
+def _block_identifier(block_number: Optional[int]) -> Any:
+    """Block to run an eth_call at"""
+    return "latest" if block_number is None else block_number
+
+def _pack_call(fn: Any) -> Tuple[str, bool, str]:
+    """Pack a contract function into a Multicall3.Call3 tuple"""
+    return (Web3.to_checksum_address(fn.address), False, fn._encode_transaction_data())
+
+class BatchReader:
+    """Executes read-only contract calls in one round trip, pinned to a single block"""
+
+    def __init__(self, w3: Web3, multicall_address: str = MULTICALL3_ADDRESS):
+        self.w3 = w3
+        self.multicall = w3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address),
+            abi=MULTICALL3_ABI
+        )
+
+    @property
+    def endpoint(self) -> str:
+        """RPC endpoint of the underlying provider"""
+        return str(getattr(self.w3.provider, "endpoint_uri", ""))
+
+    def has_multicall(self) -> bool:
+        """Check once per endpoint whether Multicall3 is deployed"""
+        endpoint = self.endpoint
+        with _support_lock:
+            supported = _multicall_support.get(endpoint)
+        if supported is None:
+            supported = len(self.w3.eth.get_code(self.multicall.address)) > 0
+            with _support_lock:
+                _multicall_support[endpoint] = supported
+        return supported
+
+    def call(self, calls: Sequence[ContractFunction], block_number: Optional[int] = None) -> Tuple[List[Any], int]:
+        """Execute the calls at a block (the latest by default) and return their decoded results with that block"""
+        if self.has_multicall():
+            return self._call_multicall(calls, block_number)
+        return self._call_json_rpc_batch(calls, block_number)
+
+    def _call_multicall(self, calls: Sequence[ContractFunction], block_number: Optional[int] = None) -> Tuple[List[Any], int]:
+        """Pack the calls into one Multicall3.aggregate3 eth_call"""
+        # Include getBlockNumber so we know which block every result was read at
+        block_call = self.multicall.functions.getBlockNumber()
+        packed = [_pack_call(block_call)] + [_pack_call(fn) for fn in calls]
+
+        responses = self.multicall.functions.aggregate3(packed).call(block_identifier=_block_identifier(block_number))
+
+        block_number = _decode_output(self.w3, block_call, responses[0][1])
+        results = [_decode_output(self.w3, fn, return_data) for fn, (_, return_data) in zip(calls, responses[1:])]
+        return results, block_number
+
+    def _call_json_rpc_batch(self, calls: Sequence[ContractFunction], block_number: Optional[int] = None) -> Tuple[List[Any], int]:
+        """Fall back to a JSON-RPC batch of eth_calls pinned to one block"""
+        if block_number is None:
+            block_number = self.w3.eth.block_number
+        block_tag = hex(block_number)
+
+        # Sent through the provider so the pooled session, timeout and headers of the registry apply
+        try:
+            responses = self.w3.provider.make_batch_request([
+                ("eth_call", [{"to": Web3.to_checksum_address(fn.address), "data": fn._encode_transaction_data()}, block_tag])
+                for fn in calls
+            ])
+        except Exception as e:
+            print(f"⚠️ JSON-RPC batch failed on {self.endpoint}, reading calls one by one: {str(e)}")
+            responses = None
+
+        # Nodes without batch support answer with a single error object instead of a list
+        if not isinstance(responses, list) or len(responses) != len(calls) or any("error" in response for response in responses):
+            return [fn.call(block_identifier=block_number) for fn in calls], block_number
+
+        results = [
+            _decode_output(self.w3, fn, Web3.to_bytes(hexstr=response["result"]))
+            for fn, response in zip(calls, responses)
+        ]
+        return results, block_number
+
+class AsyncBatchReader:
+    """Async counterpart of BatchReader for AsyncWeb3 providers"""
+
+    def __init__(self, w3: AsyncWeb3, multicall_address: str = MULTICALL3_ADDRESS):
+        self.w3 = w3
+        self.multicall = w3.eth.contract(
+            address=Web3.to_checksum_address(multicall_address),
+            abi=MULTICALL3_ABI
+        )
+
+    @property
+    def endpoint(self) -> str:
+        """RPC endpoint of the underlying provider"""
+        return str(getattr(self.w3.provider, "endpoint_uri", ""))
+
+    async def has_multicall(self) -> bool:
+        """Check once per endpoint whether Multicall3 is deployed"""
+        endpoint = self.endpoint
+        with _support_lock:
+            supported = _multicall_support.get(endpoint)
+        if supported is None:
+            supported = len(await self.w3.eth.get_code(self.multicall.address)) > 0
+            with _support_lock:
+                _multicall_support[endpoint] = supported
+        return supported
+
+    async def call(self, calls: Sequence[AsyncContractFunction], block_number: Optional[int] = None) -> Tuple[List[Any], int]:
+        """Execute the calls at a block (the latest by default) and return their decoded results with that block"""
+        if await self.has_multicall():
+            block_call = self.multicall.functions.getBlockNumber()
+            packed = [_pack_call(block_call)] + [_pack_call(fn) for fn in calls]
+
+            responses = await self.multicall.functions.aggregate3(packed).call(block_identifier=_block_identifier(block_number))
+
+            block_number = _decode_output(self.w3, block_call, responses[0][1])
+            results = [_decode_output(self.w3, fn, return_data) for fn, (_, return_data) in zip(calls, responses[1:])]
+            return results, block_number
+
+        # Without Multicall3, issue the eth_calls concurrently against the same block
+        if block_number is None:
+            block_number = await self.w3.eth.block_number
+        results = await asyncio.gather(*[fn.call(block_identifier=block_number) for fn in calls])
+        return list(results), block_number
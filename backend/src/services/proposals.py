@@ -0,0 +1,151 @@
+"""
+Proposal queries over the governance index, with cursor pagination and a read-through cache.
+"""
+
+import base64
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .indexer import GovernanceIndexStore
+
+# Page size bounds for proposal listings
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+# Cached query results kept across index versions
+QUERY_CACHE_SIZE = 512
+
+def encode_cursor(proposal: Dict[str, Any]) -> str:
+    """Opaque cursor pointing just past a proposal in listing order"""
+    position = [proposal["block_number"], proposal["log_index"], proposal["chain"]]
+    return base64.urlsafe_b64encode(json.dumps(position).encode()).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[int, int, str]:
+    """Parse a cursor produced by encode_cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        block_number, log_index, chain = json.loads(base64.urlsafe_b64decode(padded))
+        return int(block_number), int(log_index), str(chain)
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}")
+
+def build_tally(proposal: Dict[str, Any]) -> Dict[str, Any]:
+    """Vote totals and quorum progress; for and abstain votes count toward quorum"""
+    for_votes = int(proposal["for_votes"])
+    abstain_votes = int(proposal["abstain_votes"])
+    quorum = int(proposal["quorum"]) if proposal["quorum"] is not None else None
+    return {
+        "for_votes": proposal["for_votes"],
+        "against_votes": proposal["against_votes"],
+        "abstain_votes": proposal["abstain_votes"],
+        "quorum": proposal["quorum"],
+        "quorum_progress": round((for_votes + abstain_votes) / quorum, 6) if quorum else None
+    }
+
+def build_summary(proposal: Dict[str, Any]) -> Dict[str, Any]:
+    """Listing view of an indexed proposal"""
+    return {
+        "chain": proposal["chain"],
+        "proposal_id": proposal["proposal_id"],
+        "proposer": proposal["proposer"],
+        "description": proposal["description"],
+        "state": proposal["state"],
+        "vote_start": proposal["vote_start"],
+        "vote_end": proposal["vote_end"],
+        "eta": proposal["eta"],
+        "block_number": proposal["block_number"],
+        "tx_hash": proposal["tx_hash"],
+        "tally": build_tally(proposal)
+    }
+
+class ProposalQueryService:
+    """Serves proposal pages from the index, caching each result until the index changes"""
+
+    def __init__(self, store: GovernanceIndexStore, max_entries: int = QUERY_CACHE_SIZE):
+        self.store = store
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # query key -> (index version, result)
+        self._cache: "OrderedDict[Hashable, Tuple[str, Any]]" = OrderedDict()
+
+    def etag(self, chain: Optional[str], *query: Any) -> str:
+        """Weak ETag for a query against the current index version"""
+        digest = hashlib.sha1(json.dumps([chain, *query], default=str).encode()).hexdigest()[:16]
+        return f'W/"{self.store.version(chain)}-{digest}"'
+
+    def _cached(self, key: Hashable, version: str) -> Any:
+        """Cached result for a key if it was computed at this index version"""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None or entry[0] != version:
+                return None
+            self._cache.move_to_end(key)
+            return entry[1]
+
+    def _store(self, key: Hashable, version: str, result: Any) -> None:
+        """Cache a result, evicting the least recently used past the size bound"""
+        with self._lock:
+            self._cache[key] = (version, result)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    def list_proposals(
+        self,
+        chain: Optional[str] = None,
+        state: Optional[str] = None,
+        proposer: Optional[str] = None,
+        cursor: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE
+    ) -> Dict[str, Any]:
+        """One page of proposals, newest first, with the cursor for the next page"""
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        after = decode_cursor(cursor) if cursor else None
+        key = ("list", chain, state, proposer.lower() if proposer else None, after, limit)
+        version = self.store.version(chain)
+
+        page = self._cached(key, version)
+        if page is None:
+            # Fetch one extra row to know whether another page exists
+            rows = self.store.list_proposals(chain=chain, state=state, proposer=proposer, after=after, limit=limit + 1)
+            items: List[Dict[str, Any]] = [build_summary(row) for row in rows[:limit]]
+            page = {
+                "items": items,
+                "next_cursor": encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+            }
+            self._store(key, version, page)
+        return page
+
+    def get_proposal(self, chain: str, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """Full proposal with actions, tally and individual votes"""
+        key = ("detail", chain, proposal_id)
+        version = self.store.version(chain)
+
+        detail = self._cached(key, version)
+        if detail is None:
+            proposal = self.store.get_proposal(chain, proposal_id)
+            if proposal is None:
+                return None
+            detail = {
+                **build_summary(proposal),
+                "targets": proposal["targets"],
+                "values": proposal["values"],
+                "signatures": proposal["signatures"],
+                "calldatas": proposal["calldatas"],
+                "votes": [
+                    {
+                        "voter": vote["voter"],
+                        "support": vote["support"],
+                        "weight": vote["weight"],
+                        "reason": vote["reason"],
+                        "block_number": vote["block_number"],
+                        "tx_hash": vote["tx_hash"]
+                    }
+                    for vote in self.store.list_votes(chain, proposal_id)
+                ]
+            }
+            self._store(key, version, detail)
+        return detail
@@ -0,0 +1,104 @@
+"""
+Provider registry for sharing pooled Web3 connections across services.
+"""
+
+import os
+import threading
+from typing import Dict, Set
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import AsyncWeb3, Web3
+
+from ..config import get_rpc_url
+
+# Connection pool settings, overridable via environment variables
+RPC_POOL_MAXSIZE = int(os.getenv("RPC_POOL_MAXSIZE", "32"))
+RPC_REQUEST_TIMEOUT = int(os.getenv("RPC_REQUEST_TIMEOUT", "30"))
+
+class ProviderRegistry:
+    """Per-chain registry holding one keep-alive Web3 provider per RPC URL"""
+
+    def __init__(self, pool_maxsize: int = RPC_POOL_MAXSIZE, request_timeout: int = RPC_REQUEST_TIMEOUT):
+        self.pool_maxsize = pool_maxsize
+        self.request_timeout = request_timeout
+        self._lock = threading.Lock()
+        self._sessions: Dict[str, requests.Session] = {}
+        self._providers: Dict[str, Web3] = {}
+        self._async_providers: Dict[str, AsyncWeb3] = {}
+        self._verified: Set[str] = set()
+
+    def _create_session(self) -> requests.Session:
+        """Create an HTTP session with a keep-alive connection pool"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.pool_maxsize)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def get_web3(self, chain: str) -> Web3:
+        """Get the shared Web3 instance for a chain, creating it on first use"""
+        rpc_url = get_rpc_url(chain)
+
+        with self._lock:
+            w3 = self._providers.get(rpc_url)
+            if w3 is None:
+                session = self._create_session()
+                w3 = Web3(Web3.HTTPProvider(
+                    rpc_url,
+                    request_kwargs={"timeout": self.request_timeout},
+                    session=session
+                ))
+                # Long-lived providers can cache static answers such as eth_chainId
+                w3.provider.cache_allowed_requests = True
+                self._sessions[rpc_url] = session
+                self._providers[rpc_url] = w3
+
+        return w3
+
+    def get_connected_web3(self, chain: str) -> Web3:
+        """Get the shared Web3 instance for a chain, probing connectivity only once per RPC URL"""
+        w3 = self.get_web3(chain)
+        rpc_url = get_rpc_url(chain)
+
+        if rpc_url not in self._verified:
+            if not w3.is_connected():
+                raise ValueError(f"Failed to connect to RPC: {rpc_url}")
+            self._verified.add(rpc_url)
+
+        return w3
+
+    def get_async_web3(self, chain: str) -> AsyncWeb3:
+        """Get the shared AsyncWeb3 instance for a chain, creating it on first use"""
+        rpc_url = get_rpc_url(chain)
+
+        with self._lock:
+            w3 = self._async_providers.get(rpc_url)
+            if w3 is None:
+                # AsyncHTTPProvider keeps one pooled aiohttp session per endpoint
+                w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(
+                    rpc_url,
+                    request_kwargs={"timeout": aiohttp.ClientTimeout(total=self.request_timeout)}
+                ))
+                w3.provider.cache_allowed_requests = True
+                self._async_providers[rpc_url] = w3
+
+        return w3
+
+    async def aclose(self) -> None:
+        """Close pooled async sessions, then the sync ones"""
+        for w3 in list(self._async_providers.values()):
+            disconnect = getattr(w3.provider, "disconnect", None)
+            if disconnect is not None:
+                await disconnect()
+        self._async_providers.clear()
+        self.close()
+
+    def close(self) -> None:
+        """Close all pooled HTTP sessions"""
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+            self._providers.clear()
+            self._verified.clear()
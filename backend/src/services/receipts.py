@@ -0,0 +1,164 @@
+"""
+Receipt tracker polling submitted transactions with one batched loop per chain.
+"""
+
+import asyncio
+import os
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional
+
+from .providers import ProviderRegistry
+from .transactions import invalidate_transaction_nonce
+
+# Polling settings, overridable via environment variables
+RECEIPT_POLL_INTERVAL = float(os.getenv("RECEIPT_POLL_INTERVAL", "2"))
+RECEIPT_BATCH_SIZE = int(os.getenv("RECEIPT_BATCH_SIZE", "100"))
+RECEIPT_TIMEOUT = float(os.getenv("RECEIPT_TIMEOUT", "900"))
+
+# Transaction outcomes recorded on receipts
+TX_PENDING = "pending"
+TX_SUCCESS = "success"
+TX_REVERTED = "reverted"
+TX_DROPPED = "dropped"
+
+# Listener called on the event loop with (tx hash, receipt record) once a transaction resolves
+ReceiptListener = Callable[[str, Dict[str, Any]], None]
+
+def _to_int(value: Any) -> Optional[int]:
+    """Parse a hex quantity from a raw JSON-RPC receipt"""
+    if value is None:
+        return None
+    return int(value, 16) if isinstance(value, str) else int(value)
+
+def build_receipt_record(receipt: Dict[str, Any]) -> Dict[str, Any]:
+    """Summarize a raw eth_getTransactionReceipt result"""
+    return {
+        "status": TX_SUCCESS if _to_int(receipt.get("status")) == 1 else TX_REVERTED,
+        "block_number": _to_int(receipt.get("blockNumber")),
+        "gas_used": _to_int(receipt.get("gasUsed")),
+        "effective_gas_price": _to_int(receipt.get("effectiveGasPrice"))
+    }
+
+class ReceiptTracker:
+    """Tracks in-flight transactions across chains and notifies listeners when they are mined"""
+
+    def __init__(
+        self,
+        providers: ProviderRegistry,
+        poll_interval: float = RECEIPT_POLL_INTERVAL,
+        batch_size: int = RECEIPT_BATCH_SIZE,
+        timeout: float = RECEIPT_TIMEOUT
+    ):
+        self.providers = providers
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # chain -> tx hash -> {"submitted_at", "listeners"}
+        self._pending: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+        self._last_block: Dict[str, int] = {}
+
+    def start(self) -> None:
+        """Bind the tracker to the running event loop"""
+        self._loop = asyncio.get_running_loop()
+
+    def track(self, chain: str, tx_hash: str, listener: Optional[ReceiptListener] = None) -> None:
+        """Start tracking a transaction; safe to call from worker threads"""
+        if self._loop is None:
+            raise RuntimeError("ReceiptTracker.start() must be called before tracking transactions")
+
+        try:
+            on_loop = asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            on_loop = False
+
+        if on_loop:
+            self._add(chain, tx_hash, listener)
+        else:
+            self._loop.call_soon_threadsafe(self._add, chain, tx_hash, listener)
+
+    def _add(self, chain: str, tx_hash: str, listener: Optional[ReceiptListener]) -> None:
+        """Register a transaction and make sure the chain has a poller"""
+        entry = self._pending.setdefault(chain, {}).setdefault(
+            tx_hash.lower(), {"submitted_at": time.monotonic(), "listeners": []}
+        )
+        if listener is not None:
+            entry["listeners"].append(listener)
+
+        poller = self._pollers.get(chain)
+        if poller is None or poller.done():
+            # Force a receipt check on the first tick
+            self._last_block.pop(chain, None)
+            self._pollers[chain] = asyncio.create_task(self._poll(chain))
+
+    async def _poll(self, chain: str) -> None:
+        """Poll one chain until it has no transactions left in flight"""
+        while self._pending.get(chain):
+            try:
+                await self._poll_once(chain)
+            except Exception as e:
+                print(f"⚠️ Receipt polling failed on {chain}: {str(e)}")
+            if self._pending.get(chain):
+                await asyncio.sleep(self.poll_interval)
+
+    async def _poll_once(self, chain: str) -> None:
+        """Fetch receipts for every pending transaction on a chain if a new block arrived"""
+        w3 = self.providers.get_async_web3(chain)
+
+        # Receipts can only appear in a new block, so skip the batch while the head is unchanged
+        block_number = await w3.eth.block_number
+        if self._last_block.get(chain) != block_number:
+            self._last_block[chain] = block_number
+            hashes = list(self._pending.get(chain, {}))
+            for start in range(0, len(hashes), self.batch_size):
+                await self._fetch_batch(chain, w3, hashes[start:start + self.batch_size])
+
+        self._expire(chain)
+
+    async def _fetch_batch(self, chain: str, w3: Any, hashes: List[str]) -> None:
+        """Fetch a batch of receipts in one JSON-RPC round trip"""
+        responses = await w3.provider.make_batch_request(
+            [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in hashes]
+        )
+        if not isinstance(responses, list):
+            raise ValueError(f"Batched receipt request failed: {responses.get('error')}")
+
+        for tx_hash, response in zip(hashes, responses):
+            receipt = response.get("result")
+            if receipt:
+                self._resolve(chain, tx_hash, build_receipt_record(receipt))
+
+    def _expire(self, chain: str) -> None:
+        """Give up on transactions that have not been mined within the timeout"""
+        now = time.monotonic()
+        for tx_hash, entry in list(self._pending.get(chain, {}).items()):
+            if now - entry["submitted_at"] > self.timeout:
+                # The dropped transaction's nonce is free again, so the sender must resync rather than leave a gap
+                invalidate_transaction_nonce(tx_hash)
+                self._resolve(chain, tx_hash, {"status": TX_DROPPED, "block_number": None, "gas_used": None, "effective_gas_price": None})
+
+    def _resolve(self, chain: str, tx_hash: str, record: Dict[str, Any]) -> None:
+        """Stop tracking a transaction and notify its listeners"""
+        entry = self._pending.get(chain, {}).pop(tx_hash, None)
+        if entry is None:
+            return
+
+        print(f"🧾 {chain} transaction {tx_hash}: {record['status']} (block {record['block_number']})")
+        for listener in entry["listeners"]:
+            try:
+                listener(tx_hash, record)
+            except Exception:
+                traceback.print_exc()
+
+    def stats(self) -> Dict[str, int]:
+        """Number of in-flight transactions per chain"""
+        return {chain: len(pending) for chain, pending in self._pending.items()}
+
+    async def aclose(self) -> None:
+        """Cancel all pollers"""
+        for poller in self._pollers.values():
+            poller.cancel()
+        await asyncio.gather(*self._pollers.values(), return_exceptions=True)
+        self._pollers.clear()
@@ -0,0 +1,115 @@
+"""
+Short-lived status snapshot of every chain, refreshed in the background so status polls never wait on RPCs.
+"""
+
+import asyncio
+import os
+import time
+import traceback
+from datetime import datetime, UTC
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+# Snapshot settings, overridable via environment variables
+STATUS_REFRESH_INTERVAL = float(os.getenv("STATUS_REFRESH_INTERVAL", "10"))
+STATUS_CHAIN_TIMEOUT = float(os.getenv("STATUS_CHAIN_TIMEOUT", "5"))
+# Seconds without a read after which background refreshes stop until the next read
+STATUS_IDLE_TIMEOUT = float(os.getenv("STATUS_IDLE_TIMEOUT", "120"))
+
+# Outcomes of a chain's latest check
+CHAIN_OK = "ok"
+CHAIN_TIMEOUT = "timeout"
+CHAIN_ERROR = "error"
+
+# Coroutine function checking one chain
+ChainCheck = Callable[[str], Awaitable[Any]]
+
+class StatusSnapshot:
+    """Checks every chain concurrently on an interval and serves the latest result of each"""
+
+    def __init__(
+        self,
+        check: ChainCheck,
+        chains: List[str],
+        refresh_interval: float = STATUS_REFRESH_INTERVAL,
+        chain_timeout: float = STATUS_CHAIN_TIMEOUT,
+        idle_timeout: float = STATUS_IDLE_TIMEOUT
+    ):
+        self.check = check
+        self.chains = chains
+        self.refresh_interval = refresh_interval
+        self.chain_timeout = chain_timeout
+        self.idle_timeout = idle_timeout
+        # chain -> {"status", "result", "error", "updated_at", "refreshed_at", "latency_ms"}
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._ready = asyncio.Event()
+        self._refresher: Optional[asyncio.Task] = None
+        self._last_read = 0.0
+        self.refreshes = 0
+
+    async def get(self) -> Dict[str, Dict[str, Any]]:
+        """Latest entry of every chain, waiting only for the very first refresh"""
+        self._last_read = time.monotonic()
+        if self._refresher is None or self._refresher.done():
+            # Refreshes stop while nobody reads; a read after that serves the old entries while refreshing
+            self._refresher = asyncio.create_task(self._refresh_loop())
+        await self._ready.wait()
+        return self.entries()
+
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        """Copy of every chain's entry with its age in seconds"""
+        now = time.monotonic()
+        return {
+            chain: {
+                **{key: value for key, value in entry.items() if key != "refreshed_at"},
+                "age_seconds": round(now - entry["refreshed_at"], 3) if entry["refreshed_at"] is not None else None
+            }
+            for chain, entry in self._entries.items()
+        }
+
+    async def _refresh_loop(self) -> None:
+        """Refresh on the interval until the snapshot has not been read for the idle timeout"""
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                traceback.print_exc()
+            self._ready.set()
+            if time.monotonic() - self._last_read > self.idle_timeout:
+                return
+            await asyncio.sleep(self.refresh_interval)
+
+    async def refresh(self) -> None:
+        """Check every chain at once; each entry is replaced as soon as its chain answers or times out"""
+        await asyncio.gather(*(self._refresh_chain(chain) for chain in self.chains))
+        self.refreshes += 1
+
+    async def _refresh_chain(self, chain: str) -> None:
+        """Check one chain within the timeout, keeping its last good result if it is slow or failing"""
+        started = time.monotonic()
+        previous = self._entries.get(chain, {})
+        try:
+            result = await asyncio.wait_for(self.check(chain), timeout=self.chain_timeout)
+        except asyncio.TimeoutError:
+            status, result, error = CHAIN_TIMEOUT, previous.get("result"), f"No answer within {self.chain_timeout:g}s"
+        except Exception as e:
+            status, result, error = CHAIN_ERROR, previous.get("result"), str(e)
+        else:
+            status, error = CHAIN_OK, None
+
+        fresh = status == CHAIN_OK
+        self._entries[chain] = {
+            "status": status,
+            "result": result,
+            "error": error,
+            # When the result was produced, which is older than this check if the check failed
+            "updated_at": datetime.now(UTC).isoformat() if fresh else previous.get("updated_at"),
+            "refreshed_at": time.monotonic() if fresh else previous.get("refreshed_at"),
+            "latency_ms": round((time.monotonic() - started) * 1000, 1)
+        }
+
+    async def aclose(self) -> None:
+        """Stop background refreshes"""
+        if self._refresher is not None:
+            self._refresher.cancel()
+            await asyncio.gather(self._refresher, return_exceptions=True)
+            self._refresher = None
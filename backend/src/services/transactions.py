@@ -0,0 +1,268 @@
+"""
+Transaction pipeline with a local nonce counter per (chain, account).
+"""
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
+from typing import Any, Dict, Optional, Set, Tuple
+from eth_utils import keccak
+from web3 import AsyncWeb3, Web3
+
+# Re-read the pending nonce from the node at least this often, in seconds
+NONCE_RESYNC_INTERVAL = float(os.getenv("NONCE_RESYNC_INTERVAL", "30"))
+
+# Node error messages meaning our local nonce no longer matches the chain
+NONCE_ERRORS = (
+    "nonce too low",
+    "nonce too high",
+    "invalid nonce",
+    "replacement transaction underpriced"
+)
+
+# Node error messages meaning this exact transaction was already accepted
+KNOWN_TX_ERRORS = ("already known", "known transaction")
+
+def raw_transaction(signed_tx: Any) -> bytes:
+    """Raw bytes of a signed transaction across eth-account versions"""
+    raw = getattr(signed_tx, "raw_transaction", None)
+    return raw if raw is not None else signed_tx.rawTransaction
+
+def _matches(error: Exception, messages: Tuple[str, ...]) -> bool:
+    """Check whether a node error contains any of the given messages"""
+    text = str(error).lower()
+    return any(message in text for message in messages)
+
+class NonceManager:
+    """Hands out consecutive nonces for one account on one chain"""
+
+    def __init__(self, resync_interval: float = NONCE_RESYNC_INTERVAL):
+        self.resync_interval = resync_interval
+        self._lock = threading.Lock()
+        # Serialize nonce assignment, signing and broadcast so transactions reach the node in nonce order;
+        # async senders take the same lock (see hold_thread_lock), so sync and async sends exclude each other
+        self.send_lock = threading.Lock()
+        # Queues async senders on the event loop so only one of them waits for send_lock at a time
+        self.async_send_lock = asyncio.Lock()
+        self._next_nonce: Optional[int] = None
+        self._synced_at = 0.0
+        # Nonces reserved and not yet broadcast or released; the node cannot know about these
+        self._reserved: Set[int] = set()
+        # Nonces we have broadcast and not yet seen the node count past
+        self._in_flight: Dict[int, str] = {}
+        # Set by invalidate(): the next sync may move the counter below broadcast nonces
+        self._rewind = False
+
+    def needs_sync(self) -> bool:
+        """Whether the pending nonce should be re-read before the next reservation"""
+        with self._lock:
+            return self._next_nonce is None or self._rewind or time.monotonic() - self._synced_at > self.resync_interval
+
+    def sync(self, pending_nonce: int) -> None:
+        """Reconcile the local counter with the node's pending nonce, only going below a broadcast nonce after invalidate()"""
+        with self._lock:
+            # A reserved nonce may not be broadcast yet, so the node's count cannot include it
+            floor = [nonce + 1 for nonce in self._reserved]
+            if not self._rewind:
+                # A lagging or load-balanced node may not have seen our broadcasts yet, so reusing
+                # their nonces would replace them; dropped ones are rewound through invalidate()
+                floor += [nonce + 1 for nonce in self._in_flight]
+            target = max([pending_nonce] + floor)
+            if self._next_nonce is not None and target < self._next_nonce:
+                # The node lost track of our transactions from target up: they were dropped
+                print(f"🔁 Resyncing nonce from {self._next_nonce} to {target}")
+            # First use, the account sent transactions we did not see, or a rewind
+            self._next_nonce = target
+            self._in_flight = {nonce: tx for nonce, tx in self._in_flight.items() if nonce >= pending_nonce and nonce < self._next_nonce}
+            self._rewind = False
+            self._synced_at = time.monotonic()
+
+    def reserve(self) -> int:
+        """Take the next nonce"""
+        with self._lock:
+            if self._next_nonce is None:
+                raise RuntimeError("Nonce manager used before its first sync")
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            self._reserved.add(nonce)
+            return nonce
+
+    def confirm(self, nonce: int, tx_hash: str) -> None:
+        """Record a broadcast transaction"""
+        with self._lock:
+            self._reserved.discard(nonce)
+            self._in_flight[nonce] = tx_hash
+
+    def release(self, nonce: int) -> None:
+        """Give back a nonce whose transaction was never broadcast"""
+        with self._lock:
+            self._reserved.discard(nonce)
+            if self._next_nonce == nonce + 1:
+                self._next_nonce = nonce
+            else:
+                # Later nonces are already out, so the next resync rewinds to fill the gap
+                self._rewind = True
+
+    def invalidate(self) -> None:
+        """Force a resync with the node before the next reservation, rewinding to its pending nonce"""
+        with self._lock:
+            self._rewind = True
+
+    def in_flight(self) -> Dict[int, str]:
+        """Broadcast transactions by nonce"""
+        with self._lock:
+            return dict(self._in_flight)
+
+@asynccontextmanager
+async def hold_thread_lock(lock: threading.Lock):
+    """Hold a threading lock from a coroutine, waiting for it in an executor so the event loop keeps running"""
+    acquiring = asyncio.get_running_loop().run_in_executor(None, lock.acquire)
+    try:
+        await asyncio.shield(acquiring)
+    except asyncio.CancelledError:
+        # The executor still takes the lock, so hand it back as soon as it does
+        acquiring.add_done_callback(lambda _: lock.release())
+        raise
+    try:
+        yield
+    finally:
+        lock.release()
+
+# One nonce manager per (chain ID, account address), shared by sync and async senders
+_nonce_managers: Dict[Tuple[int, str], NonceManager] = {}
+_managers_lock = threading.Lock()
+
+def get_nonce_manager(chain_id: int, address: str) -> NonceManager:
+    """Get the shared nonce manager for an account on a chain"""
+    key = (chain_id, Web3.to_checksum_address(address))
+    with _managers_lock:
+        if key not in _nonce_managers:
+            _nonce_managers[key] = NonceManager()
+        return _nonce_managers[key]
+
+def invalidate_transaction_nonce(tx_hash: str) -> bool:
+    """Force a resync of the account that broadcast a transaction, e.g. once it was dropped; False if unknown"""
+    tx_hash = tx_hash.lower()
+    with _managers_lock:
+        managers = list(_nonce_managers.values())
+    for manager in managers:
+        if any(in_flight.lower() == tx_hash for in_flight in manager.in_flight().values()):
+            manager.invalidate()
+            return True
+    return False
+
+class TransactionPipeline:
+    """Builds, signs and submits transactions for one account without refetching the nonce each time"""
+
+    def __init__(self, w3: Web3, account: Any):
+        self.w3 = w3
+        self.account = account
+        self.chain_id: Optional[int] = None
+        self._nonces: Optional[NonceManager] = None
+
+    @property
+    def nonces(self) -> NonceManager:
+        """Nonce manager for this account on the connected chain"""
+        if self._nonces is None:
+            self.chain_id = self.w3.eth.chain_id
+            self._nonces = get_nonce_manager(self.chain_id, self.account.address)
+        return self._nonces
+
+    def _sync(self) -> None:
+        """Refresh the local nonce from the node's pending count"""
+        self.nonces.sync(self.w3.eth.get_transaction_count(self.account.address, "pending"))
+
+    def send(self, contract_function: Any, tx_params: Dict[str, Any]) -> str:
+        """Send a contract call and return its transaction hash, retrying once on a stale nonce"""
+        with self.nonces.send_lock:
+            for attempt in range(2):
+                if self.nonces.needs_sync():
+                    self._sync()
+                nonce = self.nonces.reserve()
+                try:
+                    tx = contract_function.build_transaction({
+                        'from': self.account.address,
+                        'chainId': self.chain_id,
+                        'nonce': nonce,
+                        **tx_params
+                    })
+                    raw = raw_transaction(self.account.sign_transaction(tx))
+                except Exception:
+                    self.nonces.release(nonce)
+                    raise
+
+                try:
+                    tx_hash = self.w3.to_hex(self.w3.eth.send_raw_transaction(raw))
+                except Exception as e:
+                    if _matches(e, KNOWN_TX_ERRORS):
+                        tx_hash = self.w3.to_hex(keccak(raw))
+                    elif _matches(e, NONCE_ERRORS) and attempt == 0:
+                        print(f"⚠️ Nonce {nonce} rejected ({e}), resyncing")
+                        self.nonces.release(nonce)
+                        self.nonces.invalidate()
+                        continue
+                    else:
+                        self.nonces.release(nonce)
+                        raise
+
+                self.nonces.confirm(nonce, tx_hash)
+                return tx_hash
+
+        raise RuntimeError("Unreachable")
+
+class AsyncTransactionPipeline:
+    """Async counterpart of TransactionPipeline, sharing the same per-account nonce managers"""
+
+    def __init__(self, w3: AsyncWeb3, account: Any):
+        self.w3 = w3
+        self.account = account
+        self.chain_id: Optional[int] = None
+        self._nonces: Optional[NonceManager] = None
+
+    async def _get_nonces(self) -> NonceManager:
+        """Nonce manager for this account on the connected chain"""
+        if self._nonces is None:
+            self.chain_id = await self.w3.eth.chain_id
+            self._nonces = get_nonce_manager(self.chain_id, self.account.address)
+        return self._nonces
+
+    async def send(self, contract_function: Any, tx_params: Dict[str, Any]) -> str:
+        """Send a contract call and return its transaction hash, retrying once on a stale nonce"""
+        nonces = await self._get_nonces()
+        async with nonces.async_send_lock, hold_thread_lock(nonces.send_lock):
+            for attempt in range(2):
+                if nonces.needs_sync():
+                    nonces.sync(await self.w3.eth.get_transaction_count(self.account.address, "pending"))
+                nonce = nonces.reserve()
+                try:
+                    tx = await contract_function.build_transaction({
+                        'from': self.account.address,
+                        'chainId': self.chain_id,
+                        'nonce': nonce,
+                        **tx_params
+                    })
+                    raw = raw_transaction(self.account.sign_transaction(tx))
+                except Exception:
+                    nonces.release(nonce)
+                    raise
+
+                try:
+                    tx_hash = self.w3.to_hex(await self.w3.eth.send_raw_transaction(raw))
+                except Exception as e:
+                    if _matches(e, KNOWN_TX_ERRORS):
+                        tx_hash = self.w3.to_hex(keccak(raw))
+                    elif _matches(e, NONCE_ERRORS) and attempt == 0:
+                        print(f"⚠️ Nonce {nonce} rejected ({e}), resyncing")
+                        nonces.release(nonce)
+                        nonces.invalidate()
+                        continue
+                    else:
+                        nonces.release(nonce)
+                        raise
+
+                nonces.confirm(nonce, tx_hash)
+                return tx_hash
+
+        raise RuntimeError("Unreachable")
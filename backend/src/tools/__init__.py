@@ -4,5 +4,6 @@ Tools for the CrewAI agents.
 
 from .proposal_tool import ProposalTool
 from .execute_proposal_tool import ExecuteProposalTool
+from .backtest_tool import BacktestTool
 
-__all__ = ["ProposalTool", "ExecuteProposalTool"] 
\ No newline at end of file
+__all__ = ["ProposalTool", "ExecuteProposalTool", "BacktestTool"] 
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""
+Tool for backtesting allocations against the strategy metrics history.
+"""
+
+import json
+from typing import Any, Dict, List, Optional
+from pydantic import Field, ConfigDict
+from crewai.tools import BaseTool
+from ..backtest import MetricsHistory, run_backtest, summarize_backtest
+from ..models import StrategyMetrics
+from ..utils import STRATEGY_IDS, resolve_allocation, single_strategy_allocation
+
+# Paths per allocation for agent runs; enough for stable percentiles in well under a second
+TOOL_BACKTEST_PATHS = 2000
+
+class BacktestTool(BaseTool):
+    """Tool for simulating how allocations would have performed"""
+
+    name: str = "backtest_tool"
+    description: str = """
+    Simulates treasury value paths for one or more allocations over the recorded strategy
+    metrics history and reports return percentiles, loss probability and drawdowns.
+
+    Input should be a JSON string with the following structure:
+    {
+        "allocations": "list of splits across strategies 1, 2 and 3, e.g. [[1, 0, 0], [0.5, 0.3, 0.2]]; every single strategy if omitted",
+        "horizon_days": "days to simulate, default 90"
+    }
+    """
+
+    # Pydantic model configuration
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        validate_assignment=True
+    )
+
+    # Pydantic fields
+    history: Optional[MetricsHistory] = Field(None, description="Recorded metrics history; the current metrics are used when missing")
+    strategies: List[StrategyMetrics] = Field(default_factory=list, description="Current strategy metrics, set once fetched")
+    paths: int = Field(TOOL_BACKTEST_PATHS, description="Monte Carlo paths per allocation")
+
+    def _run(self, tool_input: Any = "") -> str:
+        """Run the tool"""
+        try:
+            # Handle both string and dictionary inputs
+            if isinstance(tool_input, str):
+                try:
+                    input_json: Dict[str, Any] = json.loads(tool_input) if tool_input.strip() else {}
+                except json.JSONDecodeError:
+                    input_json = {}
+            elif isinstance(tool_input, dict):
+                input_json = tool_input
+            else:
+                input_json = {}
+            if not isinstance(input_json, dict):
+                input_json = {"allocations": input_json}
+
+            history = self.history
+            if history is None:
+                if not self.strategies:
+                    return "ERROR: No strategy metrics available to backtest"
+                history = MetricsHistory.from_strategies(self.strategies)
+
+            allocations = input_json.get("allocations") or [single_strategy_allocation(strategy_id) for strategy_id in STRATEGY_IDS]
+            report = run_backtest(
+                history,
+                [resolve_allocation(allocation) for allocation in allocations],
+                horizon_days=int(input_json.get("horizon_days") or 90),
+                paths=self.paths
+            )
+            return summarize_backtest(report)
+
+        except Exception as e:
+            return f"ERROR: {str(e)}"
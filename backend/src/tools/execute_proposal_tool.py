@@ -2,14 +2,13 @@
 Tool for executing governance proposals using the governance service.
 """
 
-import os
 import json
 from typing import Optional, Dict, Any
 from pydantic import Field, ConfigDict
 from crewai.tools import BaseTool
 from web3 import Web3
 from ..services.governance import GovernanceService
-from ..utils import create_proposal_parameters
+from ..utils import create_allocation_proposal_parameters, proposal_description, resolve_allocation
 
 class ExecuteProposalTool(BaseTool):
     """Tool for executing governance proposals"""
@@ -21,6 +20,7 @@ class ExecuteProposalTool(BaseTool):
     Input should be a JSON string with the following structure:
     {
         "strategy_id": "chosen strategy id (1, 2, or 3)",
+        "allocation": "optional split across strategies 1, 2 and 3 the proposal was created with, e.g. [0.5, 0.3, 0.2]",
         "reasoning": "detailed explanation for why this proposal should be executed"
     }
     """
@@ -37,6 +37,9 @@ class ExecuteProposalTool(BaseTool):
     strategy_address: str = Field(...)
     governance_address: str = Field(...)
     eth_token_address: str = Field(...)
+    proposal_actions: Optional[Dict[str, Any]] = Field(None, description="Exact targets, values, calldatas and description (or its hash) of a proposal; when set they are executed as is")
+    governance_description: Optional[str] = Field(None, description="Description the proposal was created with; the DESCRIPTION environment variable if not set")
+    last_tx_hash: Optional[str] = Field(None, description="Transaction hash of the last executed proposal")
     
     def _run(self, tool_input: str) -> str:
         """Run the tool"""
@@ -76,17 +79,34 @@ class ExecuteProposalTool(BaseTool):
             
             print(f"🔍 All required fields validated successfully")
             
-            # Create the same proposal parameters as used in creation
-            targets, values, calldatas, _ = create_proposal_parameters(
-                self.treasury_address,
-                self.strategy_address,
-                self.eth_token_address
-            )
-            
-            # Create the description hash from the exact same description used in proposal creation
-            # description = "Investing strategy1"
-            description = os.getenv("DESCRIPTION")
-            description_hash = Web3.keccak(text=description)
+            if self.proposal_actions:
+                # The indexed ProposalCreated event has the exact actions, so nothing is rebuilt
+                targets = self.proposal_actions["targets"]
+                values = [int(value) for value in self.proposal_actions["values"]]
+                calldatas = [Web3.to_bytes(hexstr=calldata) for calldata in self.proposal_actions["calldatas"]]
+                description = self.proposal_actions.get("description")
+            else:
+                # Governor.execute() needs the actions that were proposed, so guessing a strategy would revert
+                if not input_json.get("allocation") and not input_json.get("strategy_id"):
+                    return "ERROR: No allocation or strategy_id given for the proposal to execute"
+                
+                # Create the same proposal parameters as used in creation
+                allocation = resolve_allocation(input_json.get("allocation"), input_json.get("strategy_id"))
+                targets, values, calldatas, _ = create_allocation_proposal_parameters(
+                    self.treasury_address,
+                    self.strategy_address,
+                    self.eth_token_address,
+                    allocation
+                )
+                
+                # Create the description hash from the exact same description used in proposal creation
+                # description = "Investing strategy1"
+                description = proposal_description(self.governance_description)
+            if description is not None:
+                description_hash = Web3.keccak(text=description)
+            else:
+                # Read from the Governor's proposal storage, which keeps only the description hash
+                description_hash = Web3.to_bytes(hexstr=self.proposal_actions["description_hash"])
             
             print(f"🔍 Executing proposal with description: {description}")
             print(f"🔗 Description hash: {description_hash.hex()}")
@@ -101,6 +121,7 @@ class ExecuteProposalTool(BaseTool):
             )
             
             if tx_hash:
+                self.last_tx_hash = tx_hash
                 return f"SUCCESS: Proposal executed with transaction hash: {tx_hash}"
             else:
                 return "ERROR: Failed to execute proposal - insufficient funds or network error"
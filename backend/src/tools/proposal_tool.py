@@ -3,13 +3,12 @@ Tool for creating governance proposals using the governance service.
 """
 
 import json
-import os
-from typing import Optional, Dict, Any
+from typing import Callable, List, Optional, Dict, Any
 from pydantic import Field, ConfigDict
 from crewai.tools import BaseTool
 from ..models import GovernanceProposal
 from ..services.governance import GovernanceService
-from ..utils import create_proposal_parameters
+from ..utils import allocation_strategy_id, create_allocation_proposal_parameters, proposal_description, resolve_allocation
 
 class ProposalTool(BaseTool):
     """Tool for creating governance proposals"""
@@ -23,6 +22,7 @@ class ProposalTool(BaseTool):
         "proposal_title": "title",
         "proposal_description": "Investing strategy",
         "strategy_id": "chosen strategy id (1, 2, or 3)",
+        "allocation": "optional split across strategies 1, 2 and 3, e.g. [0.5, 0.3, 0.2]; all to strategy_id if omitted",
         "expected_profit": "estimated profit in USD",
         "risk_assessment": "risk analysis",
         "execution_details": "technical details",
@@ -42,6 +42,11 @@ class ProposalTool(BaseTool):
     strategy_address: str = Field(...)
     governance_address: str = Field(...)
     eth_token_address: str = Field(...)
+    on_event: Optional[Callable[[str, Dict[str, Any]], None]] = Field(None, description="Callback for progress events")
+    governance_description: Optional[str] = Field(None, description="Proposal description; the DESCRIPTION environment variable if not set")
+    last_allocation: Optional[List[int]] = Field(None, description="Basis points per strategy of the last submitted proposal")
+    last_strategy_id: Optional[int] = Field(None, description="Strategy with the largest share of the last submitted proposal")
+    last_tx_hash: Optional[str] = Field(None, description="Transaction hash of the last submitted proposal")
     
     def _run(self, tool_input: str) -> str:
         """Run the tool"""
@@ -59,19 +64,21 @@ class ProposalTool(BaseTool):
                 # Handle any other input type by converting to string
                 input_json = {"reasoning": str(tool_input)}
             
-            # Create proposal parameters
-            targets, values, calldatas, _ = create_proposal_parameters(
+            # Get strategy ID and the split across strategies, defaulting to all in the chosen one
+            strategy_id = input_json.get("strategy_id", "1")
+            allocation = resolve_allocation(input_json.get("allocation"), strategy_id)
+            
+            # Create proposal parameters: one Treasury.execute() action per funded strategy
+            targets, values, calldatas, _ = create_allocation_proposal_parameters(
                 self.treasury_address,
                 self.strategy_address,
-                self.eth_token_address
+                self.eth_token_address,
+                allocation
             )
             
-            # Get strategy ID
-            strategy_id = input_json.get("strategy_id", "1")
-            
             # Create the proposal object
             proposal = GovernanceProposal(
-                description=os.getenv("DESCRIPTION") or "Investing strategy",
+                description=proposal_description(self.governance_description),
                 targets=targets,
                 values=values,
                 calldatas=calldatas,
@@ -84,6 +91,13 @@ class ProposalTool(BaseTool):
                 proposal
             )
             
+            if tx_hash:
+                self.last_allocation = allocation
+                self.last_strategy_id = allocation_strategy_id(allocation)
+                self.last_tx_hash = tx_hash
+            if tx_hash and self.on_event:
+                self.on_event("tx_hash", {"tx_hash": tx_hash, "strategy_id": strategy_id, "allocation": allocation})
+            
             if tx_hash:
                 return f"SUCCESS: Proposal submitted with transaction hash: {tx_hash}"
             else:
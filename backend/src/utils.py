@@ -2,56 +2,202 @@
 Utility functions for the DAO Treasury Management system.
 """
 
+import json
+import os
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 from web3 import Web3
-from eth_abi.abi import encode
+from eth_abi.encoding import TupleEncoder
+from eth_abi.registry import registry
+from eth_utils import function_signature_to_4byte_selector
 
-def encode_strategy_call(strategy_address: str, token_address: str, amount: int) -> bytes:
+from .abis import STRATEGY_ABI, TREASURY_ABI
+
+# Repeated (strategy, token, amount) encodings kept in memory
+ENCODE_CACHE_SIZE = 1024
+
+# Strategies a proposal can allocate to, and the amount a proposal moves unless told otherwise
+STRATEGY_IDS = (1, 2, 3)
+DEFAULT_PROPOSAL_AMOUNT = Web3.to_wei(1, 'ether')
+
+# Allocation as weights for strategies 1, 2 and 3 in order, or keyed by strategy ID
+Allocation = Union[Sequence[float], Dict[Any, float]]
+
+def abi_type(param: Dict[str, Any]) -> str:
+    """Canonical ABI type string for a parameter, expanding tuples"""
+    if param["type"].startswith("tuple"):
+        return "(" + ",".join(abi_type(component) for component in param["components"]) + ")" + param["type"][len("tuple"):]
+    return param["type"]
+
+def abi_signature(fragment: Dict[str, Any]) -> str:
+    """Canonical signature of an ABI function fragment, e.g. execute(address,uint256,bytes)"""
+    return f"{fragment['name']}({','.join(abi_type(param) for param in fragment['inputs'])})"
+
+class FunctionEncoder:
+    """Encodes calls to one function with its selector and argument encoder built once"""
+
+    def __init__(self, signature: str, types: Sequence[str]):
+        self.signature = signature
+        self.selector = function_signature_to_4byte_selector(signature)
+        self.types = tuple(types)
+        self._encoder = TupleEncoder(encoders=tuple(registry.get_encoder(type_str) for type_str in self.types))
+
+    def encode(self, *args: Any) -> bytes:
+        """Calldata for a call with the given arguments"""
+        return self.selector + self._encoder(args)
+
+def compile_abi(abi: List[Dict[str, Any]]) -> Dict[str, FunctionEncoder]:
+    """Encoders for every function in an ABI, keyed by name and, for overloads, by signature"""
+    encoders: Dict[str, FunctionEncoder] = {}
+    for fragment in abi:
+        if fragment.get("type") != "function":
+            continue
+        signature = abi_signature(fragment)
+        encoder = FunctionEncoder(signature, [abi_type(param) for param in fragment["inputs"]])
+        encoders[signature] = encoder
+        encoders.setdefault(fragment["name"], encoder)
+    return encoders
+
+# Compiled once at import, so encoding never hashes a signature string
+STRATEGY_ENCODERS = compile_abi(STRATEGY_ABI)
+TREASURY_ENCODERS = compile_abi(TREASURY_ABI)
+
+def strategy_function(strategy: int) -> str:
+    """Strategy contract function that runs the given strategy number"""
+    name = f"executeStrategy{strategy}"
+    if name not in STRATEGY_ENCODERS:
+        raise ValueError(f"Unknown strategy: {strategy}")
+    return name
+
+@lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def encode_strategy_call(strategy_address: str, token_address: str, amount: int, strategy: int = 1) -> bytes:
     """
-    Encode the call to Strategy.executeStrategy1()
+    Encode the call to Strategy.executeStrategy<N>(), executeStrategy1() by default
     """
-    # Function signature: executeStrategy1(address,uint256)
-    function_selector = Web3.keccak(text="executeStrategy1(address,uint256)")[:4]
-    
-    # Encode parameters
-    encoded_params = encode(['address', 'uint256'], [token_address, amount])
-    
-    return function_selector + encoded_params
+    return STRATEGY_ENCODERS[strategy_function(strategy)].encode(token_address, amount)
 
-def encode_treasury_execute_call(strategy_address: str, token_address: str, amount: int) -> bytes:
+@lru_cache(maxsize=ENCODE_CACHE_SIZE)
+def encode_treasury_execute_call(strategy_address: str, token_address: str, amount: int, strategy: int = 1) -> bytes:
     """
-    Encode the call to Treasury.execute() that will call Strategy.executeStrategy1()
+    Encode the call to Treasury.execute() that will call Strategy.executeStrategy<N>()
     """
     # Get the encoded call to strategy
-    strategy_call_data = encode_strategy_call(strategy_address, token_address, amount)
+    strategy_call_data = encode_strategy_call(strategy_address, token_address, amount, strategy)
     
-    # Function signature: execute(address,uint256,bytes)
-    function_selector = Web3.keccak(text="execute(address,uint256,bytes)")[:4]
-    
-    # Encode parameters for Treasury.execute()
     # target = strategy_address, value = 0 (no ETH), data = strategy_call_data
-    encoded_params = encode(
-        ['address', 'uint256', 'bytes'],
-        [strategy_address, 0, strategy_call_data]
+    return TREASURY_ENCODERS["execute"].encode(strategy_address, 0, strategy_call_data)
+
+def encode_proposal_actions(
+    treasury_address: str,
+    strategy_address: str,
+    actions: Iterable[Tuple[int, str, int]]
+) -> Tuple[List[str], List[int], List[bytes]]:
+    """
+    Encode many (strategy, token, amount) actions into Governor.propose() targets, values and calldatas in one pass
+    """
+    targets: List[str] = []
+    values: List[int] = []
+    calldatas: List[bytes] = []
+    for strategy, token_address, amount in actions:
+        targets.append(treasury_address)
+        values.append(0)
+        calldatas.append(encode_treasury_execute_call(strategy_address, token_address, amount, strategy))
+    return targets, values, calldatas
+
+def allocation_bps(allocation: Allocation) -> List[int]:
+    """Normalize allocation weights to basis points per strategy, summing to exactly 10000"""
+    if isinstance(allocation, dict):
+        weights = [float(allocation.get(strategy, allocation.get(str(strategy), 0))) for strategy in STRATEGY_IDS]
+        unknown = {str(key) for key in allocation} - {str(strategy) for strategy in STRATEGY_IDS}
+        if unknown:
+            raise ValueError(f"Unknown strategies in allocation: {sorted(unknown)}")
+    else:
+        weights = [float(weight) for weight in allocation]
+        if len(weights) != len(STRATEGY_IDS):
+            raise ValueError(f"Allocation needs one weight per strategy {list(STRATEGY_IDS)}, got {len(weights)}")
+
+    if any(weight < 0 for weight in weights) or sum(weights) <= 0:
+        raise ValueError(f"Allocation weights must be non-negative with a positive total: {weights}")
+
+    total = sum(weights)
+    bps = [int(weight / total * 10000) for weight in weights]
+    # Rounding leftovers go to the largest allocation so the whole amount is always used
+    bps[weights.index(max(weights))] += 10000 - sum(bps)
+    return bps
+
+def single_strategy_allocation(strategy_id: int) -> List[int]:
+    """Allocation sending everything to one strategy"""
+    strategy_function(strategy_id)
+    return [10000 if strategy == strategy_id else 0 for strategy in STRATEGY_IDS]
+
+def proposal_description(description: Optional[str] = None) -> str:
+    """Description a proposal is created and executed with; its hash is part of the proposal ID"""
+    return description or os.getenv("DESCRIPTION") or "Investing strategy"
+
+def allocation_strategy_id(allocation: List[int]) -> int:
+    """Strategy with the largest share of an allocation"""
+    return STRATEGY_IDS[allocation.index(max(allocation))]
+
+def resolve_allocation(allocation: Any = None, strategy_id: Any = 1) -> List[int]:
+    """Allocation in basis points from explicit weights, or everything to a single strategy"""
+    if isinstance(allocation, str):
+        allocation = json.loads(allocation)
+    if allocation:
+        return allocation_bps(allocation)
+    return single_strategy_allocation(int(strategy_id))
+
+def allocation_actions(allocation: Allocation, token_address: str, total_amount: int = DEFAULT_PROPOSAL_AMOUNT) -> List[Tuple[int, str, int]]:
+    """Split an amount across strategies into (strategy, token, amount) actions, skipping empty ones"""
+    bps = allocation_bps(allocation)
+    amounts = [total_amount * share // 10000 for share in bps]
+    # Integer division dust goes to the largest allocation as well
+    amounts[bps.index(max(bps))] += total_amount - sum(amounts)
+    return [(strategy, token_address, amount) for strategy, amount in zip(STRATEGY_IDS, amounts) if amount > 0]
+
+def create_allocation_proposal_parameters(
+    treasury_address: str,
+    strategy_address: str,
+    eth_token_address: str,
+    allocation: Allocation,
+    total_amount: int = DEFAULT_PROPOSAL_AMOUNT
+) -> tuple[list[str], list[int], list[bytes], str]:
+    """
+    Create Governor.propose() parameters that split one amount across strategies in a single proposal
+    """
+    actions = allocation_actions(allocation, eth_token_address, total_amount)
+    targets, values, calldatas = encode_proposal_actions(treasury_address, strategy_address, actions)
+
+    action_lines = "\n".join(
+        f"    - Strategy {strategy}: {Web3.from_wei(amount, 'ether')} tokens ({amount * 10000 // total_amount / 100:.2f}%)"
+        for strategy, _, amount in actions
     )
+    formatted_description = f"""
+    # Rebalance Treasury Across Strategies
+    
+    ## Summary
+    This proposal allocates {Web3.from_wei(total_amount, 'ether')} tokens across {len(actions)} strategies
+    through our Treasury contract in a single vote and execution.
     
-    return function_selector + encoded_params
+    ## Allocation
+{action_lines}
+    
+    ## Technical Details
+    - Targets: Treasury.execute() -> Strategy.executeStrategy<N>(), one call per strategy
+    - Token: {eth_token_address}
+    """
+    return targets, values, calldatas, formatted_description
 
 def create_proposal_parameters(treasury_address: str, strategy_address: str, eth_token_address: str) -> tuple[list[str], list[int], list[bytes], str]:
     """
     Create the parameters needed for Governor.propose()
     """
-    # Encode the call to Treasury.execute()
-    treasury_call_data = encode_treasury_execute_call(
+    # One Treasury.execute() call with no ETH attached, running Strategy 1 with 1 ETH worth of tokens
+    targets, values, calldatas = encode_proposal_actions(
+        treasury_address,
         strategy_address,
-        eth_token_address,
-        Web3.to_wei(1, 'ether')
+        [(1, eth_token_address, Web3.to_wei(1, 'ether'))]
     )
     
-    # Proposal parameters
-    targets = [treasury_address]  # Call the Treasury contract
-    values = [0]  # No ETH to send
-    calldatas = [treasury_call_data]  # Encoded function call
-    
     # Format description with actual values
     formatted_description = """
     # Execute Strategy 1 (Aave-like Protocol)
@@ -0,0 +1,89 @@
+"""
+Governance index vote-window states against the Governor's timestamp clock.
+"""
+
+import asyncio
+import time
+
+from web3 import AsyncHTTPProvider, AsyncWeb3
+
+from src.services import indexer
+from src.services.indexer import (
+    PROPOSAL_ACTIVE,
+    PROPOSAL_PENDING,
+    PROPOSAL_SUCCEEDED,
+    GovernanceIndexer,
+    GovernanceIndexStore
+)
+
+CHAIN = "ethereum"
+GOVERNANCE_ADDRESS = "0x000000000000000000000000000000000000dEaD"
+HEAD_BLOCK = 8_000_000
+QUORUM = 100
+
+class FakeBatchReader:
+    """Answers every quorum() call with the same quorum and records the timepoints asked for"""
+
+    timepoints = []
+
+    def __init__(self, w3):
+        pass
+
+    async def call(self, calls, block_number=None):
+        FakeBatchReader.timepoints.extend(call.args[0] for call in calls)
+        return [QUORUM] * len(calls), None
+
+def proposal_created(proposal_id: int, vote_start: int, vote_end: int, log_index: int):
+    return {
+        "event": "ProposalCreated",
+        "args": {
+            "proposalId": proposal_id,
+            "proposer": GOVERNANCE_ADDRESS,
+            "targets": [GOVERNANCE_ADDRESS],
+            "values": [0],
+            "signatures": [""],
+            "calldatas": [b""],
+            "voteStart": vote_start,
+            "voteEnd": vote_end,
+            "description": f"Proposal {proposal_id}"
+        },
+        "block_number": HEAD_BLOCK - 1000,
+        "block_hash": "0x" + "00" * 32,
+        "tx_hash": "0x" + f"{proposal_id:064x}",
+        "log_index": log_index
+    }
+
+def vote_cast(proposal_id: int, weight: int):
+    return {
+        "event": "VoteCast",
+        "args": {"voter": GOVERNANCE_ADDRESS, "proposalId": proposal_id, "support": 1, "weight": weight, "reason": ""},
+        "block_number": HEAD_BLOCK - 500,
+        "block_hash": "0x" + "00" * 32,
+        "tx_hash": "0x" + f"{proposal_id + 100:064x}",
+        "log_index": 0
+    }
+
+def test_vote_windows_follow_head_timestamp(monkeypatch):
+    """voteStart and voteEnd are Unix seconds, so a block number head never opens or closes a vote"""
+    monkeypatch.setattr(indexer, "AsyncBatchReader", FakeBatchReader)
+    monkeypatch.setattr(FakeBatchReader, "timepoints", [])
+    now = int(time.time())
+    store = GovernanceIndexStore(":memory:")
+    store.write_events(CHAIN, GOVERNANCE_ADDRESS, [
+        # Vote ended an hour ago and passed
+        proposal_created(1, now - 7200, now - 3600, 0),
+        vote_cast(1, QUORUM),
+        # Vote open until tomorrow
+        proposal_created(2, now - 60, now + 86400, 1),
+        # Vote opens tomorrow
+        proposal_created(3, now + 86400, now + 2 * 86400, 2)
+    ], HEAD_BLOCK)
+
+    governance = GovernanceIndexer(CHAIN, AsyncWeb3(AsyncHTTPProvider("http://127.0.0.1:1")), store, GOVERNANCE_ADDRESS, confirmations=0)
+    governance.head_timestamp = now
+    asyncio.run(governance._after_sync(HEAD_BLOCK))
+
+    states = {proposal_id: store.get_proposal(CHAIN, proposal_id)["state"] for proposal_id in ("1", "2", "3")}
+    assert states == {"1": PROPOSAL_SUCCEEDED, "2": PROPOSAL_ACTIVE, "3": PROPOSAL_PENDING}
+    # Quorums are read at each snapshot timestamp, only for snapshots that have passed
+    assert sorted(FakeBatchReader.timepoints) == [now - 7200, now - 60]
@@ -90,6 +90,7 @@ const CastVote = ({ proposalStatus, proposalId }: CastVoteProps) => {
         console.log("3 minutes elapsed - Executing proposal creation...");
         const result = await executeProposalCreation({
           chainId: walletClient.chain.id as AvailableChainId,
+          proposalId,
         });
         console.log({ result });
       }, 3 * 60 * 1000);
@@ -166,46 +166,77 @@ const paramMapper: Record<AvailableChainId, string> = {
   5003: "mantle",
 };
 
+const API_URL = "http://localhost:8000";
+
+// Milliseconds between polls of a background job
+const JOB_POLL_INTERVAL = 2000;
+
+interface JobResponse {
+  job_id: string;
+  status: "queued" | "running" | "completed" | "failed";
+  progress: string | null;
+  result: Record<string, any> | null;
+  error: string | null;
+}
+
+// /propose and /execute answer 202 with a job; poll it until it finishes and return its result
+async function waitForJob(job: JobResponse): Promise<Record<string, any>> {
+  while (job.status === "queued" || job.status === "running") {
+    await new Promise((resolve) => setTimeout(resolve, JOB_POLL_INTERVAL));
+    const res = await fetch(`${API_URL}/jobs/${job.job_id}`);
+    if (!res.ok) {
+      throw new Error(`Failed to poll job ${job.job_id}: ${res.status}`);
+    }
+    job = await res.json();
+  }
+
+  if (job.status === "failed" || !job.result) {
+    throw new Error(job.error || `Job ${job.job_id} failed`);
+  }
+  return job.result;
+}
+
+async function submitJob(path: string): Promise<Record<string, any>> {
+  const res = await fetch(`${API_URL}${path}`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+    },
+  });
+  const data = await res.json();
+  if (!res.ok) {
+    throw new Error(data.detail || `Request failed: ${res.status}`);
+  }
+  return waitForJob(data);
+}
+
 export async function submitProposalCreation({
   chainId,
 }: {
   chainId: AvailableChainId;
 }) {
   try {
-    const res = await fetch(
-      `http://localhost:8000/propose?chain=${paramMapper[chainId]}`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-      }
-    );
-    const data = await res.json();
-
-    return data;
+    return await submitJob(`/propose?chain=${paramMapper[chainId]}`);
   } catch (error) {
     console.error("Error creating proposal:", error);
+    // Surface the job's error to the request form
+    throw error;
   }
 }
 
 export async function executeProposalCreation({
   chainId,
+  proposalId,
 }: {
   chainId: AvailableChainId;
+  proposalId?: string;
 }) {
+  // The backend executes the exact actions of the indexed proposal when it knows its ID
+  const proposalParam = proposalId ? `&proposal_id=${proposalId}` : "";
   try {
-    const res = await fetch(
-      `http://localhost:8000/execute?chain=${paramMapper[chainId]}`,
-      {
-        method: "POST",
-        headers: {
-          "Content-Type": "application/json",
-        },
-      }
+    return await submitJob(
+      `/execute?chain=${paramMapper[chainId]}${proposalParam}`
     );
-    const data = await res.json();
-    return data;
   } catch (error) {
     console.error("Error executing proposal:", error);
   }